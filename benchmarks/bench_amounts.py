@@ -0,0 +1,32 @@
+import argparse
+import time
+
+from benchmarks.synthetic import format_amount
+from pdf2csv.parsers.standard_chartered.classifier import parse_amount
+
+
+def parse_float(token: str) -> float:
+    return float(token.replace(",", ""))
+
+
+def run_parser(parse, tokens: list[str]) -> float:
+    start = time.perf_counter()
+    for token in tokens:
+        parse(token)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tokens = [format_amount(index * 7919 % 100_000_000) for index in range(args.tokens)]
+    for name, parse in [("float", parse_float), ("decimal", parse_amount)]:
+        elapsed = min(run_parser(parse, tokens) for _ in range(args.repeat))
+        print(f"{name}: {len(tokens) / elapsed:,.0f} tokens/s ({elapsed:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
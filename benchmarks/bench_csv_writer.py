@@ -0,0 +1,70 @@
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable
+
+from benchmarks.synthetic import SyntheticStatement, generate_rows
+from pdf2csv.model import Statement, Transaction
+from pdf2csv.pdf_extractor import parse_pdf
+from pdf2csv.sinks import CsvPartitionSink
+
+
+def write_dataclass_csv(statements: list[Statement], output_file: str):
+    from dataclass_csv import DataclassWriter
+
+    with open(output_file, "w", newline="") as f:
+        for statement in statements:
+            DataclassWriter(f, statement.transactions, Transaction).write()
+
+
+def write_sink(compression: str) -> Callable[[list[Statement], str], None]:
+    def write(statements: list[Statement], output_file: str):
+        with CsvPartitionSink(output_file, compression=compression) as sink:
+            sink.write_statements(statements)
+
+    return write
+
+
+WRITERS = {
+    "dataclass_csv": (write_dataclass_csv, ".csv"),
+    "sink": (write_sink("none"), ".csv"),
+    "sink gzip": (write_sink("gzip"), ".csv.gz"),
+    "sink zstd": (write_sink("zstd"), ".csv.zst"),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    config = SyntheticStatement(
+        pages=1, rows_per_page=args.rows, accounts=1, continuation_lines=0
+    )
+    statements = parse_pdf(generate_rows(config), "standard_chartered")
+    transaction_count = sum(len(statement.transactions) for statement in statements)
+    with tempfile.TemporaryDirectory() as output_dir:
+        for name, (write, suffix) in WRITERS.items():
+            output_file = os.path.join(output_dir, f"transactions{suffix}")
+            try:
+                timings = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    write(statements, output_file)
+                    timings.append(time.perf_counter() - start)
+            except ImportError as ex:
+                print(f"{name}: skipped ({ex})")
+                continue
+
+            elapsed = min(timings)
+            size = os.path.getsize(output_file) / 1024 / 1024
+            print(
+                f"{name}: {transaction_count / elapsed:,.0f} rows/s "
+                f"({elapsed:.3f}s, {size:,.1f} MiB)"
+            )
+
+
+if __name__ == "__main__":
+    main()
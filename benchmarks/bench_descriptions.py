@@ -0,0 +1,31 @@
+import argparse
+
+from benchmarks.bench_engine import run_parser
+from benchmarks.synthetic import SyntheticStatement, generate_rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--lines", type=int, nargs="+", default=[1, 50, 200, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for continuation_lines in args.lines:
+        config = SyntheticStatement(
+            pages=1,
+            rows_per_page=args.rows,
+            accounts=1,
+            currencies=("USD",),
+            continuation_lines=continuation_lines,
+        )
+        rows = [row.split(" ") for row in generate_rows(config)]
+        elapsed = min(run_parser(rows) for _ in range(args.repeat))
+        print(
+            f"{continuation_lines} continuation lines: "
+            f"{len(rows) / elapsed:,.0f} rows/s ({elapsed:.3f}s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import argparse
+import time
+
+from benchmarks.synthetic import SyntheticStatement, generate_rows
+from pdf2csv.parsers.registry import ParserSession
+from pdf2csv.parsers.standard_chartered.table import create_parser
+
+
+def run_parser(rows: list[list[str]]) -> float:
+    session = ParserSession("standard_chartered", create_parser())
+    start = time.perf_counter()
+    for row in rows:
+        session.feed(row)
+        session.pop_statements()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    config = SyntheticStatement(pages=1, rows_per_page=args.rows, accounts=4)
+    rows = [row.split(" ") for row in generate_rows(config)]
+    elapsed = min(run_parser(rows) for _ in range(args.repeat))
+    print(f"table: {len(rows) / elapsed:,.0f} rows/s ({elapsed:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
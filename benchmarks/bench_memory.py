@@ -0,0 +1,32 @@
+import argparse
+import tracemalloc
+
+from benchmarks.synthetic import SyntheticStatement, generate_rows
+from pdf2csv.pdf_extractor import parse_pdf
+
+
+def measure_statements(config: SyntheticStatement) -> tuple[int, int]:
+    rows = list(generate_rows(config))
+
+    tracemalloc.start()
+    statements = parse_pdf(rows, "standard_chartered")
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return size, sum(len(statement.transactions) for statement in statements)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    config = SyntheticStatement(pages=1, rows_per_page=args.rows, accounts=1)
+    size, transaction_count = measure_statements(config)
+    print(f"transactions: {transaction_count:,}")
+    print(f"retained: {size / 1024 / 1024:,.1f} MiB")
+    print(f"per transaction: {size / transaction_count:,.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
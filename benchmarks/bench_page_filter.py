@@ -0,0 +1,33 @@
+import argparse
+import time
+
+from benchmarks.pdf_builder import render_pdf
+from benchmarks.synthetic import SyntheticStatement, generate_pages
+from pdf2csv.parsers.registry import registry
+from pdf2csv.pdf_extractor import extract_pdf_rows
+
+
+def run_extract(pdf: bytes, page_filter) -> float:
+    start = time.perf_counter()
+    for _ in extract_pdf_rows(pdf, page_filter=page_filter):
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--boilerplate-pages", type=int, default=10)
+    args = parser.parse_args()
+
+    config = SyntheticStatement(
+        pages=args.pages, boilerplate_pages=args.boilerplate_pages
+    )
+    pdf = render_pdf(generate_pages(config))
+    page_filter = registry.get_page_filter("standard_chartered")
+    for name, current_filter in [("all pages", None), ("page filter", page_filter)]:
+        print(f"{name}: {run_extract(pdf, current_filter):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import argparse
+import time
+
+from benchmarks.synthetic import SyntheticStatement, generate_rows
+from pdf2csv.parsers.registry import registry
+from pdf2csv.parsers.standard_chartered.classifier import classify_row
+
+
+def run_state_machine(rows: list[list[str]]) -> float:
+    session = registry.create_session("standard_chartered")
+    start = time.perf_counter()
+    for row in rows:
+        session.feed(row)
+        session.pop_statements()
+    return time.perf_counter() - start
+
+
+def run_classifier(rows: list[list[str]]) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        classify_row(row)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    config = SyntheticStatement(pages=1, rows_per_page=args.rows, accounts=4)
+    rows = [row.split(" ") for row in generate_rows(config)]
+    for name, run in [
+        ("classifier", run_classifier),
+        ("state machine", run_state_machine),
+    ]:
+        elapsed = min(run(rows) for _ in range(args.repeat))
+        print(f"{name}: {len(rows) / elapsed:,.0f} rows/s ({elapsed:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
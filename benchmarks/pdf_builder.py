@@ -0,0 +1,50 @@
+FONT = (
+    b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier"
+    b" /Encoding << /Type /Encoding /BaseEncoding /WinAnsiEncoding"
+    b" /Differences [128 /minus] >> >>"
+)
+PAGE_TEMPLATE = (
+    "<< /Type /Page /Parent {parent} 0 R /MediaBox [0 0 595 842]"
+    " /Resources << /Font << /F1 {font} 0 R >> >> /Contents {content} 0 R >>"
+)
+
+
+def escape_text(line: str) -> str:
+    line = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return line.replace("−", "\\200")
+
+
+def render_page_content(lines: list[str], font_size: int = 9) -> bytes:
+    text = "\n".join(f"({escape_text(line)}) Tj T*" for line in lines)
+    stream = f"BT /F1 {font_size} Tf {font_size + 2} TL 36 806 Td\n{text}\nET"
+    return stream.encode("latin-1")
+
+
+def render_pdf(pages: list[list[str]]) -> bytes:
+    objects = [b"", b"", FONT]
+    kids = []
+    for lines in pages:
+        stream = render_page_content(lines)
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+        page = PAGE_TEMPLATE.format(parent=2, font=3, content=len(objects))
+        objects.append(page.encode())
+        kids.append(f"{len(objects)} 0 R")
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+    objects[1] = objects[1].encode()
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        pdf += b"%010d 00000 n \n" % offset
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+    pdf += b"startxref\n%d\n%%%%EOF\n" % xref_offset
+    return bytes(pdf)
@@ -0,0 +1,140 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.pdf_builder import render_pdf
+from benchmarks.synthetic import SyntheticStatement, generate_pages, generate_rows
+from pdf2csv.parsers.registry import registry
+from pdf2csv.pdf_extractor import extract_pdf_rows, iter_statements
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baselines.json")
+HIGHER_IS_BETTER = {
+    "state_machine_rows_per_sec": True,
+    "extract_pages_per_sec": True,
+    "parse_peak_rss_mb": False,
+}
+
+
+def bench_state_machine(row_count: int) -> float:
+    config = SyntheticStatement(pages=1, rows_per_page=row_count, accounts=4)
+    rows = [row.split(" ") for row in generate_rows(config)]
+    session = registry.create_session("standard_chartered")
+
+    start = time.perf_counter()
+    for row in rows:
+        session.feed(row)
+        session.pop_statements()
+    return len(rows) / (time.perf_counter() - start)
+
+
+def bench_extract(page_count: int) -> float:
+    pages = generate_pages(SyntheticStatement(pages=page_count))
+    pdf = render_pdf(pages)
+
+    start = time.perf_counter()
+    for _ in extract_pdf_rows(pdf):
+        pass
+    return len(pages) / (time.perf_counter() - start)
+
+
+def get_peak_rss_mb() -> float:
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss / 1024 / 1024 if sys.platform == "darwin" else peak_rss / 1024
+
+
+def rss_worker(input_file: str, output_dir: str):
+    from pdf2csv.console.application import write_statements
+    from pdf2csv.sinks import open_sink
+
+    output_file = os.path.join(output_dir, "{account_id}_{ccy}_{statement_date}.csv")
+    rows = extract_pdf_rows(input_file)
+    with open_sink(output_file) as sink:
+        write_statements(sink, iter_statements(rows, "standard_chartered"))
+    print(get_peak_rss_mb())
+
+
+def measure_parse_peak_rss(page_count: int) -> float:
+    pdf = render_pdf(generate_pages(SyntheticStatement(pages=page_count)))
+    with tempfile.TemporaryDirectory() as directory:
+        input_file = os.path.join(directory, "statement.pdf")
+        with open(input_file, "wb") as f:
+            f.write(pdf)
+
+        result = subprocess.run(
+            [sys.executable, "-m", "benchmarks.run", "--rss-worker", input_file],
+            capture_output=True,
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+            text=True,
+        )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def find_regressions(
+    results: dict[str, float], baseline: dict[str, float], max_regression: float
+) -> list[str]:
+    regressions = []
+    for name, value in results.items():
+        if name not in baseline:
+            continue
+
+        ratio = value / baseline[name]
+        if HIGHER_IS_BETTER[name] and ratio < 1 - max_regression:
+            regressions.append(
+                f"{name}: {value:,.1f} vs baseline {baseline[name]:,.1f}"
+            )
+        if not HIGHER_IS_BETTER[name] and ratio > 1 + max_regression:
+            regressions.append(
+                f"{name}: {value:,.1f} vs baseline {baseline[name]:,.1f}"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--rss-pages", type=int, default=200)
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    parser.add_argument("--rss-worker", nargs=1)
+    args = parser.parse_args()
+
+    if args.rss_worker:
+        with tempfile.TemporaryDirectory() as output_dir:
+            rss_worker(args.rss_worker[0], output_dir)
+        return
+
+    results = {
+        "state_machine_rows_per_sec": bench_state_machine(args.rows),
+        "extract_pages_per_sec": bench_extract(args.pages),
+        "parse_peak_rss_mb": measure_parse_peak_rss(args.rss_pages),
+    }
+    for name, value in results.items():
+        print(f"{name}: {value:,.1f}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        return
+
+    if not os.path.exists(args.baseline):
+        return
+
+    with open(args.baseline) as f:
+        regressions = find_regressions(results, json.load(f), args.max_regression)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
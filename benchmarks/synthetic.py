@@ -0,0 +1,105 @@
+import random
+from dataclasses import dataclass
+from typing import Iterator
+
+from benchmarks.pdf_builder import render_pdf
+
+STATEMENT_DATE = "17 Aug 2020"
+HEADER = "Date  Description  Deposit  Withdrawal  Balance"
+DESCRIPTIONS = [
+    "SCB ATM QR WDL 0108 0913",
+    "INTERNET BANKING TRANSFER",
+    "TRANSFER WITHDRAWAL NTRF",
+    "FPS PAYMENT TO JOHN DOE",
+    "INTEREST CREDIT",
+]
+BOILERPLATE = [
+    "Terms and conditions for deposit accounts and banking services",
+    "Please examine this statement promptly and report any discrepancy",
+    "Interest rates are subject to change without prior notice",
+    "Visit our branches or call our hotline for product information",
+]
+CONTINUATIONS = [
+    "REF 0108 0913 PAYROLL",
+    "REMITTANCE ADVICE 2020081700012345",
+    "BENEFICIARY JOHN DOE HSBC HK",
+]
+
+
+@dataclass
+class SyntheticStatement:
+    pages: int = 10
+    rows_per_page: int = 50
+    accounts: int = 2
+    currencies: tuple[str, ...] = ("USD", "HKD")
+    continuation_lines: int = 1
+    boilerplate_pages: int = 0
+    seed: int = 0
+
+    @property
+    def row_count(self) -> int:
+        return self.pages * self.rows_per_page
+
+
+def format_amount(cents: int) -> str:
+    return f"{cents / 100:,.2f}"
+
+
+def generate_table(
+    rng: random.Random, transaction_count: int, continuation_lines: int
+) -> Iterator[str]:
+    balance = rng.randrange(100_000, 10_000_000)
+    yield f"17 Jul BALANCE FROM PREVIOUS STATEMENT {format_amount(balance)}"
+    for index in range(transaction_count):
+        amount = rng.randrange(100, 100_000)
+        prefix = f"{18 + index % 13} Jul " if index % 3 == 0 else ""
+        description = f"{prefix}{rng.choice(DESCRIPTIONS)}"
+        if amount >= balance or rng.random() < 0.5:
+            balance += amount
+            yield f"{description} {format_amount(amount)}   {format_amount(balance)}"
+        else:
+            balance -= amount
+            yield f"{description}   {format_amount(amount)} {format_amount(balance)}"
+        for line in range(continuation_lines):
+            yield CONTINUATIONS[(index + line) % len(CONTINUATIONS)]
+    yield f"17 Aug CLOSING BALANCE {format_amount(balance)}"
+
+
+def generate_rows(config: SyntheticStatement) -> Iterator[str]:
+    rng = random.Random(config.seed)
+    tables = config.accounts * len(config.currencies)
+    header_rows = 1 + 3 * config.accounts + 3 * tables
+    rows_per_transaction = 1 + config.continuation_lines
+    transactions_per_table = max(
+        1, (config.row_count - header_rows) // tables // rows_per_transaction
+    )
+
+    yield f"Statement Date : {STATEMENT_DATE}"
+    for account in range(config.accounts):
+        yield f"Account {account}  : 123−4−{account:06d}−1"
+        yield "John Doe"
+        yield HEADER
+        for ccy in config.currencies:
+            yield ccy
+            yield from generate_table(
+                rng, transactions_per_table, config.continuation_lines
+            )
+
+
+def generate_boilerplate_page(rows_per_page: int) -> list[str]:
+    return [BOILERPLATE[index % len(BOILERPLATE)] for index in range(rows_per_page)]
+
+
+def generate_pages(config: SyntheticStatement) -> list[list[str]]:
+    rows = list(generate_rows(config))
+    pages = [
+        rows[first_row : first_row + config.rows_per_page]  # noqa: E203
+        for first_row in range(0, len(rows), config.rows_per_page)
+    ]
+    for _ in range(config.boilerplate_pages):
+        pages.append(generate_boilerplate_page(config.rows_per_page))
+    return pages
+
+
+def generate_pdf(config: SyntheticStatement) -> bytes:
+    return render_pdf(generate_pages(config))
@@ -0,0 +1,119 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import AsyncIterator, Awaitable, Iterator, Optional
+
+from pdf2csv.model import Statement, Transaction
+from pdf2csv.parsers.registry import registry
+from pdf2csv.pdf_extractor import (
+    count_pages,
+    extract_page_rows,
+    extract_pdf_rows,
+    get_page_chunks,
+    parse_pdf,
+    tokenize,
+)
+from pdf2csv.sources import PdfSource, SharedSource, to_shared_source
+
+
+def parse_source(source: SharedSource, document_type: str) -> list[Statement]:
+    return parse_pdf(extract_pdf_rows(source), document_type)
+
+
+def prefetch(extractions: Iterator[Awaitable]) -> Optional[asyncio.Future]:
+    extraction = next(extractions, None)
+    return None if extraction is None else asyncio.ensure_future(extraction)
+
+
+class AsyncPdfParser:
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ):
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_concurrency)
+        return self._executor
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def run(self, func, *args):
+        async with self.semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+
+    async def parse(
+        self, source: PdfSource, document_type: str = "standard_chartered"
+    ) -> list[Statement]:
+        return await self.run(parse_source, to_shared_source(source), document_type)
+
+    async def iter_transactions(
+        self, source: PdfSource, document_type: str = "standard_chartered"
+    ) -> AsyncIterator[Transaction]:
+        session = registry.create_session(document_type)
+        source = to_shared_source(source)
+        page_count = await self.run(count_pages, source)
+        page_chunks = get_page_chunks(page_count, self.max_concurrency)
+
+        extractions = (
+            self.run(extract_page_rows, source, page_numbers)
+            for page_numbers in page_chunks
+        )
+        next_pages = prefetch(extractions)
+        try:
+            while next_pages is not None:
+                pages = next_pages
+                next_pages = prefetch(extractions)
+
+                for page_rows in await pages:
+                    for row in page_rows:
+                        session.feed(tokenize(row))
+                        for transaction in session.pop_transactions():
+                            yield transaction
+        finally:
+            if next_pages is not None:
+                next_pages.cancel()
+
+    def close(self):
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def __aenter__(self) -> "AsyncPdfParser":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+_default_parser: Optional[AsyncPdfParser] = None
+
+
+def get_default_parser() -> AsyncPdfParser:
+    global _default_parser
+    if _default_parser is None:
+        _default_parser = AsyncPdfParser()
+    return _default_parser
+
+
+async def parse_pdf_async(
+    source: PdfSource, document_type: str = "standard_chartered"
+) -> list[Statement]:
+    return await get_default_parser().parse(source, document_type)
+
+
+def iter_transactions_async(
+    source: PdfSource, document_type: str = "standard_chartered"
+) -> AsyncIterator[Transaction]:
+    return get_default_parser().iter_transactions(source, document_type)
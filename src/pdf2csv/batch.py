@@ -0,0 +1,107 @@
+import glob
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from itertools import chain, islice
+from typing import Iterable, Iterator, Optional
+
+from pdf2csv.model import Statement
+from pdf2csv.detect import resolve_pages
+from pdf2csv.pdf_extractor import extract_pdf_pages, parse_pdf
+
+GLOB_CHARS = set("*?[")
+PENDING_PER_WORKER = 2
+
+
+@dataclass
+class BatchResult:
+    input_file: str
+    statements: list[Statement] = field(default_factory=list)
+    error: Optional[str] = None
+    document_type: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def is_pdf_file(path: str) -> bool:
+    return os.path.isfile(path) and path.lower().endswith(".pdf")
+
+
+def find_input_files(inputs: Iterable[str]) -> list[str]:
+    input_files = []
+    for input_path in inputs:
+        if os.path.isdir(input_path):
+            input_path = os.path.join(glob.escape(input_path), "**", "*.[pP][dD][fF]")
+        if GLOB_CHARS.intersection(input_path):
+            candidates = [
+                path
+                for path in glob.glob(input_path, recursive=True)
+                if is_pdf_file(path)
+            ]
+        else:
+            candidates = [input_path]
+        input_files.extend(sorted(candidates))
+
+    return list(dict.fromkeys(input_files))
+
+
+def process_file(input_file: str, document_type: str) -> BatchResult:
+    try:
+        pages = extract_pdf_pages(input_file)
+        document_type, pages = resolve_pages(pages, document_type)
+        statements = parse_pdf(chain.from_iterable(pages), document_type)
+    except Exception as ex:
+        return BatchResult(input_file, error=f"{type(ex).__name__}: {ex}")
+    return BatchResult(input_file, statements, document_type=document_type)
+
+
+def submit_files(
+    executor: Executor,
+    input_files: Iterator[str],
+    document_type: str,
+    futures: dict[Future, str],
+    count: int,
+):
+    for input_file in islice(input_files, count):
+        futures[executor.submit(process_file, input_file, document_type)] = input_file
+
+
+def get_result(future: Future, input_file: str) -> BatchResult:
+    try:
+        return future.result()
+    except Exception as ex:
+        return BatchResult(input_file, error=f"{type(ex).__name__}: {ex}")
+
+
+def batch_parse(
+    input_files: Iterable[str], document_type: str, workers: Optional[int] = None
+) -> Iterator[BatchResult]:
+    if workers == 1:
+        for input_file in input_files:
+            yield process_file(input_file, document_type)
+        return
+
+    max_pending = PENDING_PER_WORKER * (workers or os.cpu_count() or 1)
+    input_files = iter(input_files)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: dict[Future, str] = {}
+        submit_files(executor, input_files, document_type, futures, max_pending)
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield get_result(future, futures.pop(future))
+            submit_files(
+                executor,
+                input_files,
+                document_type,
+                futures,
+                max_pending - len(futures),
+            )
@@ -0,0 +1,125 @@
+import gzip
+import hashlib
+import json
+import os
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+from pdf2csv.sources import PdfSource, is_buffer, open_stream
+
+CACHE_DIR_ENV = "PDF2CSV_CACHE_DIR"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pdf2csv")
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+CACHE_FORMAT_VERSION = 1
+ENTRY_SUFFIX = ".json.gz"
+READ_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass
+class CacheStats:
+    directory: str
+    entries: int
+    size: int
+    max_size: int
+
+
+def hash_source(source: PdfSource) -> str:
+    content_hash = hashlib.sha256()
+    if is_buffer(source):
+        content_hash.update(source)
+        return content_hash.hexdigest()
+
+    with open_stream(source) as stream:
+        position = stream.tell()
+        for block in iter(lambda: stream.read(READ_BLOCK_SIZE), b""):
+            content_hash.update(block)
+        stream.seek(position)
+    return content_hash.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_pdfplumber_version() -> str:
+    from importlib.metadata import version
+
+    return version("pdfplumber")
+
+
+class PageCache:
+    def __init__(
+        self, directory: Optional[str] = None, max_size: int = DEFAULT_MAX_SIZE
+    ):
+        self.directory = directory or os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR)
+        self.max_size = max_size
+
+    def get_key(self, source: PdfSource, settings: dict) -> str:
+        key_source = json.dumps(
+            {
+                "content": hash_source(source),
+                "pdfplumber": get_pdfplumber_version(),
+                "settings": settings,
+                "format": CACHE_FORMAT_VERSION,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(key_source.encode()).hexdigest()
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{ENTRY_SUFFIX}")
+
+    def get(self, key: str) -> Optional[list[list[str]]]:
+        path = self.get_path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                pages = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        os.utime(path)
+        return pages
+
+    def set(self, key: str, pages: list[list[str]]):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.get_path(key)
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+            json.dump(pages, f)
+        os.replace(temp_path, path)
+        self.evict()
+
+    def list_entries(self) -> list[os.DirEntry]:
+        if not os.path.isdir(self.directory):
+            return []
+        return [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.is_file() and entry.name.endswith(ENTRY_SUFFIX)
+        ]
+
+    def evict(self) -> int:
+        entries = sorted(self.list_entries(), key=lambda entry: entry.stat().st_mtime)
+        size = sum(entry.stat().st_size for entry in entries)
+        evicted = 0
+        for entry in entries:
+            if size <= self.max_size:
+                break
+            size -= entry.stat().st_size
+            os.remove(entry.path)
+            evicted += 1
+        return evicted
+
+    def clear(self) -> int:
+        entries = self.list_entries()
+        for entry in entries:
+            os.remove(entry.path)
+        return len(entries)
+
+    def stats(self) -> CacheStats:
+        entries = self.list_entries()
+        return CacheStats(
+            directory=self.directory,
+            entries=len(entries),
+            size=sum(entry.stat().st_size for entry in entries),
+            max_size=self.max_size,
+        )
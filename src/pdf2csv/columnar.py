@@ -0,0 +1,128 @@
+from decimal import Decimal
+from types import ModuleType
+from typing import BinaryIO, Iterable, Optional, Union
+
+from pdf2csv.model import Statement, Transaction
+
+COLUMNAR_FORMATS = ("parquet", "arrow")
+DEFAULT_ROW_GROUP_SIZE = 65536
+AMOUNT_PRECISION = 18
+AMOUNT_SCALE = 2
+DICTIONARY_COLUMNS = ("account_id", "account_name", "ccy")
+AMOUNT_COLUMNS = ("deposit", "withdrawal", "balance")
+
+Amount = Union[Decimal, float, int, None]
+
+
+def import_pyarrow() -> ModuleType:
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "Columnar export requires pyarrow, install pdf_to_csv[arrow]"
+        ) from None
+    return pyarrow
+
+
+def get_schema(pa: ModuleType):
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    amount = pa.decimal128(AMOUNT_PRECISION, AMOUNT_SCALE)
+    return pa.schema(
+        [
+            ("transaction_date", pa.date32()),
+            ("statement_date", pa.date32()),
+            ("account_id", dictionary),
+            ("account_name", dictionary),
+            ("ccy", dictionary),
+            ("description", pa.string()),
+            ("deposit", amount),
+            ("withdrawal", amount),
+            ("balance", amount),
+        ]
+    )
+
+
+def to_decimal(amount: Amount) -> Optional[Decimal]:
+    if amount is None or isinstance(amount, Decimal):
+        return amount
+    return Decimal(f"{amount:.{AMOUNT_SCALE}f}")
+
+
+def to_record_batch(pa: ModuleType, schema, transactions: list[Transaction]):
+    arrays = []
+    for field in schema:
+        values = [getattr(transaction, field.name) for transaction in transactions]
+        if field.name in AMOUNT_COLUMNS:
+            values = [to_decimal(value) for value in values]
+        if field.name in DICTIONARY_COLUMNS:
+            arrays.append(pa.array(values, pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class TransactionTableWriter:
+    def __init__(
+        self,
+        output_file: Union[str, BinaryIO],
+        file_format: str = "parquet",
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ):
+        if file_format not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unknown columnar format: {file_format}")
+
+        self._pa = import_pyarrow()
+        self.schema = get_schema(self._pa)
+        self.output_file = output_file
+        self.file_format = file_format
+        self.row_group_size = row_group_size
+        self.rows_written = 0
+        self._pending: list[Transaction] = []
+        if file_format == "parquet":
+            self._writer = self._pa.parquet.ParquetWriter(output_file, self.schema)
+        else:
+            self._writer = self._pa.ipc.new_stream(output_file, self.schema)
+
+    def write_transactions(self, transactions: Iterable[Transaction]):
+        for transaction in transactions:
+            self._pending.append(transaction)
+            if len(self._pending) >= self.row_group_size:
+                self.flush()
+
+    def write_statement(self, statement: Statement):
+        self.write_transactions(statement.transactions)
+
+    def write_statements(self, statements: Iterable[Statement]):
+        for statement in statements:
+            self.write_statement(statement)
+
+    def flush(self):
+        if not self._pending:
+            return
+
+        batch = to_record_batch(self._pa, self.schema, self._pending)
+        if self.file_format == "parquet":
+            self._writer.write_batch(batch, row_group_size=self.row_group_size)
+        else:
+            self._writer.write_batch(batch)
+        self.rows_written += len(self._pending)
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        self._writer.close()
+
+    def __enter__(self) -> "TransactionTableWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_transactions(input_file: str, file_format: str = "parquet"):
+    pa = import_pyarrow()
+    if file_format == "parquet":
+        return pa.parquet.read_table(input_file)
+    return pa.ipc.open_stream(pa.memory_map(input_file)).read_all()
@@ -1,39 +1,428 @@
+import dataclasses
+import os
+import sys
+from itertools import chain
+from typing import Iterable, List, Optional
+
 import typer
-from pdf_to_csv.model import Transaction
-from pdf_to_csv.version import __version__
-from pdf_to_csv.pdf_extractor import extract_pdf_rows, parse_pdf, format_table
-from dataclass_csv import DataclassWriter
+from pdf2csv.cache import PageCache
+from pdf2csv import sinks
+from pdf2csv.columnar import DEFAULT_ROW_GROUP_SIZE
+from pdf2csv.manifest import (
+    DEFAULT_MANIFEST_FILE,
+    Manifest,
+    PendingFile,
+    find_output_owners,
+    find_pending_files,
+    remove_stale_outputs,
+)
+from pdf2csv.model import Statement
+from pdf2csv.page_filter import PageFilter, parse_page_numbers
+from pdf2csv.profiling import Profiler, profile_stage
+from pdf2csv.parsers.registry import AUTO_DOCUMENT_TYPE, registry
+from pdf2csv.pipeline import DEFAULT_QUEUE_SIZE, run_pipeline
+from pdf2csv.sinks import (
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_OUTPUT_FILE,
+    STDOUT,
+    CsvPartitionSink,
+    Sink,
+    open_sink,
+)
+from pdf2csv.sources import PdfSource
+from pdf2csv.version import __version__
 
 app = typer.Typer()
+cache_app = typer.Typer()
+app.add_typer(cache_app, name="cache")
 
+PROFILE_FORMATS = {"json": Profiler.to_json, "prometheus": Profiler.to_prometheus}
+SYNC_OUTPUT_FIELDS = ("{account_id}", "{ccy}", "{statement_date}")
+SKIP_PAGES_HELP = (
+    "Skip pages whose raw text matches none of the parser's patterns. Text is "
+    "only read from simple fonts; pages using hex strings, composite, Type3 or "
+    "ToUnicode fonts, or images are always kept. Requires an explicit "
+    "--file-format."
+)
 
-@app.command()
-def display(input_file: str, file_format: str = "standard_chartered"):
-    statements = parse_pdf(extract_pdf_rows(input_file), file_format)
 
+def get_cache(cache: bool, cache_dir: Optional[str]) -> Optional[PageCache]:
+    return PageCache(cache_dir) if cache else None
+
+
+def get_source(input_file: str) -> PdfSource:
+    return sys.stdin.buffer.read() if input_file == "-" else input_file
+
+
+def get_page_filter(
+    file_format: str, skip_pages: bool, pages: Optional[str]
+) -> Optional[PageFilter]:
+    if skip_pages and file_format == AUTO_DOCUMENT_TYPE:
+        raise typer.BadParameter(
+            "--skip-pages requires an explicit --file-format",
+            param_hint="--skip-pages",
+        )
+
+    page_filter = None
+    if skip_pages:
+        page_filter = registry.get_page_filter(file_format)
+    if pages is None:
+        return page_filter
+    return dataclasses.replace(
+        page_filter or PageFilter(), page_numbers=parse_page_numbers(pages)
+    )
+
+
+def get_profiler(profile: bool, profile_format: str) -> Optional[Profiler]:
+    if profile_format not in PROFILE_FORMATS:
+        raise typer.BadParameter(
+            f"Unknown profile format: {profile_format}", param_hint="--profile-format"
+        )
+    return Profiler() if profile else None
+
+
+def report_profile(
+    profiler: Optional[Profiler], profile_output: Optional[str], profile_format: str
+):
+    if profiler is None:
+        return
+
+    typer.echo(profiler.format_summary(), err=True)
+    if profile_output is not None:
+        with open(profile_output, "w") as f:
+            f.write(PROFILE_FORMATS[profile_format](profiler))
+
+
+def get_output_file(
+    output_file: Optional[str], one_per_account: bool, output_format: str = "csv"
+) -> str:
+    try:
+        return sinks.get_output_file(output_file, one_per_account, output_format)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--output-file") from None
+
+
+def get_sink(
+    output_file: str,
+    output_format: str = "csv",
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: Optional[str] = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> Sink:
+    try:
+        return open_sink(
+            output_file, output_format, row_group_size, compression, buffer_size
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from None
+
+
+def write_statements(
+    sink: Sink, statements: Iterable[Statement], profiler: Optional[Profiler] = None
+):
     for statement in statements:
+        with profile_stage(profiler, "write"):
+            sink.write_statement(statement)
+
+
+@app.command()
+def display(
+    input_file: str,
+    file_format: str = "standard_chartered",
+    page_workers: int = 1,
+    cache: bool = False,
+    cache_dir: Optional[str] = None,
+    words: bool = False,
+    skip_pages: bool = typer.Option(False, help=SKIP_PAGES_HELP),
+    pages: Optional[str] = None,
+    profile: bool = False,
+    profile_output: Optional[str] = None,
+    profile_format: str = "json",
+):
+    profiler = get_profiler(profile, profile_format)
+    source = get_source(input_file)
+    cache = get_cache(cache, cache_dir)
+    page_filter = get_page_filter(file_format, skip_pages, pages)
+    from pdf2csv.detect import resolve_pages
+    from pdf2csv.pdf_extractor import extract_pdf_pages, format_table, iter_statements
+
+    pages = extract_pdf_pages(source, page_workers, cache, words, profiler, page_filter)
+    document_type, pages = resolve_pages(pages, file_format)
+    rows = chain.from_iterable(pages)
+    for statement in iter_statements(rows, document_type, profiler):
         typer.echo(f"Account name : {statement.account_name}")
         typer.echo(f"Account Number: {statement.account_id}")
-        typer.echo(format_table(statement.transactions))
+        with profile_stage(profiler, "format"):
+            table = format_table(statement.transactions)
+        typer.echo(table)
         typer.echo("")
         typer.echo("")
 
+    report_profile(profiler, profile_output, profile_format)
+
 
 @app.command()
 def extract(
     input_file: str,
-    output_file: str = "./{account_id}_{ccy}_{statement_date}.csv",
+    output_file: Optional[str] = None,
     file_format: str = "standard_chartered",
     one_per_account: bool = False,
+    page_workers: int = 1,
+    cache: bool = False,
+    cache_dir: Optional[str] = None,
+    words: bool = False,
+    skip_pages: bool = typer.Option(False, help=SKIP_PAGES_HELP),
+    pages: Optional[str] = None,
+    profile: bool = False,
+    profile_output: Optional[str] = None,
+    profile_format: str = "json",
+    output_format: str = "csv",
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    pipeline: bool = False,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    compression: Optional[str] = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
 ):
 
-    statements = parse_pdf(extract_pdf_rows(input_file), file_format)
-    for statement in statements:
-        output_path = output_file.format(**statement.__dict__)
-        with open(output_path, "w") as f:
+    profiler = get_profiler(profile, profile_format)
+    output_file = get_output_file(output_file, one_per_account, output_format)
+    source = get_source(input_file)
+    cache = get_cache(cache, cache_dir)
+    page_filter = get_page_filter(file_format, skip_pages, pages)
+    from pdf2csv.detect import resolve_pages
+    from pdf2csv.pdf_extractor import extract_pdf_pages, iter_statements
+
+    pages = extract_pdf_pages(source, page_workers, cache, words, profiler, page_filter)
+    document_type, pages = resolve_pages(pages, file_format)
+    with get_sink(
+        output_file, output_format, row_group_size, compression, buffer_size
+    ) as sink:
+        if pipeline:
+            run_pipeline(
+                pages, document_type, sink.write_statement, queue_size, profiler
+            )
+        else:
+            rows = chain.from_iterable(pages)
+            statements = iter_statements(rows, document_type, profiler)
+            write_statements(sink, statements, profiler)
+    report_profile(profiler, profile_output, profile_format)
+
+
+@app.command()
+def batch(
+    inputs: List[str],
+    output_file: Optional[str] = None,
+    file_format: str = "standard_chartered",
+    one_per_account: bool = False,
+    workers: Optional[int] = None,
+    output_format: str = "csv",
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: Optional[str] = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+):
+    from pdf2csv.batch import batch_parse, find_input_files
+
+    output_file = get_output_file(output_file, one_per_account, output_format)
+    progress_err = output_file == STDOUT
+    input_files = find_input_files(inputs)
+    failed = 0
+    with get_sink(
+        output_file, output_format, row_group_size, compression, buffer_size
+    ) as sink:
+        for result in batch_parse(input_files, file_format, workers):
+            if not result.ok:
+                failed += 1
+                typer.echo(f"{result.input_file}: {result.error}", err=True)
+                continue
+
+            sink.write_statements(result.statements)
+            typer.echo(
+                f"{result.input_file}: {len(result.statements)} statement(s)",
+                err=progress_err,
+            )
+
+    typer.echo(
+        f"Processed {len(input_files)} file(s), {failed} failed", err=progress_err
+    )
+    if failed:
+        raise typer.Exit(code=1)
+
+
+def get_statement_outputs(
+    sink: CsvPartitionSink, statements: list[Statement]
+) -> list[str]:
+    return list(
+        dict.fromkeys(
+            os.path.abspath(sink.get_path(statement)) for statement in statements
+        )
+    )
+
+
+def report_errors(errors: dict[str, str]):
+    for input_file, error in errors.items():
+        typer.echo(f"{input_file}: {error}", err=True)
+
+
+def parse_output_owners(
+    manifest: Manifest,
+    pending_files: dict[str, PendingFile],
+    errors: dict[str, str],
+    sink: CsvPartitionSink,
+    document_type: str,
+    parser_version: str,
+    workers: Optional[int],
+) -> dict[str, list[Statement]]:
+    from pdf2csv.batch import batch_parse
+
+    parsed = {}
+    input_files = list(pending_files)
+    while input_files:
+        for result in batch_parse(input_files, document_type, workers):
+            if result.ok:
+                parsed[result.input_file] = result.statements
+            else:
+                errors[result.input_file] = result.error
+                typer.echo(f"{result.input_file}: {result.error}", err=True)
+
+        outputs = set()
+        for pending in pending_files.values():
+            outputs.update(pending.previous_outputs)
+        for statements in parsed.values():
+            outputs.update(get_statement_outputs(sink, statements))
+        owners, owner_errors = find_output_owners(
+            manifest,
+            outputs,
+            chain(pending_files, errors),
+            document_type,
+            parser_version,
+        )
+        report_errors(owner_errors)
+        errors.update(owner_errors)
+        pending_files.update((pending.path, pending) for pending in owners)
+        input_files = [pending.path for pending in owners]
+    return parsed
+
+
+def record_outputs(
+    manifest: Manifest,
+    pending_files: dict[str, PendingFile],
+    outputs: dict[str, list[str]],
+    errors: dict[str, str],
+    document_type: str,
+    parser_version: str,
+):
+    previous_outputs = chain.from_iterable(
+        pending_files[input_file].previous_outputs for input_file in outputs
+    )
+    kept_outputs = list(chain.from_iterable(outputs.values()))
+    for input_file in errors:
+        entry = manifest.get(input_file)
+        if entry is not None:
+            kept_outputs.extend(entry.outputs)
+
+    remove_stale_outputs(previous_outputs, kept_outputs)
+    for input_file, input_outputs in outputs.items():
+        manifest.record(
+            pending_files[input_file], document_type, parser_version, input_outputs
+        )
+
+
+@app.command()
+def sync(
+    inputs: List[str],
+    manifest_file: str = DEFAULT_MANIFEST_FILE,
+    output_file: str = DEFAULT_OUTPUT_FILE,
+    file_format: str = "standard_chartered",
+    workers: Optional[int] = None,
+    force: bool = False,
+):
+    if not all(field in output_file for field in SYNC_OUTPUT_FIELDS):
+        raise typer.BadParameter(
+            f"Output file must contain {', '.join(SYNC_OUTPUT_FIELDS)}",
+            param_hint="--output-file",
+        )
+    if file_format not in registry:
+        raise typer.BadParameter(
+            f"Unknown document type: {file_format}", param_hint="--file-format"
+        )
+
+    from pdf2csv.batch import find_input_files
+
+    parser_version = registry.get_version(file_format)
+    input_files = find_input_files(inputs)
+    with Manifest(manifest_file) as manifest:
+        changed_files, errors = find_pending_files(
+            manifest, input_files, file_format, parser_version, force
+        )
+        report_errors(errors)
+        pending_files = {pending.path: pending for pending in changed_files}
+
+        with CsvPartitionSink(output_file) as sink:
+            parsed = parse_output_owners(
+                manifest,
+                pending_files,
+                errors,
+                sink,
+                file_format,
+                parser_version,
+                workers,
+            )
+            outputs = {}
+            for input_file, statements in parsed.items():
+                sink.write_statements(statements)
+                outputs[input_file] = get_statement_outputs(sink, statements)
+                typer.echo(f"{input_file}: {len(statements)} statement(s)")
+
+        record_outputs(
+            manifest, pending_files, outputs, errors, file_format, parser_version
+        )
+
+    checked_files = {os.path.abspath(path) for path in chain(pending_files, errors)}
+    skipped = len({os.path.abspath(path) for path in input_files} - checked_files)
+    typer.echo(
+        f"Processed {len(pending_files)} file(s), skipped {skipped} unchanged, "
+        f"{len(errors)} failed"
+    )
+    if errors:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    unix_socket: Optional[str] = None,
+    workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    max_body_size: Optional[int] = None,
+):
+    from pdf2csv.server import ParseService, create_server
+
+    service = ParseService(workers, max_pending, max_body_size=max_body_size)
+    server = create_server(service, host, port, unix_socket)
+    address = unix_socket or f"http://{host}:{server.server_address[1]}"
+    typer.echo(f"Serving on {address} with {service.workers} worker(s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+@cache_app.command("clear")
+def cache_clear(cache_dir: Optional[str] = None):
+    removed = PageCache(cache_dir).clear()
+    typer.echo(f"Removed {removed} cache entries")
+
 
-            w = DataclassWriter(f, statement.transactions, Transaction)
-            w.write()
+@cache_app.command("stats")
+def cache_stats(cache_dir: Optional[str] = None):
+    stats = PageCache(cache_dir).stats()
+    typer.echo(f"Directory: {stats.directory}")
+    typer.echo(f"Entries: {stats.entries}")
+    typer.echo(f"Size: {stats.size} / {stats.max_size} bytes")
 
 
 @app.command()
@@ -0,0 +1,32 @@
+from itertools import chain, islice
+from typing import Iterable, Iterator
+
+from pdf2csv.parsers.registry import AUTO_DOCUMENT_TYPE, ParserRegistry, registry
+from pdf2csv.pdf_extractor import tokenize
+
+DETECT_PAGE_COUNT = 2
+
+
+def detect_document_type(
+    rows: Iterable[list[str]], parsers: ParserRegistry = registry
+) -> str:
+    rows = [tokenize(row) for row in rows]
+    for document_type in parsers.document_types:
+        fingerprint = parsers.get_fingerprint(document_type)
+        if fingerprint is not None and fingerprint(rows):
+            return document_type
+    raise ValueError("Unable to detect document type")
+
+
+def resolve_pages(
+    pages: Iterable[list[str]],
+    document_type: str,
+    parsers: ParserRegistry = registry,
+) -> tuple[str, Iterator[list[str]]]:
+    pages = iter(pages)
+    if document_type != AUTO_DOCUMENT_TYPE:
+        return document_type, pages
+
+    first_pages = list(islice(pages, DETECT_PAGE_COUNT))
+    rows = chain.from_iterable(first_pages)
+    return detect_document_type(rows, parsers), chain(first_pages, pages)
@@ -0,0 +1,181 @@
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from pdf2csv.cache import hash_source
+
+DEFAULT_MANIFEST_FILE = "./.pdf2csv-manifest.sqlite"
+MANIFEST_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    document_type TEXT NOT NULL,
+    parser_version TEXT NOT NULL,
+    outputs TEXT NOT NULL,
+    processed_at REAL NOT NULL
+)
+"""
+SELECT_ENTRIES = (
+    "SELECT path, size, mtime_ns, content_hash, document_type,"
+    " parser_version, outputs, processed_at FROM files"
+)
+
+
+@dataclass
+class ManifestEntry:
+    path: str
+    size: int
+    mtime_ns: int
+    content_hash: str
+    document_type: str
+    parser_version: str
+    outputs: list[str] = field(default_factory=list)
+    processed_at: float = 0.0
+
+
+@dataclass
+class PendingFile:
+    path: str
+    size: int
+    mtime_ns: int
+    content_hash: str
+    previous_outputs: list[str] = field(default_factory=list)
+
+
+def to_entry(row: tuple) -> ManifestEntry:
+    return ManifestEntry(*row[:6], json.loads(row[6]), row[7])
+
+
+class Manifest:
+    def __init__(self, manifest_file: str = DEFAULT_MANIFEST_FILE):
+        self.manifest_file = manifest_file
+        self._connection = sqlite3.connect(manifest_file)
+        self._connection.execute(MANIFEST_SCHEMA)
+        self._connection.commit()
+
+    def get(self, path: str) -> Optional[ManifestEntry]:
+        row = self._connection.execute(
+            f"{SELECT_ENTRIES} WHERE path = ?", (os.path.abspath(path),)
+        ).fetchone()
+        if row is None:
+            return None
+        return to_entry(row)
+
+    def find_owners(self, outputs: Iterable[str]) -> list[ManifestEntry]:
+        outputs = set(outputs)
+        entries = map(to_entry, self._connection.execute(SELECT_ENTRIES))
+        return [entry for entry in entries if not outputs.isdisjoint(entry.outputs)]
+
+    def check(
+        self, path: str, document_type: str, parser_version: str, force: bool = False
+    ) -> Optional[PendingFile]:
+        stat = os.stat(path)
+        entry = self.get(path)
+        if (
+            not force
+            and entry is not None
+            and entry.document_type == document_type
+            and entry.parser_version == parser_version
+        ):
+            if (entry.size, entry.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                return None
+
+            content_hash = hash_source(path)
+            if entry.content_hash == content_hash:
+                self._update_stat(path, stat.st_size, stat.st_mtime_ns)
+                return None
+        else:
+            content_hash = hash_source(path)
+
+        previous_outputs = [] if entry is None else entry.outputs
+        return PendingFile(
+            path, stat.st_size, stat.st_mtime_ns, content_hash, previous_outputs
+        )
+
+    def record(
+        self,
+        pending: PendingFile,
+        document_type: str,
+        parser_version: str,
+        outputs: Iterable[str],
+    ):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                os.path.abspath(pending.path),
+                pending.size,
+                pending.mtime_ns,
+                pending.content_hash,
+                document_type,
+                parser_version,
+                json.dumps(list(outputs)),
+                time.time(),
+            ),
+        )
+        self._connection.commit()
+
+    def _update_stat(self, path: str, size: int, mtime_ns: int):
+        self._connection.execute(
+            "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?",
+            (size, mtime_ns, os.path.abspath(path)),
+        )
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self) -> "Manifest":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def find_pending_files(
+    manifest: Manifest,
+    input_files: Iterable[str],
+    document_type: str,
+    parser_version: str,
+    force: bool = False,
+) -> tuple[list[PendingFile], dict[str, str]]:
+    pending_files = []
+    errors = {}
+    for input_file in input_files:
+        try:
+            pending = manifest.check(input_file, document_type, parser_version, force)
+        except OSError as ex:
+            errors[input_file] = f"{type(ex).__name__}: {ex}"
+            continue
+        if pending is not None:
+            pending_files.append(pending)
+    return pending_files, errors
+
+
+def find_output_owners(
+    manifest: Manifest,
+    outputs: Iterable[str],
+    known_files: Iterable[str],
+    document_type: str,
+    parser_version: str,
+) -> tuple[list[PendingFile], dict[str, str]]:
+    known_files = {os.path.abspath(path) for path in known_files}
+    owners = [
+        entry.path
+        for entry in manifest.find_owners(outputs)
+        if entry.path not in known_files
+    ]
+    return find_pending_files(
+        manifest, owners, document_type, parser_version, force=True
+    )
+
+
+def remove_stale_outputs(previous_outputs: Iterable[str], outputs: Iterable[str]):
+    outputs = set(outputs)
+    for path in previous_outputs:
+        if path not in outputs and os.path.exists(path):
+            os.remove(path)
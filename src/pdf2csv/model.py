@@ -1,19 +1,44 @@
-import decimal
 from dataclasses import dataclass, field
 from datetime import date
+from decimal import Decimal
+from typing import Iterable, Optional
+
+
+class Row(list):
+    def __init__(
+        self,
+        tokens: Iterable[str] = (),
+        x0: Optional[list[float]] = None,
+        x1: Optional[list[float]] = None,
+    ):
+        super().__init__(tokens)
+        self.x0 = [] if x0 is None else x0
+        self.x1 = [] if x1 is None else x1
 
 
 @dataclass
 class Transaction:
+    __slots__ = (
+        "transaction_date",
+        "statement_date",
+        "account_id",
+        "account_name",
+        "ccy",
+        "description",
+        "deposit",
+        "withdrawal",
+        "balance",
+    )
+
     transaction_date: date
     statement_date: date
     account_id: str
     account_name: str
     ccy: str
     description: str
-    deposit: decimal
-    withdrawal: decimal
-    balance: decimal
+    deposit: Decimal
+    withdrawal: Decimal
+    balance: Decimal
 
 
 @dataclass
@@ -28,9 +53,9 @@ class Statement:
         self,
         transaction_date: date,
         description: str,
-        deposit: decimal,
-        withdrawal: decimal,
-        balance: decimal,
+        deposit: Decimal,
+        withdrawal: Decimal,
+        balance: Decimal,
     ):
 
         record = Transaction(
@@ -0,0 +1,89 @@
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import pdfplumber
+
+LITERAL_STRING_REGEX = re.compile(rb"\(((?:[^()\\]|\\.)*)\)", re.DOTALL)
+HEX_STRING_REGEX = re.compile(rb"<[0-9A-Fa-f\s]+>")
+XOBJECT_REGEX = re.compile(rb"\bDo\b")
+ESCAPE_REGEX = re.compile(rb"\\([0-7]{1,3}|\r\n|.)", re.DOTALL)
+ESCAPES = {
+    b"n": b"\n",
+    b"r": b"\r",
+    b"t": b"\t",
+    b"b": b"\b",
+    b"f": b"\f",
+    b"\r\n": b"",
+    b"\r": b"",
+    b"\n": b"",
+}
+CONTROL_REGEX = re.compile(rb"[\x00-\x08\x0b\x0e-\x1f\x7f]")
+SIMPLE_FONT_SUBTYPES = {"Type1", "MMType1", "TrueType"}
+
+
+def read_page_content(page: "pdfplumber.page.Page") -> bytes:
+    from pdfminer.pdftypes import resolve1
+
+    contents = page.page_obj.contents or []
+    streams = [resolve1(stream) for stream in contents]
+    return b"".join(stream.get_data() for stream in streams if stream is not None)
+
+
+def unescape_escape(match: re.Match) -> bytes:
+    escape = match.group(1)
+    if escape[0] in b"01234567":
+        return bytes([int(escape, 8) & 0xFF])
+    return ESCAPES.get(escape, escape)
+
+
+def unescape_literal(literal: bytes) -> bytes:
+    return ESCAPE_REGEX.sub(unescape_escape, literal)
+
+
+def has_simple_fonts(page: "pdfplumber.page.Page") -> bool:
+    from pdfminer.pdftypes import resolve1
+
+    resources = resolve1(page.page_obj.resources) or {}
+    fonts = resolve1(resources.get("Font")) or {}
+    for font in map(resolve1, fonts.values()):
+        subtype = getattr(resolve1(font.get("Subtype")), "name", None)
+        if subtype not in SIMPLE_FONT_SUBTYPES or "ToUnicode" in font:
+            return False
+    return True
+
+
+def read_page_text(page: "pdfplumber.page.Page") -> Optional[str]:
+    content = read_page_content(page)
+    operators = LITERAL_STRING_REGEX.sub(b"", content)
+    if HEX_STRING_REGEX.search(operators) or XOBJECT_REGEX.search(operators):
+        return None
+
+    text = b"".join(map(unescape_literal, LITERAL_STRING_REGEX.findall(content)))
+    if CONTROL_REGEX.search(text) or not has_simple_fonts(page):
+        return None
+    return "".join(text.decode("latin-1").split())
+
+
+def parse_page_numbers(pages: str) -> frozenset[int]:
+    page_numbers = set()
+    for page_range in pages.split(","):
+        first, _, last = page_range.strip().partition("-")
+        page_numbers.update(range(int(first), int(last or first) + 1))
+    return frozenset(page_numbers)
+
+
+@dataclass(frozen=True)
+class PageFilter:
+    patterns: tuple[str, ...] = ()
+    page_numbers: Optional[frozenset[int]] = None
+
+    def __call__(self, page: "pdfplumber.page.Page") -> bool:
+        if self.page_numbers is not None and page.page_number not in self.page_numbers:
+            return False
+        if not self.patterns:
+            return True
+
+        text = read_page_text(page)
+        return text is None or any(re.search(p, text) for p in self.patterns)
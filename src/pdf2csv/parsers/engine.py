@@ -0,0 +1,83 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Optional
+
+from pdf2csv.model import Statement
+
+Action = Callable[[Any, list[str]], None]
+Classifier = Callable[[Any, list[str]], Hashable]
+
+
+class ParserContext:
+    __slots__ = ("statements", "current_statement")
+
+    def __init__(self):
+        self.statements: list[Statement] = []
+        self.current_statement: Optional[Statement] = None
+
+
+@dataclass(frozen=True)
+class Transition:
+    action: Optional[Action] = None
+    target: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class StateTable:
+    classify: Optional[Classifier] = None
+    transitions: dict[Hashable, Transition] = field(default_factory=dict)
+    default: Transition = Transition()
+
+
+TransitionTable = dict[str, StateTable]
+
+
+def validate_table(table: TransitionTable, initial_state: str):
+    states = {initial_state}
+    for state_table in table.values():
+        transitions = [*state_table.transitions.values(), state_table.default]
+        states.update(t.target for t in transitions if t.target is not None)
+        if state_table.transitions and state_table.classify is None:
+            raise ValueError("State with keyed transitions requires a classifier")
+
+    missing = states.difference(table)
+    if missing:
+        raise ValueError(f"Unknown states: {', '.join(sorted(missing))}")
+
+
+class Engine:
+    def __init__(
+        self, table: TransitionTable, initial_state: str, context: ParserContext
+    ):
+        validate_table(table, initial_state)
+        self.table = table
+        self.context = context
+        self.state_name = initial_state
+        self._state_table = table[initial_state]
+
+    @property
+    def statements(self) -> list[Statement]:
+        return self.context.statements
+
+    @property
+    def current_statement(self) -> Optional[Statement]:
+        return self.context.current_statement
+
+    def __call__(self, row: list[str]) -> "Engine":
+        state_table = self._state_table
+        context = self.context
+        if state_table.classify is None:
+            transition = state_table.default
+        else:
+            transition = state_table.transitions.get(
+                state_table.classify(context, row), state_table.default
+            )
+
+        if transition.action is not None:
+            transition.action(context, row)
+        if transition.target is not None:
+            self.state_name = transition.target
+            self._state_table = self.table[transition.target]
+        return self
+
+    def __str__(self) -> str:
+        return f"State => {self.state_name}"
@@ -0,0 +1,167 @@
+import threading
+import warnings
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from pdf2csv.model import Statement, Transaction
+from pdf2csv.page_filter import PageFilter
+from pdf2csv.parsers import standard_chartered
+from pdf2csv.parsers.engine import Engine
+
+Parser = Engine
+ParserFactory = Callable[[], Parser]
+Fingerprint = Callable[[list[list[str]]], bool]
+
+DEFAULT_PARSER_VERSION = "1"
+ENTRY_POINT_GROUP = "pdf2csv.parsers"
+AUTO_DOCUMENT_TYPE = "auto"
+
+
+class ParserSession:
+    def __init__(self, document_type: str, state: Parser):
+        self.document_type = document_type
+        self._state = state
+
+    @property
+    def state(self) -> Parser:
+        return self._state
+
+    @property
+    def state_name(self) -> str:
+        return getattr(self._state, "state_name", type(self._state).__name__)
+
+    @property
+    def current_statement(self) -> Optional[Statement]:
+        return self._state.current_statement
+
+    def feed(self, row: list[str]):
+        self._state = self._state(row)
+
+    def pop_statements(self) -> list[Statement]:
+        statements = self._state.statements
+        if not statements:
+            return []
+
+        closed_statements = statements.copy()
+        statements.clear()
+        return closed_statements
+
+    def pop_transactions(self) -> list[Transaction]:
+        transactions = []
+        for statement in self.pop_statements():
+            transactions.extend(statement.transactions)
+            statement.transactions.clear()
+
+        current_statement = self.current_statement
+        if current_statement is not None and current_statement.transactions:
+            transactions.extend(current_statement.transactions)
+            current_statement.transactions.clear()
+        return transactions
+
+
+@dataclass(frozen=True)
+class ParserSpec:
+    factory: ParserFactory
+    version: str = DEFAULT_PARSER_VERSION
+    page_filter: Optional[PageFilter] = None
+    fingerprint: Optional[Fingerprint] = None
+
+
+def get_entry_points(group: str) -> list:
+    from importlib.metadata import entry_points
+
+    discovered = entry_points()
+    if hasattr(discovered, "select"):
+        return list(discovered.select(group=group))
+    return list(discovered.get(group, []))
+
+
+class ParserRegistry:
+    def __init__(self, entry_point_group: Optional[str] = ENTRY_POINT_GROUP):
+        self._parsers: dict[str, ParserSpec] = {}
+        self._lock = threading.RLock()
+        self._entry_point_group = entry_point_group
+        self._plugins_loaded = entry_point_group is None
+        self.plugin_errors: dict[str, str] = {}
+
+    def register(
+        self,
+        document_type: str,
+        factory: ParserFactory,
+        version: str = DEFAULT_PARSER_VERSION,
+        page_filter: Optional[PageFilter] = None,
+        fingerprint: Optional[Fingerprint] = None,
+    ):
+        spec = ParserSpec(factory, version, page_filter, fingerprint)
+        with self._lock:
+            self._parsers = {**self._parsers, document_type: spec}
+
+    def unregister(self, document_type: str):
+        with self._lock:
+            parsers = self._parsers.copy()
+            parsers.pop(document_type, None)
+            self._parsers = parsers
+
+    def load_plugins(self):
+        if self._plugins_loaded:
+            return
+
+        with self._lock:
+            if self._plugins_loaded:
+                return
+
+            for entry_point in get_entry_points(self._entry_point_group):
+                if entry_point.name not in self._parsers:
+                    self._load_plugin(entry_point)
+            self._plugins_loaded = True
+
+    def _load_plugin(self, entry_point):
+        try:
+            entry_point.load()(self)
+        except Exception as ex:
+            error = f"{type(ex).__name__}: {ex}"
+            self.plugin_errors[entry_point.name] = error
+            warnings.warn(
+                f"Failed to load parser plugin {entry_point.name}: {error}",
+                RuntimeWarning,
+            )
+
+    @property
+    def document_types(self) -> list[str]:
+        self.load_plugins()
+        return list(self._parsers)
+
+    def get_spec(self, document_type: str) -> ParserSpec:
+        spec = self._parsers.get(document_type)
+        if spec is None:
+            self.load_plugins()
+            spec = self._parsers.get(document_type)
+        if spec is None:
+            raise KeyError(f"Unknown document type: {document_type}")
+        return spec
+
+    def __contains__(self, document_type: str) -> bool:
+        try:
+            self.get_spec(document_type)
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, document_type: str) -> ParserFactory:
+        return self.get_spec(document_type).factory
+
+    def get_version(self, document_type: str) -> str:
+        return self.get_spec(document_type).version
+
+    def get_page_filter(self, document_type: str) -> Optional[PageFilter]:
+        return self.get_spec(document_type).page_filter
+
+    def get_fingerprint(self, document_type: str) -> Optional[Fingerprint]:
+        return self.get_spec(document_type).fingerprint
+
+    def create_session(self, document_type: str) -> ParserSession:
+        return ParserSession(document_type, self[document_type]())
+
+
+registry = ParserRegistry()
+standard_chartered.register(registry)
@@ -0,0 +1,16 @@
+from pdf2csv.page_filter import PageFilter
+from pdf2csv.parsers.standard_chartered.classifier import matches_fingerprint
+from pdf2csv.parsers.standard_chartered.table import create_parser
+
+PARSER_VERSION = "1"
+PAGE_FILTER = PageFilter(("StatementDate", "Balance", "BALANCE", r"\d\.\d\d"))
+
+
+def register(registry):
+    registry.register(
+        "standard_chartered",
+        create_parser,
+        PARSER_VERSION,
+        PAGE_FILTER,
+        matches_fingerprint,
+    )
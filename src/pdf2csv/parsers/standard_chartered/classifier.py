@@ -0,0 +1,103 @@
+import re
+from calendar import month_abbr
+from decimal import Decimal
+from enum import IntEnum
+
+from pdf2csv.currencies import ISO_CODE
+from pdf2csv.model import Row
+
+ACCOUNT_NUMBER_REGEX = re.compile(r"^\d{3}−\d−\d{6}−\d")
+MONTH_INDEX = {month: index for index, month in enumerate(month_abbr) if month}
+CURRENCY_CODES = frozenset(ISO_CODE)
+OPEN_BALANCE_WORDS = ("FROM", "PREVIOUS", "STATEMENT")
+ZERO_AMOUNT = Decimal("0.00")
+HEADER_ROW = ["Date", "", "Description", "", "Deposit", "", "Withdrawal", "", "Balance"]
+HEADER_WORDS = ["Date", "Description", "Deposit", "Withdrawal", "Balance"]
+
+
+class RowKind(IntEnum):
+    CONTINUATION = 0
+    STATEMENT_DATE = 1
+    ACCOUNT = 2
+    HEADER = 3
+    CURRENCY = 4
+    OPEN_BALANCE = 5
+    CLOSING_BALANCE = 6
+    DATED_TRANSACTION = 7
+    UNDATED_TRANSACTION = 8
+
+
+TRANSACTION_KINDS = (RowKind.DATED_TRANSACTION, RowKind.UNDATED_TRANSACTION)
+FINGERPRINT_KINDS = frozenset((RowKind.STATEMENT_DATE, RowKind.ACCOUNT, RowKind.HEADER))
+
+
+def is_amount(token: str) -> bool:
+    return token.replace(",", "").replace(".", "", 1).isdigit()
+
+
+def parse_amount(token: str) -> Decimal:
+    return Decimal(token.replace(",", ""))
+
+
+def is_date_prefix(row: list[str]) -> bool:
+    return len(row) > 1 and row[0].isdigit() and row[1] in MONTH_INDEX
+
+
+def is_statement_date(row: list[str]) -> bool:
+    if len(row) < 2 or row[0] != "Statement" or row[1] != "Date" or ":" not in row:
+        return False
+
+    semi_colon_index = row.index(":")
+    date_tokens = row[semi_colon_index + 1 : semi_colon_index + 4]  # noqa: E203
+    return (
+        len(date_tokens) == 3
+        and date_tokens[0].isdigit()
+        and len(date_tokens[1]) == 3
+        and date_tokens[2].isdigit()
+    )
+
+
+def is_header(row: list[str]) -> bool:
+    if isinstance(row, Row):
+        return [word for word in row if word] == HEADER_WORDS
+    return row == HEADER_ROW
+
+
+def classify_row(row: list[str]) -> RowKind:
+    length = len(row)
+    if (
+        length > 1
+        and is_amount(row[-1])
+        and (is_amount(row[-2]) or (length > 3 and is_amount(row[-4])))
+    ):
+        if row[0].isdigit() and row[1] in MONTH_INDEX:
+            return RowKind.DATED_TRANSACTION
+        return RowKind.UNDATED_TRANSACTION
+
+    return classify_other_row(row)
+
+
+def classify_other_row(row: list[str]) -> RowKind:
+    if not row:
+        return RowKind.CONTINUATION
+
+    if "BALANCE" in row:
+        if "CLOSING" in row:
+            return RowKind.CLOSING_BALANCE
+        if all(word in row for word in OPEN_BALANCE_WORDS):
+            return RowKind.OPEN_BALANCE
+
+    first = row[0]
+    if first == "Date" and is_header(row):
+        return RowKind.HEADER
+    if ACCOUNT_NUMBER_REGEX.match(row[-1]) is not None:
+        return RowKind.ACCOUNT
+    if first in CURRENCY_CODES and all(word == "" for word in row[1:]):
+        return RowKind.CURRENCY
+    if first == "Statement" and is_statement_date(row):
+        return RowKind.STATEMENT_DATE
+    return RowKind.CONTINUATION
+
+
+def matches_fingerprint(rows: list[list[str]]) -> bool:
+    return FINGERPRINT_KINDS <= {classify_other_row(row) for row in rows}
@@ -0,0 +1,127 @@
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Optional
+
+from pdf2csv.model import Row
+from pdf2csv.parsers.standard_chartered.classifier import (
+    MONTH_INDEX,
+    OPEN_BALANCE_WORDS,
+    ZERO_AMOUNT,
+    RowKind,
+    classify_row,
+    is_amount,
+    is_date_prefix,
+    parse_amount,
+)
+
+AMOUNT_COLUMNS = ("Deposit", "Withdrawal", "Balance")
+
+Columns = dict[str, tuple[float, float]]
+
+get_calendar_date = lru_cache(maxsize=4096)(date)
+
+
+def get_statement_date(day: int, month: str, year: int) -> date:
+    momth_int = datetime.strptime(month, "%b").month
+    return date(year, momth_int, day)
+
+
+def get_transaction_date(statement_date: date, row: list[str]) -> date:
+    if not is_date_prefix(row):
+        raise Exception(f"Current row doesn't start with date. {row}")
+
+    month = MONTH_INDEX[row[1]]
+    year = statement_date.year
+    if statement_date.month < month:
+        year -= 1
+    return get_calendar_date(year, month, int(row[0]))
+
+
+def get_account_id(row: list[str]) -> str:
+    return row[-1]
+
+
+def get_account_name(row: list[str]) -> list[str]:
+    semi_colon_id = row.index(":")
+    return row[:semi_colon_id]
+
+
+def remove_white_spaces(string: str) -> str:
+    return " ".join(string.split())
+
+
+def join_description(tokens: list[str]) -> str:
+    return remove_white_spaces(" ".join(tokens))
+
+
+def is_open_balance_row(row: list[str]) -> bool:
+    return "BALANCE" in row and all(word in row for word in OPEN_BALANCE_WORDS)
+
+
+def get_columns(row: list[str]) -> Optional[Columns]:
+    if not isinstance(row, Row) or len(row.x1) != len(row):
+        return None
+
+    columns = {
+        word: (x0, x1)
+        for word, x0, x1 in zip(row, row.x0, row.x1)
+        if word in AMOUNT_COLUMNS
+    }
+    return columns if len(columns) == len(AMOUNT_COLUMNS) else None
+
+
+def is_money(token: str) -> bool:
+    return token[-3:-2] == "." and is_amount(token)
+
+
+def is_column_amount(columns: Columns, token: str, x1: float) -> bool:
+    return x1 > columns["Deposit"][0] and is_money(token)
+
+
+def split_amounts(
+    columns: Columns, row: Row
+) -> Optional[tuple[list[str], dict[str, str]]]:
+    tokens = []
+    amounts = {}
+    for token, x1 in zip(row, row.x1):
+        if not is_column_amount(columns, token, x1):
+            tokens.append(token)
+            continue
+
+        column = min(columns, key=lambda name: abs(columns[name][1] - x1))
+        if column in amounts:
+            return None
+        amounts[column] = token
+    return tokens, amounts
+
+
+def split_transaction_amounts(
+    columns: Columns, row: Row
+) -> Optional[tuple[list[str], dict[str, str]]]:
+    split = split_amounts(columns, row)
+    if split is None:
+        return None
+
+    amounts = split[1]
+    if "Balance" not in amounts or amounts.keys().isdisjoint(AMOUNT_COLUMNS[:2]):
+        return None
+    return split
+
+
+def classify_unplaced_row(columns: Columns, row: Row) -> RowKind:
+    kind = classify_row(row)
+    if kind is RowKind.CONTINUATION and any(
+        is_column_amount(columns, token, x1) for token, x1 in zip(row, row.x1)
+    ):
+        raise AttributeError(f"Unable to place amounts of row {row}")
+    return kind
+
+
+def get_amount_value(row: list[str], index: int) -> Decimal:
+    value = row[index]
+    return parse_amount(value) if is_amount(value) else ZERO_AMOUNT
+
+
+def get_amount(amounts: dict[str, str], column: str) -> Decimal:
+    return parse_amount(amounts[column]) if column in amounts else ZERO_AMOUNT
@@ -0,0 +1,265 @@
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+from pdf2csv.model import Row, Statement
+from pdf2csv.parsers.engine import Engine, ParserContext, StateTable, Transition
+from pdf2csv.parsers.standard_chartered import fields
+from pdf2csv.parsers.standard_chartered.classifier import (
+    ZERO_AMOUNT,
+    RowKind,
+    classify_row,
+    is_date_prefix,
+    parse_amount,
+)
+from pdf2csv.parsers.standard_chartered.fields import (
+    Columns,
+    classify_unplaced_row,
+    get_account_id,
+    get_account_name,
+    get_amount,
+    get_amount_value,
+    get_columns,
+    get_statement_date,
+    join_description,
+    split_transaction_amounts,
+)
+
+INITIAL_STATE = "StateStart"
+POSITIONED_TRANSACTION = "positioned_transaction"
+
+
+class StatementContext(ParserContext):
+    __slots__ = (
+        "statement_date",
+        "account_id",
+        "account_name_tokens",
+        "account_name",
+        "columns",
+        "current_row_date",
+        "row_tokens",
+        "row_amounts",
+        "has_pending",
+        "pending_date",
+        "pending_description",
+        "pending_continuation",
+        "pending_deposit",
+        "pending_withdrawal",
+        "pending_balance",
+    )
+
+    def __init__(self):
+        super().__init__()
+        self.statement_date: Optional[date] = None
+        self.account_id: Optional[str] = None
+        self.account_name_tokens: list[str] = []
+        self.account_name: Optional[str] = None
+        self.columns: Optional[Columns] = None
+        self.current_row_date = date.min
+        self.row_tokens: list[str] = []
+        self.row_amounts: dict[str, str] = {}
+        self.has_pending = False
+        self.pending_date = date.min
+        self.pending_description = ""
+        self.pending_continuation: list[str] = []
+        self.pending_deposit = ZERO_AMOUNT
+        self.pending_withdrawal = ZERO_AMOUNT
+        self.pending_balance = ZERO_AMOUNT
+
+
+def classify_kind(context: StatementContext, row: list[str]) -> RowKind:
+    return classify_row(row)
+
+
+def is_open_balance_row(context: StatementContext, row: list[str]) -> bool:
+    return fields.is_open_balance_row(row)
+
+
+def classify_table_row(context: StatementContext, row: list[str]):
+    if context.columns is None or len(getattr(row, "x1", ())) != len(row):
+        return classify_row(row)
+
+    split = split_transaction_amounts(context.columns, row)
+    if split is None:
+        return classify_unplaced_row(context.columns, row)
+
+    context.row_tokens, context.row_amounts = split
+    return POSITIONED_TRANSACTION
+
+
+def get_date(context: StatementContext, row: list[str]) -> date:
+    return fields.get_transaction_date(context.current_statement.statement_date, row)
+
+
+def set_statement_date(context: StatementContext, row: list[str]):
+    index = row.index(":")
+    context.statement_date = get_statement_date(
+        int(row[index + 1]), row[index + 2], int(row[index + 3])
+    )
+
+
+def set_account(context: StatementContext, row: list[str]):
+    context.account_id = get_account_id(row)
+    context.account_name_tokens = get_account_name(row)
+
+
+def set_account_name(context: StatementContext, row: list[str]):
+    context.account_name = " ".join(context.account_name_tokens + row)
+
+
+def set_columns(context: StatementContext, row: list[str]):
+    context.columns = get_columns(row)
+
+
+def open_statement(context: StatementContext, row: list[str]):
+    context.current_statement = Statement(
+        statement_date=context.statement_date,
+        account_id=context.account_id,
+        account_name=context.account_name,
+        ccy=row[0],
+    )
+    context.current_row_date = date.min
+    context.has_pending = False
+
+
+def set_open_balance_date(context: StatementContext, row: list[str]):
+    context.current_row_date = get_date(context, row)
+
+
+def reject_open_balance(context: StatementContext, row: list[str]):
+    raise AttributeError(f"Expected open Balance Row. got {row}")
+
+
+def commit_pending(context: StatementContext):
+    if not context.has_pending:
+        return
+
+    description = context.pending_description
+    if context.pending_continuation:
+        continuation = context.pending_continuation
+        description = join_description([description, *continuation])
+        continuation.clear()
+
+    context.current_statement.add_transaction_row(
+        transaction_date=context.pending_date,
+        description=description,
+        deposit=context.pending_deposit,
+        withdrawal=context.pending_withdrawal,
+        balance=context.pending_balance,
+    )
+    context.has_pending = False
+
+
+def hold_transaction(
+    context: StatementContext,
+    description: str,
+    deposit: Decimal,
+    withdrawal: Decimal,
+    balance: Decimal,
+):
+    commit_pending(context)
+    context.has_pending = True
+    context.pending_date = context.current_row_date
+    context.pending_description = description
+    context.pending_deposit = deposit
+    context.pending_withdrawal = withdrawal
+    context.pending_balance = balance
+
+
+def hold_text_transaction(context: StatementContext, row: list[str], start: int):
+    hold_transaction(
+        context,
+        join_description(row[start:-4]),
+        get_amount_value(row, -4),
+        get_amount_value(row, -2),
+        parse_amount(row[-1]),
+    )
+
+
+def hold_dated_transaction(context: StatementContext, row: list[str]):
+    context.current_row_date = get_date(context, row)
+    hold_text_transaction(context, row, 2)
+
+
+def hold_undated_transaction(context: StatementContext, row: list[str]):
+    hold_text_transaction(context, row, 0)
+
+
+def hold_positioned_transaction(context: StatementContext, row: Row):
+    tokens = context.row_tokens
+    if len(tokens) >= 2 and is_date_prefix(tokens):
+        context.current_row_date = get_date(context, tokens)
+        tokens = tokens[2:]
+
+    amounts = context.row_amounts
+    hold_transaction(
+        context,
+        join_description(tokens),
+        get_amount(amounts, "Deposit"),
+        get_amount(amounts, "Withdrawal"),
+        get_amount(amounts, "Balance"),
+    )
+
+
+def append_description(context: StatementContext, row: list[str]):
+    if not context.has_pending:
+        raise AttributeError(f"Expected transaction row. got {row}")
+
+    context.pending_continuation.extend(row)
+
+
+def close_statement(context: StatementContext, row: list[str]):
+    commit_pending(context)
+    context.statements.append(context.current_statement)
+    context.current_statement = None
+
+
+TRANSITION_TABLE = {
+    "StateStart": StateTable(
+        classify_kind,
+        {
+            RowKind.STATEMENT_DATE: Transition(
+                set_statement_date, "StateLookAccountNumber"
+            )
+        },
+    ),
+    "StateLookAccountNumber": StateTable(
+        classify_kind,
+        {RowKind.ACCOUNT: Transition(set_account, "StateReadAccountName")},
+    ),
+    "StateReadAccountName": StateTable(
+        default=Transition(set_account_name, "StateSearchTableHeader")
+    ),
+    "StateSearchTableHeader": StateTable(
+        classify_kind,
+        {RowKind.HEADER: Transition(set_columns, "StateSearchCcyOrAccountNumber")},
+    ),
+    "StateSearchCcyOrAccountNumber": StateTable(
+        classify_kind,
+        {
+            RowKind.CURRENCY: Transition(open_statement, "StateOpenBalance"),
+            RowKind.ACCOUNT: Transition(set_account, "StateReadAccountName"),
+        },
+    ),
+    "StateOpenBalance": StateTable(
+        is_open_balance_row,
+        {True: Transition(set_open_balance_date, "StateProcessTable")},
+        Transition(reject_open_balance),
+    ),
+    "StateProcessTable": StateTable(
+        classify_table_row,
+        {
+            POSITIONED_TRANSACTION: Transition(hold_positioned_transaction),
+            RowKind.DATED_TRANSACTION: Transition(hold_dated_transaction),
+            RowKind.UNDATED_TRANSACTION: Transition(hold_undated_transaction),
+            RowKind.CLOSING_BALANCE: Transition(
+                close_statement, "StateSearchCcyOrAccountNumber"
+            ),
+        },
+        Transition(append_description),
+    ),
+}
+
+
+def create_parser() -> Engine:
+    return Engine(TRANSITION_TABLE, INITIAL_STATE, StatementContext())
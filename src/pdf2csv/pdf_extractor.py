@@ -1,29 +1,257 @@
 import dataclasses
-import decimal
+import math
 import pdfplumber
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
-from pdf_to_csv.model import Statement, Transaction
-from pdf_to_csv.parsers.standard_chartered.states import StateStart
+from decimal import Decimal
+from functools import partial
+from itertools import repeat
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator, Optional, Union
+from pdf2csv.cache import PageCache
+from pdf2csv.model import Row, Statement, Transaction
+from pdf2csv.page_filter import PageFilter
+from pdf2csv.parsers.registry import registry
+from pdf2csv.profiling import Profiler
+from pdf2csv.sources import PdfSource, iter_pages, open_pdf, to_shared_source
 from prettytable import PrettyTable, MARKDOWN
 
-parsers = {"standard_chartered": StateStart()}
+parsers = registry
 
+CHUNKS_PER_WORKER = 4
+TEXT_SETTINGS = {"x_tolerance": 3, "y_tolerance": 3}
+WORD_SETTINGS = {"x_tolerance": 3, "y_tolerance": 3}
 
-def extract_pdf_rows(filename: str) -> enumerate[list[str]]:
-    pdf_file = pdfplumber.open(filename)
 
-    for page in pdf_file.pages:
-        for row in page.extract_text().split("\n"):
-            yield row
+def get_page_chunks(page_count: int, workers: int) -> list[list[int]]:
+    chunk_size = max(1, math.ceil(page_count / (workers * CHUNKS_PER_WORKER)))
+    return [
+        list(range(first_page, min(first_page + chunk_size, page_count + 1)))
+        for first_page in range(1, page_count + 1, chunk_size)
+    ]
 
 
-def parse_pdf(rows: enumerate[list[str]], document_type: str) -> list[Statement]:
-    parser = parsers[document_type]
+def count_pages(source: PdfSource) -> int:
+    with open_pdf(source) as pdf_file:
+        return len(pdf_file.pages)
+
+
+def extract_text_rows(page: pdfplumber.page.Page) -> list[str]:
+    return page.extract_text(**TEXT_SETTINGS).split("\n")
+
+
+def group_lines(chars: list[dict], y_tolerance: float) -> list[list[dict]]:
+    lines = []
+    line_top = None
+    for char in sorted(chars, key=itemgetter("top", "x0")):
+        if line_top is None or char["top"] - line_top > y_tolerance:
+            lines.append([])
+            line_top = char["top"]
+        lines[-1].append(char)
+    return [sorted(line, key=itemgetter("x0")) for line in lines]
+
+
+def group_words(line: list[dict], x_tolerance: float) -> list[list[dict]]:
+    words = [[]]
+    for char in line:
+        if char["text"].isspace():
+            words.append([])
+            continue
+        if words[-1] and char["x0"] > words[-1][-1]["x1"] + x_tolerance:
+            words.append([])
+        words[-1].append(char)
+    return [word for word in words if word]
+
+
+def build_word_row(words: list[list[dict]]) -> Row:
+    row = Row()
+    previous_x1 = None
+    for word in words:
+        x0 = float(word[0]["x0"])
+        if previous_x1 is not None:
+            char_width = (float(word[0]["x1"]) - x0) or 1
+            for _ in range(round((x0 - previous_x1) / char_width) - 1):
+                row.append("")
+                row.x0.append(previous_x1)
+                row.x1.append(x0)
+        previous_x1 = float(word[-1]["x1"])
+        row.append("".join(char["text"] for char in word))
+        row.x0.append(x0)
+        row.x1.append(previous_x1)
+    return row
+
+
+def extract_word_rows(page: pdfplumber.page.Page) -> list[Row]:
+    lines = group_lines(page.chars, WORD_SETTINGS["y_tolerance"])
+    return [
+        build_word_row(group_words(line, WORD_SETTINGS["x_tolerance"]))
+        for line in lines
+    ]
+
+
+def extract_filtered_rows(
+    extract_rows: Callable[[pdfplumber.page.Page], list],
+    page_filter: PageFilter,
+    page: pdfplumber.page.Page,
+) -> list:
+    return extract_rows(page) if page_filter(page) else []
+
+
+def get_row_extractor(
+    words: bool, page_filter: Optional[PageFilter] = None
+) -> Callable[[pdfplumber.page.Page], list]:
+    extract_rows = extract_word_rows if words else extract_text_rows
+    if page_filter is None:
+        return extract_rows
+    return partial(extract_filtered_rows, extract_rows, page_filter)
+
+
+def extract_page_rows(
+    source: PdfSource,
+    page_numbers: list[int],
+    words: bool = False,
+    page_filter: Optional[PageFilter] = None,
+) -> list[list[str]]:
+    extract_rows = get_row_extractor(words, page_filter)
+    with open_pdf(source, pages=page_numbers) as pdf_file:
+        return [extract_rows(page) for page in iter_pages(pdf_file)]
+
+
+def extract_pages_parallel(
+    source: PdfSource,
+    workers: int,
+    words: bool = False,
+    page_filter: Optional[PageFilter] = None,
+) -> Iterator[list[str]]:
+    source = to_shared_source(source)
+    page_chunks = get_page_chunks(count_pages(source), workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for pages_rows in executor.map(
+            extract_page_rows,
+            repeat(source),
+            page_chunks,
+            repeat(words),
+            repeat(page_filter),
+        ):
+            yield from pages_rows
+
+
+def extract_pages(
+    source: PdfSource,
+    workers: int = 1,
+    words: bool = False,
+    page_filter: Optional[PageFilter] = None,
+) -> Iterator[list[str]]:
+    if workers > 1:
+        yield from extract_pages_parallel(source, workers, words, page_filter)
+        return
+
+    extract_rows = get_row_extractor(words, page_filter)
+    with open_pdf(source) as pdf_file:
+        for page in iter_pages(pdf_file):
+            yield extract_rows(page)
+
+
+def dump_rows(rows: list) -> list:
+    return [
+        [list(row), row.x0, row.x1] if isinstance(row, Row) else row for row in rows
+    ]
+
+
+def load_rows(rows: list) -> list:
+    return [row if isinstance(row, str) else Row(*row) for row in rows]
+
+
+def get_cache_settings(words: bool, page_filter: Optional[PageFilter]) -> dict:
+    settings = {**(WORD_SETTINGS if words else TEXT_SETTINGS), "words": words}
+    if page_filter is not None:
+        settings["page_filter"] = repr(page_filter)
+    return settings
+
+
+def extract_cached_pages(
+    source: PdfSource,
+    workers: int,
+    cache: PageCache,
+    words: bool = False,
+    page_filter: Optional[PageFilter] = None,
+) -> Iterator[list[str]]:
+    key = cache.get_key(source, get_cache_settings(words, page_filter))
+    cached_pages = cache.get(key)
+    if cached_pages is not None:
+        for page_rows in cached_pages:
+            yield load_rows(page_rows)
+        return
+
+    pages = []
+    for page_rows in extract_pages(source, workers, words, page_filter):
+        pages.append(dump_rows(page_rows))
+        yield page_rows
+    cache.set(key, pages)
+
+
+def extract_pdf_pages(
+    source: PdfSource,
+    workers: int = 1,
+    cache: Optional[PageCache] = None,
+    words: bool = False,
+    profiler: Optional[Profiler] = None,
+    page_filter: Optional[PageFilter] = None,
+) -> Iterator[list[str]]:
+    if cache is None:
+        pages = extract_pages(source, workers, words, page_filter)
+    else:
+        pages = extract_cached_pages(source, workers, cache, words, page_filter)
+    if profiler is not None:
+        pages = profiler.profile_pages(pages)
+    return pages
+
+
+def extract_pdf_rows(
+    source: PdfSource,
+    workers: int = 1,
+    cache: Optional[PageCache] = None,
+    words: bool = False,
+    profiler: Optional[Profiler] = None,
+    page_filter: Optional[PageFilter] = None,
+) -> enumerate[list[str]]:
+    pages = extract_pdf_pages(source, workers, cache, words, profiler, page_filter)
+    for page_rows in pages:
+        yield from page_rows
+
+
+def tokenize(row: Union[str, list[str]]) -> list[str]:
+    return row if isinstance(row, list) else row.split(" ")
+
+
+def iter_statements(
+    rows: Iterable[str], document_type: str, profiler: Optional[Profiler] = None
+) -> Iterator[Statement]:
+    session = parsers.create_session(document_type)
+    feed = session.feed if profiler is None else partial(profiler.feed, session)
 
     for row in rows:
-        parser = parser(row.split(" "))
+        feed(tokenize(row))
+        yield from session.pop_statements()
+
+
+def iter_transactions(
+    rows: Iterable[str], document_type: str, profiler: Optional[Profiler] = None
+) -> Iterator[Transaction]:
+    session = parsers.create_session(document_type)
+    feed = session.feed if profiler is None else partial(profiler.feed, session)
+
+    for row in rows:
+        feed(tokenize(row))
+        yield from session.pop_transactions()
+
 
-    return parser.statements
+def parse_pdf(
+    rows: enumerate[list[str]],
+    document_type: str,
+    profiler: Optional[Profiler] = None,
+) -> list[Statement]:
+    return list(iter_statements(rows, document_type, profiler))
 
 
 def format_table(transactions: list[Transaction]) -> str:
@@ -32,12 +260,12 @@ def format_table(transactions: list[Transaction]) -> str:
     table.field_names = [field.name for field in dataclasses.fields(Transaction)]
     table.align = "l"
     for transaction in transactions:
-        table.add_row(transaction.__dict__.copy().values())
+        table.add_row([getattr(transaction, name) for name in table.field_names])
 
     for col_float in [
         field.name
         for field in dataclasses.fields(Transaction)
-        if (field.type is float) | (field.type is decimal)
+        if field.type in (float, Decimal)
     ]:
         table.float_format[col_float] = "3.2"
         table.align[col_float] = "r"
@@ -0,0 +1,179 @@
+import queue
+import threading
+import time
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from pdf2csv.model import Statement
+from pdf2csv.profiling import Profiler, profile_stage
+
+DEFAULT_QUEUE_SIZE = 8
+POLL_INTERVAL = 0.1
+
+_DONE = object()
+
+
+class PipelineCancelled(Exception):
+    pass
+
+
+class StageQueue:
+    def __init__(self, name: str, maxsize: int, cancelled: threading.Event):
+        self.name = name
+        self.items = 0
+        self.max_depth = 0
+        self.put_wait = 0.0
+        self.get_wait = 0.0
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._cancelled = cancelled
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def put(self, item: Any):
+        start = time.perf_counter()
+        while True:
+            if self._cancelled.is_set():
+                raise PipelineCancelled()
+            try:
+                self._queue.put(item, timeout=POLL_INTERVAL)
+                break
+            except queue.Full:
+                continue
+        self.put_wait += time.perf_counter() - start
+        self.max_depth = max(self.max_depth, self.depth)
+        if item is not _DONE:
+            self.items += 1
+
+    def get(self) -> Any:
+        start = time.perf_counter()
+        while True:
+            if self._cancelled.is_set():
+                raise PipelineCancelled()
+            try:
+                item = self._queue.get(timeout=POLL_INTERVAL)
+                break
+            except queue.Empty:
+                continue
+        self.get_wait += time.perf_counter() - start
+        return item
+
+    def close(self):
+        self.put(_DONE)
+
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            item = self.get()
+            if item is _DONE:
+                return
+            yield item
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "items": self.items,
+            "max_depth": self.max_depth,
+            "put_wait": self.put_wait,
+            "get_wait": self.get_wait,
+        }
+
+
+class Pipeline:
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.queues: list[StageQueue] = []
+        self._cancelled = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._errors: list[BaseException] = []
+
+    def add_queue(self, name: str) -> StageQueue:
+        stage_queue = StageQueue(name, self.queue_size, self._cancelled)
+        self.queues.append(stage_queue)
+        return stage_queue
+
+    def run_stage(self, func: Callable, *args):
+        try:
+            func(*args)
+        except PipelineCancelled:
+            pass
+        except BaseException as ex:
+            self._errors.append(ex)
+            self._cancelled.set()
+
+    def start_stage(self, name: str, func: Callable, *args):
+        thread = threading.Thread(
+            target=self.run_stage, args=(func, *args), name=name, daemon=True
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def join(self):
+        for thread in self._threads:
+            thread.join()
+        if self._errors:
+            raise self._errors[0]
+
+    def cancel(self):
+        self._cancelled.set()
+        for thread in self._threads:
+            thread.join()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {stage_queue.name: stage_queue.to_dict() for stage_queue in self.queues}
+
+
+def produce_pages(pages: Iterable[list], page_queue: StageQueue):
+    pages = iter(pages)
+    try:
+        for page_rows in pages:
+            page_queue.put(page_rows)
+        page_queue.close()
+    finally:
+        if hasattr(pages, "close"):
+            pages.close()
+
+
+def parse_pages(
+    page_queue: StageQueue,
+    statement_queue: StageQueue,
+    document_type: str,
+    profiler: Optional[Profiler] = None,
+):
+    from pdf2csv.pdf_extractor import iter_statements
+
+    rows = chain.from_iterable(page_queue)
+    for statement in iter_statements(rows, document_type, profiler):
+        statement_queue.put(statement)
+    statement_queue.close()
+
+
+def run_pipeline(
+    pages: Iterable[list],
+    document_type: str,
+    write_statement: Callable[[Statement], None],
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    profiler: Optional[Profiler] = None,
+) -> Pipeline:
+    pipeline = Pipeline(queue_size)
+    page_queue = pipeline.add_queue("pages")
+    statement_queue = pipeline.add_queue("statements")
+    pipeline.start_stage("extract", produce_pages, pages, page_queue)
+    pipeline.start_stage(
+        "parse", parse_pages, page_queue, statement_queue, document_type, profiler
+    )
+
+    try:
+        for statement in statement_queue:
+            with profile_stage(profiler, "write"):
+                write_statement(statement)
+    except PipelineCancelled:
+        pass
+    except BaseException:
+        pipeline.cancel()
+        raise
+
+    pipeline.join()
+    if profiler is not None:
+        for stage_queue in pipeline.queues:
+            profiler.add_queue_stats(stage_queue.name, stage_queue.to_dict())
+    return pipeline
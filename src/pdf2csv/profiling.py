@@ -0,0 +1,175 @@
+import json
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, ContextManager, Iterable, Iterator, Optional
+
+from pdf2csv.parsers.registry import ParserSession
+
+ProfileHook = Callable[[str, dict[str, Any]], None]
+
+PROMETHEUS_PREFIX = "pdf2csv"
+
+
+class Profiler:
+    def __init__(self):
+        self.stage_times: dict[str, float] = defaultdict(float)
+        self.page_times: list[float] = []
+        self.state_rows: Counter[str] = Counter()
+        self.transitions: Counter[tuple[str, str]] = Counter()
+        self.queue_stats: dict[str, dict[str, Any]] = {}
+        self._hooks: list[ProfileHook] = []
+
+    def add_hook(self, hook: ProfileHook):
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: ProfileHook):
+        self._hooks.remove(hook)
+
+    def emit(self, event: str, **fields):
+        for hook in self._hooks:
+            hook(event, fields)
+
+    def add_stage_time(self, stage: str, elapsed: float):
+        self.stage_times[stage] += elapsed
+        if self._hooks:
+            self.emit("stage", stage=stage, elapsed=elapsed)
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage_time(stage, time.perf_counter() - start)
+
+    def profile_pages(self, pages: Iterable[list]) -> Iterator[list]:
+        pages = iter(pages)
+        while True:
+            start = time.perf_counter()
+            try:
+                page_rows = next(pages)
+            except StopIteration:
+                return
+            elapsed = time.perf_counter() - start
+
+            self.page_times.append(elapsed)
+            self.add_stage_time("extract", elapsed)
+            if self._hooks:
+                self.emit("page", page=len(self.page_times), elapsed=elapsed)
+            yield page_rows
+
+    def feed(self, session: ParserSession, row: list[str]):
+        from_state = session.state_name
+        start = time.perf_counter()
+        session.feed(row)
+        self.stage_times["parse"] += time.perf_counter() - start
+
+        to_state = session.state_name
+        self.state_rows[from_state] += 1
+        if from_state != to_state:
+            self.transitions[from_state, to_state] += 1
+            if self._hooks:
+                self.emit("transition", from_state=from_state, to_state=to_state)
+
+    def add_queue_stats(self, queue: str, stats: dict[str, Any]):
+        self.queue_stats[queue] = stats
+        if self._hooks:
+            self.emit("queue", queue=queue, **stats)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "stages": dict(self.stage_times),
+            "pages": {
+                "count": len(self.page_times),
+                "seconds": self.page_times,
+            },
+            "state_rows": dict(self.state_rows),
+            "transitions": [
+                {"from": from_state, "to": to_state, "count": count}
+                for (from_state, to_state), count in self.transitions.items()
+            ],
+            "queues": self.queue_stats,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        lines = [f"# TYPE {PROMETHEUS_PREFIX}_stage_seconds_total counter"]
+        for stage, elapsed in self.stage_times.items():
+            lines.append(
+                f'{PROMETHEUS_PREFIX}_stage_seconds_total{{stage="{stage}"}} {elapsed}'
+            )
+
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_pages_total counter")
+        lines.append(f"{PROMETHEUS_PREFIX}_pages_total {len(self.page_times)}")
+
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_state_rows_total counter")
+        for state, count in self.state_rows.items():
+            lines.append(
+                f'{PROMETHEUS_PREFIX}_state_rows_total{{state="{state}"}} {count}'
+            )
+
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_state_transitions_total counter")
+        for (from_state, to_state), count in self.transitions.items():
+            lines.append(
+                f"{PROMETHEUS_PREFIX}_state_transitions_total"
+                f'{{from="{from_state}",to="{to_state}"}} {count}'
+            )
+
+        if self.queue_stats:
+            lines.extend(self.format_queue_metrics())
+        return "\n".join(lines) + "\n"
+
+    def format_queue_metrics(self) -> list[str]:
+        lines = [f"# TYPE {PROMETHEUS_PREFIX}_queue_max_depth gauge"]
+        for queue, stats in self.queue_stats.items():
+            lines.append(
+                f'{PROMETHEUS_PREFIX}_queue_max_depth{{queue="{queue}"}} '
+                f"{stats['max_depth']}"
+            )
+
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_queue_wait_seconds_total counter")
+        for queue, stats in self.queue_stats.items():
+            for side in ("put", "get"):
+                lines.append(
+                    f"{PROMETHEUS_PREFIX}_queue_wait_seconds_total"
+                    f'{{queue="{queue}",side="{side}"}} {stats[f"{side}_wait"]}'
+                )
+        return lines
+
+    def format_summary(self) -> str:
+        lines = ["Stages:"]
+        for stage, elapsed in self.stage_times.items():
+            lines.append(f"  {stage}: {elapsed:.3f}s")
+
+        if self.page_times:
+            slowest = max(range(len(self.page_times)), key=self.page_times.__getitem__)
+            lines.append(
+                f"Pages: {len(self.page_times)}, "
+                f"slowest page {slowest + 1} ({self.page_times[slowest]:.3f}s)"
+            )
+
+        lines.append("Rows per state:")
+        for state, count in self.state_rows.most_common():
+            lines.append(f"  {state}: {count}")
+
+        lines.append("Transitions:")
+        for (from_state, to_state), count in self.transitions.most_common():
+            lines.append(f"  {from_state} -> {to_state}: {count}")
+
+        if self.queue_stats:
+            lines.append("Queues:")
+            for queue, stats in self.queue_stats.items():
+                lines.append(
+                    f"  {queue}: {stats['items']} items, "
+                    f"max depth {stats['max_depth']}, "
+                    f"producer blocked {stats['put_wait']:.3f}s, "
+                    f"consumer idle {stats['get_wait']:.3f}s"
+                )
+        return "\n".join(lines)
+
+
+def profile_stage(profiler: Optional[Profiler], stage: str) -> ContextManager:
+    return nullcontext() if profiler is None else profiler.stage(stage)
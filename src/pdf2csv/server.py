@@ -0,0 +1,301 @@
+import csv
+import io
+import json
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from decimal import Decimal
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from typing import Any, Callable, Optional, Union
+from urllib.parse import parse_qs, urlparse
+
+from pdf2csv.aio import parse_source
+from pdf2csv.columnar import TransactionTableWriter
+from pdf2csv.model import Statement
+from pdf2csv.parsers.registry import registry
+from pdf2csv.sinks import (
+    TRANSACTION_FIELDS,
+    TransactionFormatter,
+    get_transaction_values,
+)
+
+DEFAULT_MAX_PENDING = 64
+DEFAULT_MAX_BODY_SIZE = 64 * 1024 * 1024
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def to_json_value(value: Any) -> Any:
+    if isinstance(value, (date, Decimal)):
+        return str(value)
+    return value
+
+
+def render_json(statements: list[Statement]) -> bytes:
+    return json.dumps(
+        [
+            {
+                "statement_date": to_json_value(statement.statement_date),
+                "account_id": statement.account_id,
+                "account_name": statement.account_name,
+                "ccy": statement.ccy,
+                "transactions": [
+                    dict(zip(TRANSACTION_FIELDS, map(to_json_value, values)))
+                    for values in map(get_transaction_values, statement.transactions)
+                ],
+            }
+            for statement in statements
+        ]
+    ).encode()
+
+
+def render_csv(statements: list[Statement]) -> bytes:
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(TRANSACTION_FIELDS)
+    format_transaction = TransactionFormatter()
+    for statement in statements:
+        writer.writerows(map(format_transaction, statement.transactions))
+    return output.getvalue().encode()
+
+
+def render_table(file_format: str) -> Callable[[list[Statement]], bytes]:
+    def render(statements: list[Statement]) -> bytes:
+        output = io.BytesIO()
+        with TransactionTableWriter(output, file_format) as writer:
+            writer.write_statements(statements)
+        return output.getvalue()
+
+    return render
+
+
+RENDERERS = {
+    "json": ("application/json", render_json),
+    "csv": ("text/csv", render_csv),
+    "arrow": ("application/vnd.apache.arrow.stream", render_table("arrow")),
+    "parquet": ("application/vnd.apache.parquet", render_table("parquet")),
+}
+
+
+def warm_up(document_type: str) -> int:
+    registry.create_session(document_type)
+    return os.getpid()
+
+
+class ServerMetrics:
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.requests: dict[int, int] = {}
+        self.pending = 0
+        self.latency_sum = 0.0
+        self.latency_count = 0
+        self.latency_buckets = [0] * len(LATENCY_BUCKETS)
+        self.parse_seconds = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self.pending - self.workers)
+
+    def try_acquire(self, max_pending: int) -> bool:
+        with self._lock:
+            if self.pending >= max_pending:
+                return False
+            self.pending += 1
+            return True
+
+    def release(self):
+        with self._lock:
+            self.pending -= 1
+
+    def record_request(self, status: int, latency: float):
+        with self._lock:
+            self.requests[status] = self.requests.get(status, 0) + 1
+            self.latency_sum += latency
+            self.latency_count += 1
+            for index, bucket in enumerate(LATENCY_BUCKETS):
+                if latency <= bucket:
+                    self.latency_buckets[index] += 1
+
+    def record_parse(self, elapsed: float):
+        with self._lock:
+            self.parse_seconds += elapsed
+
+    def to_prometheus(self) -> str:
+        with self._lock:
+            lines = ["# TYPE pdf2csv_requests_total counter"]
+            for status, count in sorted(self.requests.items()):
+                lines.append(f'pdf2csv_requests_total{{status="{status}"}} {count}')
+            lines += [
+                "# TYPE pdf2csv_workers gauge",
+                f"pdf2csv_workers {self.workers}",
+                "# TYPE pdf2csv_pending_requests gauge",
+                f"pdf2csv_pending_requests {self.pending}",
+                "# TYPE pdf2csv_queue_depth gauge",
+                f"pdf2csv_queue_depth {self.queue_depth}",
+                "# TYPE pdf2csv_parse_seconds_total counter",
+                f"pdf2csv_parse_seconds_total {self.parse_seconds}",
+                "# TYPE pdf2csv_request_seconds histogram",
+            ]
+            for bucket, count in zip(LATENCY_BUCKETS, self.latency_buckets):
+                lines.append(f'pdf2csv_request_seconds_bucket{{le="{bucket}"}} {count}')
+            lines += [
+                f'pdf2csv_request_seconds_bucket{{le="+Inf"}} {self.latency_count}',
+                f"pdf2csv_request_seconds_sum {self.latency_sum}",
+                f"pdf2csv_request_seconds_count {self.latency_count}",
+            ]
+        return "\n".join(lines) + "\n"
+
+
+class ParseService:
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        document_types: Optional[list[str]] = None,
+        max_body_size: Optional[int] = None,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or DEFAULT_MAX_PENDING
+        self.max_body_size = max_body_size or DEFAULT_MAX_BODY_SIZE
+        self.metrics = ServerMetrics(self.workers)
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.warm_up(document_types or registry.document_types)
+
+    def warm_up(self, document_types: list[str]):
+        futures = [
+            self._executor.submit(warm_up, document_type)
+            for _ in range(self.workers)
+            for document_type in document_types
+        ]
+        for future in futures:
+            future.result()
+
+    def parse(self, body: bytes, document_type: str) -> list[Statement]:
+        start = time.perf_counter()
+        try:
+            return self._executor.submit(parse_source, body, document_type).result()
+        finally:
+            self.metrics.record_parse(time.perf_counter() - start)
+
+    def close(self):
+        self._executor.shutdown()
+
+
+class ParseRequestHandler(BaseHTTPRequestHandler):
+    server: Union["ParseHTTPServer", "ParseUnixHTTPServer"]
+
+    def address_string(self) -> str:
+        return self.client_address[0] if self.client_address else "unix"
+
+    def send_body(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status: int, message: str):
+        body = json.dumps({"error": message}).encode()
+        self.send_body(status, "application/json", body)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/health":
+            self.send_body(HTTPStatus.OK, "text/plain", b"ok\n")
+        elif path == "/metrics":
+            metrics = self.server.service.metrics.to_prometheus().encode()
+            self.send_body(HTTPStatus.OK, "text/plain; version=0.0.4", metrics)
+        else:
+            self.send_error_json(HTTPStatus.NOT_FOUND, f"Unknown path: {path}")
+
+    def do_POST(self):
+        start = time.perf_counter()
+        status = int(self.handle_parse())
+        self.server.service.metrics.record_request(status, time.perf_counter() - start)
+
+    def handle_parse(self) -> int:
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        output_format = query.get("format", "json")
+        document_type = query.get("file_format", "standard_chartered")
+        if url.path != "/parse":
+            status, error = HTTPStatus.NOT_FOUND, f"Unknown path: {url.path}"
+        elif output_format not in RENDERERS:
+            status, error = HTTPStatus.BAD_REQUEST, f"Unknown format: {output_format}"
+        elif document_type not in registry:
+            status, error = (
+                HTTPStatus.BAD_REQUEST,
+                f"Unknown document type: {document_type}",
+            )
+        else:
+            return self.handle_parse_body(output_format, document_type)
+
+        self.send_error_json(status, error)
+        return status
+
+    def reject(self, status: int, message: str) -> int:
+        # The request body is left unread, so the connection cannot be reused
+        self.close_connection = True
+        self.send_error_json(status, message)
+        return status
+
+    def handle_parse_body(self, output_format: str, document_type: str) -> int:
+        service = self.server.service
+        content_length = self.headers.get("Content-Length", "0")
+        if not content_length.isdigit():
+            return self.reject(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        if int(content_length) > service.max_body_size:
+            return self.reject(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"Body exceeds {service.max_body_size} bytes",
+            )
+        if not service.metrics.try_acquire(service.max_pending):
+            return self.reject(HTTPStatus.SERVICE_UNAVAILABLE, "Too many requests")
+
+        try:
+            body = self.rfile.read(int(content_length))
+            statements = service.parse(body, document_type)
+        except Exception as ex:
+            error = f"{type(ex).__name__}: {ex}"
+            self.send_error_json(HTTPStatus.UNPROCESSABLE_ENTITY, error)
+            return HTTPStatus.UNPROCESSABLE_ENTITY
+        finally:
+            service.metrics.release()
+
+        content_type, render = RENDERERS[output_format]
+        self.send_body(HTTPStatus.OK, content_type, render(statements))
+        return HTTPStatus.OK
+
+
+class ParseHTTPServer(ThreadingHTTPServer):
+    def __init__(self, address: tuple[str, int], service: ParseService):
+        super().__init__(address, ParseRequestHandler)
+        self.service = service
+
+
+class ParseUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, service: ParseService):
+        super().__init__(socket_path, ParseRequestHandler)
+        self.service = service
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+def create_server(
+    service: ParseService,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    unix_socket: Optional[str] = None,
+) -> Union[ParseHTTPServer, ParseUnixHTTPServer]:
+    if unix_socket is not None:
+        return ParseUnixHTTPServer(unix_socket, service)
+    return ParseHTTPServer((host, port), service)
@@ -0,0 +1,245 @@
+import csv
+import dataclasses
+import gzip
+import io
+import os
+import sys
+from collections import OrderedDict
+from contextlib import ExitStack
+from datetime import date
+from operator import attrgetter
+from types import ModuleType
+from typing import IO, Any, BinaryIO, Iterable, Optional, Union
+
+from pdf2csv.columnar import (
+    AMOUNT_SCALE,
+    COLUMNAR_FORMATS,
+    DEFAULT_ROW_GROUP_SIZE,
+    TransactionTableWriter,
+)
+from pdf2csv.model import Statement, Transaction
+
+DEFAULT_OUTPUT_FILE = "./{account_id}_{ccy}_{statement_date}.csv"
+ONE_PER_ACCOUNT_OUTPUT_FILE = "./{account_id}.csv"
+COLUMNAR_OUTPUT_FILE = "./transactions.{output_format}"
+DEFAULT_MAX_OPEN_FILES = 32
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+STDOUT = "-"
+COMPRESSIONS = ("gzip", "zstd")
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+TRANSACTION_FIELDS = [field.name for field in dataclasses.fields(Transaction)]
+get_transaction_values = attrgetter(*TRANSACTION_FIELDS)
+
+
+class DateStrings(dict):
+    def __missing__(self, key: date) -> str:
+        value = self[key] = key.isoformat()
+        return value
+
+
+class TransactionFormatter:
+    def __init__(self, amount_scale: int = AMOUNT_SCALE):
+        self.amount_format = f".{amount_scale}f"
+        self.dates = DateStrings()
+
+    def __call__(self, transaction: Transaction) -> tuple:
+        dates = self.dates
+        amount_format = self.amount_format
+        return (
+            dates[transaction.transaction_date],
+            dates[transaction.statement_date],
+            transaction.account_id,
+            transaction.account_name,
+            transaction.ccy,
+            transaction.description,
+            format(transaction.deposit, amount_format),
+            format(transaction.withdrawal, amount_format),
+            format(transaction.balance, amount_format),
+        )
+
+
+def import_zstandard() -> ModuleType:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd compression requires zstandard, install pdf_to_csv[zstd]"
+        ) from None
+    return zstandard
+
+
+def get_compression(
+    output_file: str, compression: Optional[str] = None
+) -> Optional[str]:
+    if compression is None:
+        return COMPRESSION_SUFFIXES.get(os.path.splitext(output_file)[1])
+    if compression == "none":
+        return None
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression: {compression}")
+    return compression
+
+
+class StdoutStream(io.RawIOBase):
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        return sys.stdout.buffer.write(data)
+
+    def flush(self):
+        sys.stdout.buffer.flush()
+
+
+def open_binary_output(path: str, append: bool, buffer_size: int) -> BinaryIO:
+    if path == STDOUT:
+        return io.BufferedWriter(StdoutStream(), buffer_size)
+    return open(path, "ab" if append else "wb", buffering=buffer_size)
+
+
+def open_csv_output(
+    path: str, append: bool, compression: Optional[str], buffer_size: int
+) -> tuple[ExitStack, IO[str]]:
+    stack = ExitStack()
+    output = stack.enter_context(open_binary_output(path, append, buffer_size))
+    if compression == "gzip":
+        output = stack.enter_context(gzip.GzipFile(fileobj=output, mode="wb"))
+    elif compression == "zstd":
+        compressor = import_zstandard().ZstdCompressor()
+        output = stack.enter_context(compressor.stream_writer(output, closefd=False))
+    text = stack.enter_context(io.TextIOWrapper(output, encoding="utf-8", newline=""))
+    return stack, text
+
+
+def get_columnar_output_file(
+    output_file: Optional[str], one_per_account: bool, output_format: str
+) -> str:
+    if one_per_account:
+        raise ValueError(f"Cannot write {output_format} output one file per account")
+    if output_file is None:
+        return COLUMNAR_OUTPUT_FILE.format(output_format=output_format)
+    if "{" in output_file:
+        raise ValueError(
+            f"Output file {output_file} must be a single {output_format} file"
+        )
+    return output_file
+
+
+def get_output_file(
+    output_file: Optional[str], one_per_account: bool, output_format: str = "csv"
+) -> str:
+    if output_format in COLUMNAR_FORMATS:
+        return get_columnar_output_file(output_file, one_per_account, output_format)
+    if output_file is None:
+        return ONE_PER_ACCOUNT_OUTPUT_FILE if one_per_account else DEFAULT_OUTPUT_FILE
+    if one_per_account and "{account_id}" not in output_file:
+        raise ValueError(
+            f"Output file {output_file} must contain {{account_id}} "
+            "to write one file per account"
+        )
+    return output_file
+
+
+def get_partition_fields(statement: Statement) -> dict[str, Any]:
+    return {
+        "account_id": statement.account_id,
+        "account_name": statement.account_name,
+        "ccy": statement.ccy,
+        "statement_date": statement.statement_date,
+        "month": f"{statement.statement_date:%Y-%m}",
+    }
+
+
+class CsvPartitionSink:
+    def __init__(
+        self,
+        output_file: str,
+        max_open_files: int = DEFAULT_MAX_OPEN_FILES,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        compression: Optional[str] = None,
+    ):
+        self.output_file = output_file
+        self.max_open_files = max_open_files
+        self.buffer_size = buffer_size
+        self.compression = get_compression(output_file, compression)
+        self.format_transaction = TransactionFormatter()
+        self._files: OrderedDict[str, tuple[Any, Any]] = OrderedDict()
+        self._paths: dict[str, None] = {}
+
+    @property
+    def paths(self) -> list[str]:
+        return list(self._paths)
+
+    def get_path(self, statement: Statement) -> str:
+        if self.output_file == STDOUT:
+            return STDOUT
+        return self.output_file.format(**get_partition_fields(statement))
+
+    def open_file(self, path: str, append: bool) -> tuple[Any, IO[str]]:
+        if self.compression is None and path != STDOUT:
+            mode = "a" if append else "w"
+            f = open(
+                path, mode, newline="", encoding="utf-8", buffering=self.buffer_size
+            )
+            return f, f
+        return open_csv_output(path, append, self.compression, self.buffer_size)
+
+    def get_writer(self, path: str):
+        if path in self._files:
+            self._files.move_to_end(path)
+            return self._files[path][1]
+
+        if len(self._files) >= self.max_open_files:
+            _, (f, _) = self._files.popitem(last=False)
+            f.close()
+
+        append = path in self._paths
+        f, text = self.open_file(path, append)
+        writer = csv.writer(text)
+        if not append:
+            writer.writerow(TRANSACTION_FIELDS)
+            self._paths[path] = None
+        self._files[path] = (f, writer)
+        return writer
+
+    def write_statement(self, statement: Statement):
+        writer = self.get_writer(self.get_path(statement))
+        writer.writerows(map(self.format_transaction, statement.transactions))
+
+    def write_statements(self, statements: Iterable[Statement]):
+        for statement in statements:
+            self.write_statement(statement)
+
+    def close(self):
+        while self._files:
+            _, (f, _) = self._files.popitem(last=False)
+            f.close()
+
+    def __enter__(self) -> "CsvPartitionSink":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+Sink = Union[CsvPartitionSink, TransactionTableWriter]
+
+
+def open_sink(
+    output_file: str,
+    output_format: str = "csv",
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: Optional[str] = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> Sink:
+    if output_format in COLUMNAR_FORMATS:
+        output_file = get_columnar_output_file(output_file, False, output_format)
+        if output_file == STDOUT:
+            raise ValueError(f"Cannot write {output_format} output to stdout")
+        return TransactionTableWriter(output_file, output_format, row_group_size)
+    if output_format != "csv":
+        raise ValueError(f"Unknown output format: {output_format}")
+    return CsvPartitionSink(
+        output_file, buffer_size=buffer_size, compression=compression
+    )
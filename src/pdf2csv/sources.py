@@ -0,0 +1,94 @@
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Union
+
+if TYPE_CHECKING:
+    import pdfplumber
+
+PdfSource = Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap, BinaryIO]
+SharedSource = Union[str, bytes]
+
+BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+
+def is_path(source: PdfSource) -> bool:
+    return isinstance(source, (str, os.PathLike))
+
+
+def is_buffer(source: PdfSource) -> bool:
+    return isinstance(source, BUFFER_TYPES)
+
+
+def read_stream(stream: BinaryIO) -> bytes:
+    position = stream.tell()
+    try:
+        return stream.read()
+    finally:
+        stream.seek(position)
+
+
+def to_shared_source(source: PdfSource) -> SharedSource:
+    if is_path(source):
+        return os.fspath(source)
+    if isinstance(source, bytes):
+        return source
+    if is_buffer(source):
+        return bytes(source)
+    return read_stream(source)
+
+
+@contextmanager
+def open_stream(source: PdfSource) -> Iterator[BinaryIO]:
+    if is_path(source):
+        with open(source, "rb") as stream:
+            yield stream
+    elif isinstance(source, mmap.mmap):
+        yield source
+    elif is_buffer(source):
+        yield io.BytesIO(source)
+    else:
+        yield source
+
+
+@contextmanager
+def open_pdf(source: PdfSource, **kwargs) -> Iterator["pdfplumber.PDF"]:
+    import pdfplumber
+
+    with open_stream(source) as stream:
+        pdf_file = pdfplumber.PDF(stream, **kwargs)
+        try:
+            yield pdf_file
+        finally:
+            pdf_file.close()
+
+
+def release_page(pdf_file: "pdfplumber.PDF", page: "pdfplumber.page.Page"):
+    page.flush_cache()
+    # flush_cache only drops the page's own layout; pdfminer still keeps every
+    # decoded content stream in its private document cache, so evict them too
+    cached_objs = getattr(pdf_file.doc, "_cached_objs", None)
+    if cached_objs is None:
+        return
+    for content in page.page_obj.contents or []:
+        cached_objs.pop(getattr(content, "objid", None), None)
+
+
+def iter_pages(pdf_file: "pdfplumber.PDF") -> Iterator["pdfplumber.page.Page"]:
+    from pdfminer.pdfpage import PDFPage
+    from pdfplumber.page import Page
+
+    page_numbers = pdf_file.pages_to_parse
+    doctop = 0
+    for index, page_obj in enumerate(PDFPage.create_pages(pdf_file.doc)):
+        page_number = index + 1
+        if page_numbers is not None and page_number not in page_numbers:
+            continue
+
+        page = Page(pdf_file, page_obj, page_number=page_number, initial_doctop=doctop)
+        doctop += page.height
+        try:
+            yield page
+        finally:
+            release_page(pdf_file, page)
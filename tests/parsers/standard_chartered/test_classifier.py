@@ -0,0 +1,76 @@
+from decimal import Decimal
+from typing import List
+
+import pytest
+from pdf2csv.model import Row
+from pdf2csv.parsers.standard_chartered.classifier import (
+    RowKind,
+    classify_row,
+    is_amount,
+    parse_amount,
+)
+
+
+@pytest.mark.parametrize(
+    ["row", "expected_kind"],
+    [
+        ("Statement Date : 17 Jan 2019", RowKind.STATEMENT_DATE),
+        ("Statement Date : Jan 2019", RowKind.CONTINUATION),
+        ("My secret account  : 123−4−567890−1", RowKind.ACCOUNT),
+        ("Date  Description  Deposit  Withdrawal  Balance", RowKind.HEADER),
+        ("Date Description Deposit Withdrawal Balance", RowKind.CONTINUATION),
+        ("USD", RowKind.CURRENCY),
+        ("USD ", RowKind.CURRENCY),
+        ("USD account", RowKind.CONTINUATION),
+        ("17 Jul BALANCE FROM PREVIOUS STATEMENT 1,000,000.99", RowKind.OPEN_BALANCE),
+        ("17 Aug CLOSING BALANCE 1200,000.99", RowKind.CLOSING_BALANCE),
+        ("26 Jul SCB ATM QR WDL   200,000.00 800,000.99", RowKind.DATED_TRANSACTION),
+        ("SCB ATM QR WDL 200,000.00   1200,000.99", RowKind.UNDATED_TRANSACTION),
+        ("another row of my transaction", RowKind.CONTINUATION),
+        ("x 1.00", RowKind.CONTINUATION),
+        ("", RowKind.CONTINUATION),
+    ],
+)
+def test_classify_row(row: str, expected_kind: RowKind):
+    assert classify_row(row.split(" ")) is expected_kind
+
+
+def test_classify_empty_row():
+    assert classify_row([]) is RowKind.CONTINUATION
+
+
+def test_classify_positioned_header():
+    row = Row(
+        ["Date", "", "", "Description", "Deposit", "Withdrawal", "Balance"],
+        [0.0] * 7,
+        [1.0] * 7,
+    )
+    assert classify_row(row) is RowKind.HEADER
+
+
+@pytest.mark.parametrize(
+    ["tokens", "expected"],
+    [
+        (["1,000.99", "5.", ".5", "0108"], True),
+        (["", ",", ".", "1.2.3", "-1", "Jul"], False),
+    ],
+)
+def test_is_amount(tokens: List[str], expected: bool):
+    assert all(is_amount(token) is expected for token in tokens)
+
+
+@pytest.mark.parametrize(
+    ["token", "expected"],
+    [
+        ("1,234.56", Decimal("1234.56")),
+        ("1200,000.99", Decimal("1200000.99")),
+        ("200.00", Decimal("200.00")),
+        ("17", Decimal("17")),
+    ],
+)
+def test_parse_amount(token: str, expected: Decimal):
+    assert parse_amount(token) == expected
+
+
+def test_parse_amount_sums_exactly():
+    assert sum(parse_amount("0.10") for _ in range(10)) == Decimal("1.00")
@@ -0,0 +1,111 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from pdf2csv.model import Row
+from pdf2csv.parsers.standard_chartered.classifier import RowKind
+from pdf2csv.parsers.standard_chartered.fields import (
+    classify_unplaced_row,
+    get_amount,
+    get_amount_value,
+    get_columns,
+    get_statement_date,
+    get_transaction_date,
+    join_description,
+    split_amounts,
+    split_transaction_amounts,
+)
+
+HEADER = Row(
+    ["Date", "Description", "Deposit", "Withdrawal", "Balance"],
+    [36.0, 60.0, 150.0, 200.0, 260.0],
+    [46.0, 100.0, 180.0, 240.0, 290.0],
+)
+
+
+@pytest.mark.parametrize(
+    ["day", "month", "year", "expected"],
+    [(1, "Jan", 2020, date(2020, 1, 1)), (1, "Dec", 2018, date(2018, 12, 1))],
+)
+def test_get_statement_date(day: int, month: str, year: int, expected: date):
+    assert get_statement_date(day, month, year) == expected
+
+
+@pytest.mark.parametrize(
+    ["statement_date", "row", "expected"],
+    [
+        (date(2020, 8, 17), "26 Jul".split(" "), date(2020, 7, 26)),
+        (date(2020, 8, 17), "30 Dec".split(" "), date(2019, 12, 30)),
+        (date(2020, 6, 15), ["30", "May"], date(2020, 5, 30)),
+        (date(2020, 6, 15), ["05", "Jun"], date(2020, 6, 5)),
+        (date(2020, 1, 15), ["23", "Dec"], date(2019, 12, 23)),
+        (date(2020, 12, 15), ["23", "Jan"], date(2020, 1, 23)),
+    ],
+)
+def test_get_transaction_date(statement_date: date, row: list[str], expected: date):
+    assert get_transaction_date(statement_date, row) == expected
+
+
+def test_get_transaction_date_require_date_prefix():
+    with pytest.raises(Exception, match="doesn't start with date"):
+        get_transaction_date(date(2020, 8, 17), ["SALARY"])
+
+
+def test_split_amounts():
+    row = Row(
+        ["ATM", "0913", "200.00", "1,000.00"],
+        [70.0, 90.0, 207.6, 225.6],
+        [86.0, 110.0, 240.0, 290.0],
+    )
+
+    tokens, amounts = split_amounts(get_columns(HEADER), row)
+
+    assert tokens == ["ATM", "0913"]
+    assert amounts == {"Withdrawal": "200.00", "Balance": "1,000.00"}
+    assert get_amount(amounts, "Withdrawal") == Decimal("200.00")
+    assert get_amount(amounts, "Deposit") == Decimal("0.00")
+
+
+def test_split_amounts_reject_column_collision():
+    row = Row(["ATM", "1.00", "2.00"], [70.0, 90.0, 110.0], [86.0, 280.0, 290.0])
+
+    assert split_amounts(get_columns(HEADER), row) is None
+
+
+def test_split_amounts_keep_reference_numbers_in_description():
+    row = Row(["ATM", "0913", "1.00"], [70.0, 150.0, 260.0], [86.0, 180.0, 290.0])
+
+    tokens, amounts = split_amounts(get_columns(HEADER), row)
+
+    assert tokens == ["ATM", "0913"]
+    assert amounts == {"Balance": "1.00"}
+
+
+def test_unplaced_transaction_fall_back_to_text_layout():
+    row = Row(
+        ["18", "Jul", "INTEREST", "CREDIT", "550.74", "", "", "100,502.95"],
+        [36.0, 50.0, 70.0, 110.0, 160.0, 180.0, 180.0, 230.0],
+        [46.0, 66.0, 106.0, 140.0, 192.6, 192.6, 192.6, 240.0],
+    )
+    columns = get_columns(HEADER)
+
+    assert split_transaction_amounts(columns, row) is None
+    assert classify_unplaced_row(columns, row) is RowKind.DATED_TRANSACTION
+
+
+def test_reject_unplaced_amounts_in_continuation():
+    row = Row(["FEE", "1.00"], [70.0, 160.0], [86.0, 180.0])
+
+    with pytest.raises(AttributeError, match="Unable to place amounts"):
+        classify_unplaced_row(get_columns(HEADER), row)
+
+
+def test_get_amount_value():
+    row = "SALARY  1,000.00 2,000.00".split(" ")
+
+    assert get_amount_value(row, -4) == Decimal("0.00")
+    assert get_amount_value(row, -2) == Decimal("1000.00")
+
+
+def test_join_description():
+    assert join_description(["ATM ", "", "  WDL", "0913"]) == "ATM WDL 0913"
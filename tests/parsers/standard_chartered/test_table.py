@@ -0,0 +1,390 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from benchmarks.synthetic import SyntheticStatement, generate_rows
+from pdf2csv.model import Row, Statement
+from pdf2csv.parsers.engine import Engine
+from pdf2csv.parsers.registry import ParserSession
+from pdf2csv.parsers.standard_chartered.fields import is_money
+from pdf2csv.parsers.standard_chartered.table import StatementContext, create_parser
+from tests.test_pdf_extractor import ROWS, SECOND_ACCOUNT_ROWS
+
+COLUMNS_HEADER = Row(
+    ["Date", "", "Description", "", "Deposit", "", "Withdrawal", "", "Balance"],
+    [36.0, 50.0, 60.0, 100.0, 150.0, 180.0, 200.0, 240.0, 260.0],
+    [46.0, 60.0, 100.0, 150.0, 180.0, 200.0, 240.0, 260.0, 290.0],
+)
+POSITIONED_ROWS = [
+    ROWS[0].split(" "),
+    ROWS[1].split(" "),
+    ROWS[2].split(" "),
+    COLUMNS_HEADER,
+    ["USD"],
+    "17 Jul BALANCE FROM PREVIOUS STATEMENT 1,000,000.99".split(" "),
+    Row(
+        ["26", "Jul", "ATM", "0913", "200.00", "1,000,200.99"],
+        [36.0, 50.0, 70.0, 90.0, 207.6, 225.6],
+        [46.0, 66.0, 86.0, 110.0, 240.0, 290.0],
+    ),
+    ["REF", "0913"],
+    Row(
+        ["SALARY", "50.00", "1,000,250.99"], [70.0, 160.0, 260.0], [100.0, 180.0, 290.0]
+    ),
+    "17 Aug CLOSING BALANCE 1,000,250.99".split(" "),
+    ["HKD"],
+    "17 Jul BALANCE FROM PREVIOUS STATEMENT 100.00".split(" "),
+    Row(
+        ["20", "Jul", "INTEREST", "1.00", "101.00"],
+        [36.0, 50.0, 70.0, 160.0, 260.0],
+        [46.0, 66.0, 86.0, 180.0, 290.0],
+    ),
+    "17 Aug CLOSING BALANCE 101.00".split(" "),
+]
+
+
+def parse_rows(rows: list[list[str]]) -> list[Statement]:
+    session = ParserSession("standard_chartered", create_parser())
+    statements = []
+    for row in rows:
+        session.feed(row)
+        statements.extend(session.pop_statements())
+    return statements
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [row.split(" ") for row in ROWS + SECOND_ACCOUNT_ROWS],
+        [row.split(" ") for row in generate_rows(SyntheticStatement(accounts=3))],
+        [
+            row.split(" ")
+            for row in generate_rows(SyntheticStatement(continuation_lines=3))
+        ],
+        [
+            row.split(" ")
+            for row in generate_rows(
+                SyntheticStatement(pages=1, rows_per_page=300, continuation_lines=60)
+            )
+        ],
+        POSITIONED_ROWS,
+    ],
+    ids=["sample", "synthetic", "continuations", "long_continuations", "positioned"],
+)
+def test_table_parser_reconcile_balances(rows: list[list[str]]):
+    statements = parse_rows(rows)
+
+    amount_rows = sum(1 for row in rows if row and is_money(row[-1]))
+    assert statements
+    assert sum(len(s.transactions) for s in statements) == amount_rows - 2 * len(
+        statements
+    )
+    for statement in statements:
+        transactions = statement.transactions
+        for previous, transaction in zip(transactions, transactions[1:]):
+            assert transaction.balance == (
+                previous.balance + transaction.deposit - transaction.withdrawal
+            )
+
+
+def test_positioned_rows_keep_columns_across_currencies():
+    statements = parse_rows(POSITIONED_ROWS)
+
+    transaction = statements[1].transactions[0]
+    assert (transaction.deposit, transaction.withdrawal) == (1, 0)
+    assert transaction.balance == 101
+
+
+def test_current_statement_follow_open_table():
+    session = ParserSession("standard_chartered", create_parser())
+    opened = []
+    transactions = []
+
+    for row in ROWS:
+        session.feed(row.split(" "))
+        opened.append(session.current_statement is not None)
+        transactions.append(len(session.pop_transactions()))
+
+    assert opened == [False] * 4 + [True] * 3 + [False]
+    assert transactions == [0] * 7 + [1]
+
+
+def test_state_names_follow_transitions():
+    session = ParserSession("standard_chartered", create_parser())
+    names = [session.state_name]
+    for row in ROWS:
+        session.feed(row.split(" "))
+        names.append(session.state_name)
+
+    assert names == [
+        "StateStart",
+        "StateLookAccountNumber",
+        "StateReadAccountName",
+        "StateSearchTableHeader",
+        "StateSearchCcyOrAccountNumber",
+        "StateOpenBalance",
+        "StateProcessTable",
+        "StateProcessTable",
+        "StateSearchCcyOrAccountNumber",
+    ]
+
+
+def test_reuse_parser_without_allocating_states():
+    parser = create_parser()
+
+    for row in ROWS:
+        assert parser(row.split(" ")) is parser
+    assert isinstance(parser.context, StatementContext)
+    assert not hasattr(parser.context, "__dict__")
+
+
+def test_reject_missing_open_balance():
+    parser = create_parser()
+    for row in ROWS[:5]:
+        parser(row.split(" "))
+
+    with pytest.raises(AttributeError, match="Expected open Balance Row"):
+        parser(["26", "Jul", "ATM", "200.00", "800.00"])
+
+
+def test_long_description_normalized_once():
+    rows = [row.split(" ") for row in ROWS[:7]]
+    rows += [["", "REF", " 0108 "]] * 100 + [ROWS[7].split(" ")]
+
+    statements = parse_rows(rows)
+
+    description = statements[0].transactions[0].description
+    assert description == " ".join(["SCB ATM QR WDL 0108 0913"] + ["REF 0108"] * 100)
+
+
+def open_table(*rows: list[str]) -> Engine:
+    parser = create_parser()
+    for row in ROWS[:6]:
+        parser(row.split(" "))
+    for row in rows:
+        parser(row)
+    return parser
+
+
+def get_pending(context: StatementContext) -> tuple:
+    return (
+        context.pending_date,
+        context.pending_description,
+        context.pending_deposit,
+        context.pending_withdrawal,
+        context.pending_balance,
+    )
+
+
+@pytest.mark.parametrize(
+    ["row", "state_name", "statement_date"],
+    [
+        ([], "StateStart", None),
+        (
+            "Statement Date : 17 Jan 2019".split(" "),
+            "StateLookAccountNumber",
+            date(2019, 1, 17),
+        ),
+        ("Statement Date : Jan 2019".split(" "), "StateStart", None),
+    ],
+)
+def test_find_statement_date(row: list[str], state_name: str, statement_date: date):
+    parser = create_parser()(row)
+
+    assert parser.state_name == state_name
+    assert parser.context.statement_date == statement_date
+
+
+def test_read_account_number_and_name():
+    parser = create_parser()(ROWS[0].split(" "))
+
+    parser("YOUR ACCOUNT ACTIVITIES".split(" "))
+    assert parser.state_name == "StateLookAccountNumber"
+
+    parser("My secret account  : 123−4−567890−1".split(" "))
+    assert parser.state_name == "StateReadAccountName"
+    assert parser.context.account_id == "123−4−567890−1"
+    assert parser.context.account_name_tokens == ["My", "secret", "account", ""]
+
+    parser(["John", "Doe"])
+    assert parser.state_name == "StateSearchTableHeader"
+    assert parser.context.account_name == "My secret account  John Doe"
+
+
+def test_search_table_header():
+    parser = create_parser()
+    for row in ROWS[:3]:
+        parser(row.split(" "))
+
+    parser(["random", "row"])
+    assert parser.state_name == "StateSearchTableHeader"
+
+    parser(["Date", "", "Description", "", "Deposit", "", "Withdrawal", "", "Balance"])
+    assert parser.state_name == "StateSearchCcyOrAccountNumber"
+
+
+@pytest.mark.parametrize(
+    ["row", "state_name"],
+    [
+        (["random"], "StateSearchCcyOrAccountNumber"),
+        (["random", "row"], "StateSearchCcyOrAccountNumber"),
+        (["USD", ""], "StateOpenBalance"),
+        (["JPY"], "StateOpenBalance"),
+        ("My secret account  : 987−6−543210−1".split(" "), "StateReadAccountName"),
+    ],
+)
+def test_search_currency_or_account_number(row: list[str], state_name: str):
+    parser = create_parser()
+    for line in ROWS[:4]:
+        parser(line.split(" "))
+
+    parser(row)
+
+    assert parser.state_name == state_name
+    if state_name == "StateOpenBalance":
+        assert parser.current_statement.ccy == row[0]
+    if state_name == "StateReadAccountName":
+        assert parser.context.account_id == "987−6−543210−1"
+
+
+def test_open_balance_set_row_date():
+    parser = open_table()
+
+    assert parser.state_name == "StateProcessTable"
+    assert parser.context.current_row_date == date(2020, 7, 17)
+    assert not parser.context.has_pending
+
+
+@pytest.mark.parametrize(
+    ["rows", "pending"],
+    [
+        (
+            ["26 Jul SCB ATM QR WDL 0108 0913   200,000.00 800,000.99".split(" ")],
+            (
+                date(2020, 7, 26),
+                "SCB ATM QR WDL 0108 0913",
+                Decimal("0.00"),
+                Decimal("200000.00"),
+                Decimal("800000.99"),
+            ),
+        ),
+        (
+            ["26 Jul SCB ATM QR WDL 0108 0913 200,000.00   1200,000.99".split(" ")],
+            (
+                date(2020, 7, 26),
+                "SCB ATM QR WDL 0108 0913",
+                Decimal("200000.00"),
+                Decimal("0.00"),
+                Decimal("1200000.99"),
+            ),
+        ),
+        (
+            ["SCB ATM QR WDL 0108 0913 200,000.00   1200,000.99".split(" ")],
+            (
+                date(2020, 7, 17),
+                "SCB ATM QR WDL 0108 0913",
+                Decimal("200000.00"),
+                Decimal("0.00"),
+                Decimal("1200000.99"),
+            ),
+        ),
+        (
+            [
+                Row(
+                    ["26", "Jul", "ATM", "0913", "200.00", "1,000,200.99"],
+                    [36.0, 50.0, 70.0, 90.0, 207.6, 225.6],
+                    [46.0, 66.0, 86.0, 110.0, 240.0, 290.0],
+                )
+            ],
+            (
+                date(2020, 7, 26),
+                "ATM 0913",
+                Decimal("0.00"),
+                Decimal("200.00"),
+                Decimal("1000200.99"),
+            ),
+        ),
+    ],
+    ids=["withdrawal", "deposit", "undated", "positioned"],
+)
+def test_hold_transaction_row(rows: list[list[str]], pending: tuple):
+    parser = create_parser()
+    for row in ROWS[:3]:
+        parser(row.split(" "))
+    for row in [COLUMNS_HEADER, ["USD"], ROWS[5].split(" "), *rows]:
+        parser(row)
+
+    assert parser.context.has_pending
+    assert get_pending(parser.context) == pending
+
+
+def test_description_remove_extra_white_spaces():
+    parser = open_table(
+        "26 Jul TRANSFER WITHDRAWAL        NTRF 200,000.00   1200,000.99".split(" "),
+        " TRANSFER WITHDRAWAL 2        NTRF 200,000.00   1400,000.99".split(" "),
+        "27 Jul TRANSFER WITHDRAWAL        NTRF 200,000.00   1600,000.99".split(" "),
+    )
+
+    transactions = parser.current_statement.transactions
+    assert transactions[0].description == "TRANSFER WITHDRAWAL NTRF"
+    assert transactions[1].description == "TRANSFER WITHDRAWAL 2 NTRF"
+
+
+@pytest.mark.parametrize(
+    ["rows", "transactions"],
+    [
+        ([], 0),
+        (["SCB ATM QR WDL 0108 0913 200,000.00   1200,000.99".split(" ")], 0),
+        (
+            [
+                "26 Jul SCB ATM QR WDL 0108 0913 200,000.00   1200,000.99".split(" "),
+                "SCB ATM QR WDL 0108 0913 200,000.00   1400,000.99".split(" "),
+            ],
+            1,
+        ),
+    ],
+)
+def test_add_transaction_on_next_transaction_row(
+    rows: list[list[str]], transactions: int
+):
+    parser = open_table(*rows)
+
+    assert len(parser.current_statement.transactions) == transactions
+
+
+@pytest.mark.parametrize(
+    ["rows", "transactions"],
+    [
+        ([], 0),
+        (["SCB ATM QR WDL 0108 0913 200,000.00   1200,000.99".split(" ")], 1),
+    ],
+)
+def test_closing_balance_close_statement(rows: list[list[str]], transactions: int):
+    parser = open_table(*rows, "17 Aug CLOSING BALANCE 1200,000.99".split(" "))
+
+    assert parser.state_name == "StateSearchCcyOrAccountNumber"
+    assert parser.current_statement is None
+    assert len(parser.statements) == 1
+    assert len(parser.statements[0].transactions) == transactions
+
+
+def test_multi_row_transaction_description():
+    parser = open_table(
+        "26 Jul my transaction 200,000.00   1200,000.99".split(" "),
+        "another row of my transaction".split(" "),
+        "17 Aug CLOSING BALANCE 1200,000.99".split(" "),
+    )
+
+    description = parser.statements[0].transactions[0].description
+    assert description == "my transaction another row of my transaction"
+
+
+def test_run_pdf():
+    import pdfplumber
+
+    pdf = pdfplumber.open("../notebook/eStatement-201908.pdf")
+    parser = create_parser()
+    for page in pdf.pages:
+        for row in page.extract_text().split("\n"):
+            parser(row.split(" "))
+    assert len(parser.statements) == 4
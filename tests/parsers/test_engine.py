@@ -0,0 +1,68 @@
+import pytest
+from pdf2csv.model import Statement
+from pdf2csv.parsers.engine import Engine, ParserContext, StateTable, Transition
+
+
+def classify_first(context: ParserContext, row: list[str]) -> str:
+    return row[0]
+
+
+def open_statement(context: ParserContext, row: list[str]):
+    context.current_statement = Statement(None, row[1], "", "USD")
+
+
+def close_statement(context: ParserContext, row: list[str]):
+    context.statements.append(context.current_statement)
+    context.current_statement = None
+
+
+TABLE = {
+    "idle": StateTable(classify_first, {"open": Transition(open_statement, "open")}),
+    "open": StateTable(classify_first, {"close": Transition(close_statement, "idle")}),
+}
+
+
+def test_engine_follow_transitions():
+    engine = Engine(TABLE, "idle", ParserContext())
+
+    for row in [["noise"], ["open", "A"], ["noise"]]:
+        engine = engine(row)
+
+    assert engine.state_name == "open"
+    assert engine.current_statement.account_id == "A"
+
+    engine(["close"])
+
+    assert engine.state_name == "idle"
+    assert [statement.account_id for statement in engine.statements] == ["A"]
+    assert str(engine) == "State => idle"
+
+
+def test_default_transition_without_classifier():
+    rows = []
+    table = {"only": StateTable(default=Transition(lambda c, row: rows.append(row)))}
+    engine = Engine(table, "only", ParserContext())
+
+    engine(["a"])
+    engine(["b"])
+
+    assert rows == [["a"], ["b"]]
+
+
+@pytest.mark.parametrize(
+    ["table", "message"],
+    [
+        ({}, "Unknown states: idle"),
+        (
+            {"idle": StateTable(default=Transition(target="missing"))},
+            "Unknown states: missing",
+        ),
+        (
+            {"idle": StateTable(transitions={"a": Transition()})},
+            "requires a classifier",
+        ),
+    ],
+)
+def test_reject_invalid_table(table, message):
+    with pytest.raises(ValueError, match=message):
+        Engine(table, "idle", ParserContext())
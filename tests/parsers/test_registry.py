@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+from pdf2csv.parsers.engine import Engine
+from pdf2csv.parsers.registry import ParserRegistry, registry
+from pdf2csv.parsers.standard_chartered.table import create_parser
+
+ROWS = [
+    "Statement Date : 17 Aug 2020",
+    "My secret account  : 123−4−567890−1",
+    "John Doe",
+    "Date  Description  Deposit  Withdrawal  Balance",
+    "USD",
+    "17 Jul BALANCE FROM PREVIOUS STATEMENT 1,000,000.99",
+    "26 Jul SCB ATM QR WDL 0108 0913   200,000.00 800,000.99",
+    "17 Aug CLOSING BALANCE 800,000.99",
+]
+
+
+def parse_rows(rows: list[str]) -> list:
+    session = registry.create_session("standard_chartered")
+    statements = []
+    for row in rows:
+        session.feed(row.split(" "))
+        statements.extend(session.pop_statements())
+    return statements
+
+
+def test_sessions_are_isolated():
+    first = registry.create_session("standard_chartered")
+    second = registry.create_session("standard_chartered")
+
+    assert first.state is not second.state
+    assert first.state.statements is not second.state.statements
+
+
+def test_pop_statements_release_closed_statements():
+    session = registry.create_session("standard_chartered")
+    popped = []
+    for row in ROWS:
+        session.feed(row.split(" "))
+        popped.extend(session.pop_statements())
+
+    assert len(popped) == 1
+    assert session.state.statements == []
+
+
+def test_pop_transactions_release_committed_transactions():
+    session = registry.create_session("standard_chartered")
+    popped = []
+    for row in ROWS:
+        session.feed(row.split(" "))
+        popped.extend(session.pop_transactions())
+
+    assert [transaction.balance for transaction in popped] == [Decimal("800000.99")]
+    assert session.pop_transactions() == []
+
+
+def test_concurrent_sessions_do_not_share_statements():
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(parse_rows, [ROWS] * 64))
+
+    assert all(len(statements) == 1 for statements in results)
+
+
+def test_unknown_document_type():
+    with pytest.raises(KeyError) as ex:
+        registry.create_session("unknown_bank")
+    assert "unknown_bank" in str(ex.value)
+
+
+def test_register_and_unregister_parser():
+    parsers = ParserRegistry()
+    parsers.register("my_bank", create_parser)
+
+    assert "my_bank" in parsers
+    assert isinstance(parsers.create_session("my_bank").state, Engine)
+
+    parsers.unregister("my_bank")
+    assert parsers.document_types == []
+
+
+def test_parser_version():
+    parsers = ParserRegistry()
+    parsers.register("standard_chartered", create_parser, "2")
+
+    assert parsers.get_version("standard_chartered") == "2"
+    parsers.unregister("standard_chartered")
+    with pytest.raises(KeyError):
+        parsers.get_version("standard_chartered")
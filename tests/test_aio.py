@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+from pdf2csv import aio
+from pdf2csv.aio import AsyncPdfParser
+
+PAGES = [
+    [
+        "Statement Date : 17 Aug 2020",
+        "My secret account  : 123−4−567890−1",
+        "John Doe",
+        "Date  Description  Deposit  Withdrawal  Balance",
+        "USD",
+        "17 Jul BALANCE FROM PREVIOUS STATEMENT 1,000,000.99",
+    ],
+    [
+        "26 Jul SCB ATM QR WDL 0108 0913   200,000.00 800,000.99",
+        "27 Jul SCB ATM QR WDL 0108 0913   100,000.00 700,000.99",
+    ],
+    ["17 Aug CLOSING BALANCE 700,000.99"],
+]
+
+
+def test_parse_bound_concurrency(mocker):
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def parse_source(source, document_type):
+        with lock:
+            running.append(source)
+            max_running.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(source)
+        return [source]
+
+    mocker.patch.object(aio, "parse_source", side_effect=parse_source)
+
+    async def parse_all():
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            async with AsyncPdfParser(2, executor) as parser:
+                return await asyncio.gather(
+                    *(parser.parse(f"{index}.pdf") for index in range(10))
+                )
+
+    results = asyncio.run(parse_all())
+
+    assert results == [[f"{index}.pdf"] for index in range(10)]
+    assert max(max_running) == 2
+
+
+def test_iter_transactions_in_page_order(mocker):
+    mocker.patch.object(aio, "count_pages", return_value=len(PAGES))
+    mocker.patch.object(
+        aio,
+        "extract_page_rows",
+        side_effect=lambda source, page_numbers: [
+            PAGES[page_number - 1] for page_number in page_numbers
+        ],
+    )
+
+    async def collect():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parser = AsyncPdfParser(2, executor)
+            return [
+                transaction
+                async for transaction in parser.iter_transactions(b"%PDF-1.4")
+            ]
+
+    transactions = asyncio.run(collect())
+
+    assert [transaction.balance for transaction in transactions] == [
+        Decimal("800000.99"),
+        Decimal("700000.99"),
+    ]
+
+
+def test_iter_transactions_bound_executor_jobs(mocker):
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def extract_page_rows(source, page_numbers):
+        with lock:
+            running.append(page_numbers)
+            max_running.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(page_numbers)
+        return [PAGES[page_number - 1] for page_number in page_numbers]
+
+    mocker.patch.object(aio, "count_pages", return_value=len(PAGES))
+    mocker.patch.object(aio, "extract_page_rows", side_effect=extract_page_rows)
+
+    async def collect(parser: AsyncPdfParser) -> list:
+        return [transaction async for transaction in parser.iter_transactions(b"")]
+
+    async def collect_all():
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            parser = AsyncPdfParser(2, executor)
+            return await asyncio.gather(*(collect(parser) for _ in range(4)))
+
+    results = asyncio.run(collect_all())
+
+    assert all(len(transactions) == 2 for transactions in results)
+    assert max(max_running) <= 2
+
+
+def test_parse_invalid_bytes():
+    async def parse():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return await AsyncPdfParser(1, executor).parse(b"not a pdf")
+
+    with pytest.raises(Exception):
+        asyncio.run(parse())
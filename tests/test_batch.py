@@ -0,0 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from pdf2csv.batch import batch_parse, find_input_files, process_file
+
+
+def test_find_input_files_from_directory(tmp_path):
+    (tmp_path / "2019").mkdir()
+    (tmp_path / "2019" / "eStatement-201908.pdf").write_bytes(b"")
+    (tmp_path / "eStatement-201907.PDF").write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("not a statement")
+
+    input_files = find_input_files([str(tmp_path)])
+
+    assert input_files == [
+        str(tmp_path / "2019" / "eStatement-201908.pdf"),
+        str(tmp_path / "eStatement-201907.PDF"),
+    ]
+
+
+def test_find_input_files_from_glob_without_duplicates(tmp_path):
+    (tmp_path / "a.pdf").write_bytes(b"")
+    (tmp_path / "b.pdf").write_bytes(b"")
+
+    input_files = find_input_files([str(tmp_path / "*.pdf"), str(tmp_path / "a.pdf")])
+
+    assert input_files == [str(tmp_path / "a.pdf"), str(tmp_path / "b.pdf")]
+
+
+def test_process_file_report_error(tmp_path):
+    input_file = tmp_path / "broken.pdf"
+    input_file.write_bytes(b"not a pdf")
+
+    result = process_file(str(input_file), "standard_chartered")
+
+    assert not result.ok
+    assert result.input_file == str(input_file)
+    assert result.statements == []
+
+
+def test_batch_parse_continue_after_failures(tmp_path):
+    input_files = []
+    for name in ["a.pdf", "b.pdf", "c.pdf"]:
+        (tmp_path / name).write_bytes(b"not a pdf")
+        input_files.append(str(tmp_path / name))
+
+    results = list(batch_parse(input_files, "standard_chartered", workers=2))
+
+    assert sorted(result.input_file for result in results) == input_files
+    assert all(not result.ok for result in results)
+
+
+def test_batch_parse_submit_bounded_window(tmp_path, mocker):
+    mocker.patch("pdf2csv.batch.ProcessPoolExecutor", ThreadPoolExecutor)
+    pulled = []
+
+    def input_files():
+        for index in range(20):
+            pulled.append(index)
+            (tmp_path / f"{index}.pdf").write_bytes(b"not a pdf")
+            yield str(tmp_path / f"{index}.pdf")
+
+    results = batch_parse(input_files(), "standard_chartered", workers=2)
+    next(results)
+
+    assert len(pulled) == 4
+    assert len(list(results)) == 19
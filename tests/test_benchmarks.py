@@ -0,0 +1,71 @@
+import importlib
+import sys
+
+import pytest
+from benchmarks.run import find_regressions
+from benchmarks.synthetic import (
+    SyntheticStatement,
+    generate_pages,
+    generate_rows,
+    render_pdf,
+)
+from pdf2csv.pdf_extractor import extract_pdf_rows, parse_pdf
+
+
+def test_synthetic_pdf_matches_rows():
+    config = SyntheticStatement(pages=3, rows_per_page=20)
+    rows = generate_rows(config)
+    pdf = render_pdf(generate_pages(config))
+
+    expected = parse_pdf(rows, "standard_chartered")
+    assert len(expected) == config.accounts * len(config.currencies)
+    assert parse_pdf(extract_pdf_rows(pdf), "standard_chartered") == expected
+
+
+def test_synthetic_rows_are_deterministic():
+    config = SyntheticStatement(pages=2, rows_per_page=10, seed=7)
+    assert list(generate_rows(config)) == list(generate_rows(config))
+
+
+def test_find_regressions():
+    baseline = {"state_machine_rows_per_sec": 1000.0, "parse_peak_rss_mb": 100.0}
+
+    assert (
+        find_regressions(
+            {"state_machine_rows_per_sec": 900.0, "parse_peak_rss_mb": 110.0},
+            baseline,
+            0.25,
+        )
+        == []
+    )
+    assert (
+        len(
+            find_regressions(
+                {"state_machine_rows_per_sec": 500.0, "parse_peak_rss_mb": 200.0},
+                baseline,
+                0.25,
+            )
+        )
+        == 2
+    )
+
+
+@pytest.mark.parametrize(
+    ["module", "args"],
+    [
+        ("benchmarks.bench_amounts", ["--tokens", "100", "--repeat", "1"]),
+        ("benchmarks.bench_csv_writer", ["--rows", "100", "--repeat", "1"]),
+        ("benchmarks.bench_descriptions", ["--rows", "10", "--lines", "1", "5"]),
+        ("benchmarks.bench_engine", ["--rows", "100", "--repeat", "1"]),
+        ("benchmarks.bench_memory", ["--rows", "100"]),
+        ("benchmarks.bench_page_filter", ["--pages", "2", "--boilerplate-pages", "1"]),
+        ("benchmarks.bench_row_classifier", ["--rows", "100", "--repeat", "1"]),
+        ("benchmarks.run", ["--rows", "100", "--pages", "2", "--rss-pages", "2"]),
+    ],
+)
+def test_benchmark_entry_points(module: str, args: list[str], monkeypatch, tmp_path):
+    baseline = ["--baseline", str(tmp_path / "missing.json")]
+    argv = args + baseline if module == "benchmarks.run" else args
+    monkeypatch.setattr(sys, "argv", [module, *argv])
+
+    importlib.import_module(module).main()
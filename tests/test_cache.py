@@ -0,0 +1,81 @@
+import os
+
+from pdf2csv import pdf_extractor
+from pdf2csv.cache import PageCache
+from pdf2csv.pdf_extractor import extract_pdf_rows
+
+PAGES = [["Statement Date : 17 Aug 2020", "John Doe"], ["17 Aug CLOSING BALANCE 1.00"]]
+
+
+def make_pdf(tmp_path, content: bytes = b"%PDF-1.4 statement"):
+    input_file = tmp_path / "statement.pdf"
+    input_file.write_bytes(content)
+    return str(input_file)
+
+
+def test_get_missing_entry(tmp_path):
+    cache = PageCache(str(tmp_path / "cache"))
+    assert cache.get("missing") is None
+
+
+def test_set_and_get_pages(tmp_path):
+    cache = PageCache(str(tmp_path / "cache"))
+    key = cache.get_key(make_pdf(tmp_path), {"x_tolerance": 3})
+
+    cache.set(key, PAGES)
+
+    assert cache.get(key) == PAGES
+
+
+def test_key_depends_on_content_and_settings(tmp_path):
+    cache = PageCache(str(tmp_path / "cache"))
+    input_file = make_pdf(tmp_path)
+    key = cache.get_key(input_file, {"x_tolerance": 3})
+
+    assert key == cache.get_key(input_file, {"x_tolerance": 3})
+    assert key != cache.get_key(input_file, {"x_tolerance": 2})
+    assert key != cache.get_key(make_pdf(tmp_path, b"%PDF-1.4 other"), {})
+
+
+def test_evict_least_recently_used(tmp_path):
+    cache = PageCache(str(tmp_path / "cache"))
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.set(key, PAGES)
+        os.utime(cache.get_path(key), (index, index))
+    cache.get("a")
+    entry_size = os.path.getsize(cache.get_path("a"))
+
+    cache.max_size = entry_size * 2
+    cache.evict()
+
+    assert cache.get("a") == PAGES
+    assert cache.get("b") is None
+    assert cache.get("c") == PAGES
+
+
+def test_stats_and_clear(tmp_path):
+    cache = PageCache(str(tmp_path / "cache"))
+    cache.set("a", PAGES)
+    cache.set("b", PAGES)
+
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.size > 0
+
+    assert cache.clear() == 2
+    assert cache.stats().entries == 0
+
+
+def test_extract_pdf_rows_use_cache(tmp_path, mocker):
+    cache = PageCache(str(tmp_path / "cache"))
+    input_file = make_pdf(tmp_path)
+    extract_pages = mocker.patch.object(
+        pdf_extractor, "extract_pages", return_value=iter(PAGES)
+    )
+
+    first_rows = list(extract_pdf_rows(input_file, cache=cache))
+    second_rows = list(extract_pdf_rows(input_file, cache=cache))
+
+    assert first_rows == [row for page in PAGES for row in page]
+    assert second_rows == first_rows
+    extract_pages.assert_called_once_with(input_file, 1, False, None)
@@ -0,0 +1,83 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from benchmarks.pdf_builder import render_pdf
+from pdf2csv.columnar import TransactionTableWriter, read_transactions, to_decimal
+from pdf2csv.console.application import app
+from pdf2csv.pdf_extractor import parse_pdf
+from tests.test_pdf_extractor import ROWS, SECOND_ACCOUNT_ROWS
+from typer.testing import CliRunner
+
+pa = pytest.importorskip("pyarrow")
+
+
+def test_to_decimal():
+    assert to_decimal(200000.0) == Decimal("200000.00")
+    assert to_decimal(0.1 + 0.2) == Decimal("0.30")
+    assert to_decimal(Decimal("1.50")) == Decimal("1.50")
+    assert to_decimal(None) is None
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_write_and_read_transactions(tmp_path, file_format: str):
+    output_file = str(tmp_path / f"transactions.{file_format}")
+    statements = parse_pdf(ROWS + SECOND_ACCOUNT_ROWS, "standard_chartered")
+
+    with TransactionTableWriter(output_file, file_format, row_group_size=2) as writer:
+        writer.write_statements(statements)
+        writer.write_statements(statements)
+
+    table = read_transactions(output_file, file_format)
+    assert table.num_rows == 6
+    assert table.schema.field("transaction_date").type == pa.date32()
+    assert table.schema.field("balance").type == pa.decimal128(18, 2)
+    assert pa.types.is_dictionary(table.schema.field("ccy").type)
+    assert table.column("ccy").to_pylist() == ["USD", "HKD", "HKD"] * 2
+    assert table.to_pylist()[0]["transaction_date"] == date(2020, 7, 26)
+    assert table.to_pylist()[0]["withdrawal"] == Decimal("200000.00")
+
+
+def test_parquet_row_groups(tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    output_file = str(tmp_path / "transactions.parquet")
+    statements = parse_pdf(ROWS + SECOND_ACCOUNT_ROWS, "standard_chartered")
+
+    with TransactionTableWriter(output_file, row_group_size=2) as writer:
+        writer.write_statements(statements)
+
+    assert writer.rows_written == 3
+    assert parquet.ParquetFile(output_file).metadata.num_row_groups == 2
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        TransactionTableWriter(str(tmp_path / "transactions.orc"), "orc")
+
+
+def test_extract_columnar_default_output_file(tmp_path, monkeypatch):
+    input_file = tmp_path / "statement.pdf"
+    input_file.write_bytes(render_pdf([ROWS, SECOND_ACCOUNT_ROWS]))
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(
+        app, ["extract", str(input_file), "--output-format", "parquet"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert len(read_transactions("transactions.parquet")) == 3
+
+
+def test_extract_reject_columnar_template(tmp_path):
+    input_file = tmp_path / "statement.pdf"
+    input_file.write_bytes(render_pdf([ROWS]))
+    output_file = str(tmp_path / "{account_id}.parquet")
+
+    result = CliRunner().invoke(
+        app,
+        ["extract", str(input_file), "--output-format", "parquet"]
+        + ["--output-file", output_file],
+    )
+
+    assert result.exit_code != 0
+    assert "single parquet file" in result.output
@@ -0,0 +1,140 @@
+from decimal import Decimal
+
+import pytest
+from benchmarks.pdf_builder import render_pdf
+from pdf2csv.batch import process_file
+from pdf2csv.detect import DETECT_PAGE_COUNT, detect_document_type, resolve_pages
+from pdf2csv.parsers import registry as registry_module
+from pdf2csv.parsers.registry import ParserRegistry, registry
+from pdf2csv.parsers.standard_chartered.table import create_parser
+
+FIRST_PAGE = [
+    "Statement Date : 17 Aug 2020",
+    "My secret account  : 123−4−567890−1",
+    "John Doe",
+    "Date  Description  Deposit  Withdrawal  Balance",
+    "USD",
+    "17 Jul BALANCE FROM PREVIOUS STATEMENT 1,000,000.99",
+]
+LAST_PAGE = [
+    "26 Jul SCB ATM QR WDL 0108 0913   200,000.00 800,000.99",
+    "17 Aug CLOSING BALANCE 800,000.99",
+]
+
+
+class FakeEntryPoint:
+    def __init__(self, name: str, register):
+        self.name = name
+        self.register = register
+        self.loaded = 0
+
+    def load(self):
+        self.loaded += 1
+        return self.register
+
+
+def test_detect_standard_chartered():
+    assert detect_document_type(FIRST_PAGE) == "standard_chartered"
+
+
+def test_detect_unknown_document():
+    with pytest.raises(ValueError, match="Unable to detect document type"):
+        detect_document_type(["Invoice 42", "Total 10.00"])
+
+
+def test_resolve_pages_only_read_first_pages():
+    read = []
+
+    def pages():
+        for page in [FIRST_PAGE, ["Page 2"], ["Page 3"], LAST_PAGE]:
+            read.append(page)
+            yield page
+
+    document_type, resolved = resolve_pages(pages(), "auto")
+
+    assert document_type == "standard_chartered"
+    assert len(read) == DETECT_PAGE_COUNT
+    assert list(resolved) == [FIRST_PAGE, ["Page 2"], ["Page 3"], LAST_PAGE]
+
+
+def test_resolve_pages_keep_explicit_document_type():
+    document_type, resolved = resolve_pages([["Invoice 42"]], "standard_chartered")
+
+    assert document_type == "standard_chartered"
+    assert list(resolved) == [["Invoice 42"]]
+
+
+def test_load_parser_from_entry_point(mocker):
+    def register(parsers: ParserRegistry):
+        parsers.register("other_bank", create_parser, fingerprint=lambda rows: True)
+
+    entry_point = FakeEntryPoint("other_bank", register)
+    get_entry_points = mocker.patch.object(
+        registry_module, "get_entry_points", return_value=[entry_point]
+    )
+    parsers = ParserRegistry()
+
+    assert "other_bank" in parsers
+    assert "other_bank" in parsers
+    assert parsers.document_types == ["other_bank"]
+    assert detect_document_type(["Invoice 42"], parsers) == "other_bank"
+    assert entry_point.loaded == 1
+    get_entry_points.assert_called_once_with("pdf2csv.parsers")
+
+
+def test_entry_point_does_not_replace_registered_parser(mocker):
+    entry_point = FakeEntryPoint("standard_chartered", None)
+    mocker.patch.object(registry_module, "get_entry_points", return_value=[entry_point])
+    parsers = ParserRegistry()
+    parsers.register("standard_chartered", create_parser)
+
+    assert parsers.document_types == ["standard_chartered"]
+    assert entry_point.loaded == 0
+
+
+def test_report_broken_entry_point(mocker):
+    def broken(parsers: ParserRegistry):
+        raise ImportError("missing dependency")
+
+    def register(parsers: ParserRegistry):
+        parsers.register("other_bank", create_parser)
+
+    entry_points = [
+        FakeEntryPoint("broken_bank", broken),
+        FakeEntryPoint("other_bank", register),
+    ]
+    mocker.patch.object(registry_module, "get_entry_points", return_value=entry_points)
+    parsers = ParserRegistry()
+
+    with pytest.warns(RuntimeWarning, match="broken_bank: ImportError"):
+        assert parsers.document_types == ["other_bank"]
+
+    assert "unknown" not in parsers
+    assert entry_points[0].loaded == 1
+    assert parsers.plugin_errors == {"broken_bank": "ImportError: missing dependency"}
+
+
+def test_default_registry_has_fingerprint():
+    assert registry.get_fingerprint("standard_chartered") is not None
+
+
+def test_process_file_detect_document_type(tmp_path):
+    input_file = tmp_path / "statement.pdf"
+    input_file.write_bytes(render_pdf([FIRST_PAGE, LAST_PAGE]))
+
+    result = process_file(str(input_file), "auto")
+
+    assert result.ok
+    assert result.document_type == "standard_chartered"
+    assert [t.balance for t in result.statements[0].transactions] == [
+        Decimal("800000.99")
+    ]
+
+
+def test_process_file_report_undetected_document(tmp_path):
+    input_file = tmp_path / "invoice.pdf"
+    input_file.write_bytes(render_pdf([["Invoice 42"], ["Total 10.00"]]))
+
+    result = process_file(str(input_file), "auto")
+
+    assert result.error == "ValueError: Unable to detect document type"
@@ -0,0 +1,205 @@
+import os
+
+import pytest
+from benchmarks.pdf_builder import render_pdf
+from pdf2csv.console.application import app
+from pdf2csv.manifest import Manifest, find_pending_files, remove_stale_outputs
+from tests.test_pdf_extractor import ROWS
+from typer.testing import CliRunner
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    with Manifest(str(tmp_path / "manifest.sqlite")) as manifest:
+        yield manifest
+
+
+def make_pdf(tmp_path, content: bytes = b"%PDF-1.4 statement") -> str:
+    input_file = tmp_path / "statement.pdf"
+    input_file.write_bytes(content)
+    return str(input_file)
+
+
+def test_new_file_is_pending(tmp_path, manifest: Manifest):
+    input_file = make_pdf(tmp_path)
+
+    pending = manifest.check(input_file, "standard_chartered", "1")
+
+    assert pending.path == input_file
+    assert pending.previous_outputs == []
+
+
+def test_recorded_file_is_skipped(tmp_path, manifest: Manifest):
+    input_file = make_pdf(tmp_path)
+    pending = manifest.check(input_file, "standard_chartered", "1")
+
+    manifest.record(pending, "standard_chartered", "1", ["out.csv"])
+
+    assert manifest.check(input_file, "standard_chartered", "1") is None
+    assert manifest.get(input_file).outputs == ["out.csv"]
+
+
+def test_touched_file_with_same_content_is_skipped(
+    tmp_path, manifest: Manifest, mocker
+):
+    input_file = make_pdf(tmp_path)
+    manifest.record(
+        manifest.check(input_file, "standard_chartered", "1"),
+        "standard_chartered",
+        "1",
+        [],
+    )
+    os.utime(input_file, ns=(0, 0))
+    spy = mocker.spy(manifest, "_update_stat")
+
+    assert manifest.check(input_file, "standard_chartered", "1") is None
+    assert manifest.check(input_file, "standard_chartered", "1") is None
+    assert spy.call_count == 1
+    assert manifest.get(input_file).mtime_ns == 0
+
+
+def test_changed_file_or_parser_version_is_pending(tmp_path, manifest: Manifest):
+    input_file = make_pdf(tmp_path)
+    manifest.record(
+        manifest.check(input_file, "standard_chartered", "1"),
+        "standard_chartered",
+        "1",
+        ["out.csv"],
+    )
+
+    assert manifest.check(input_file, "standard_chartered", "2") is not None
+    assert manifest.check(input_file, "standard_chartered", "1", force=True)
+    make_pdf(tmp_path, b"%PDF-1.4 updated statement")
+    pending = manifest.check(input_file, "standard_chartered", "1")
+    assert pending.previous_outputs == ["out.csv"]
+
+
+def test_find_pending_files(tmp_path, manifest: Manifest):
+    input_file = make_pdf(tmp_path)
+    manifest.record(
+        manifest.check(input_file, "standard_chartered", "1"),
+        "standard_chartered",
+        "1",
+        [],
+    )
+    other_file = str(tmp_path / "other.pdf")
+    with open(other_file, "wb") as f:
+        f.write(b"%PDF-1.4 other")
+
+    missing_file = str(tmp_path / "missing.pdf")
+
+    pending_files, errors = find_pending_files(
+        manifest, [input_file, missing_file, other_file], "standard_chartered", "1"
+    )
+
+    assert [pending.path for pending in pending_files] == [other_file]
+    assert list(errors) == [missing_file]
+    assert errors[missing_file].startswith("FileNotFoundError")
+
+
+def test_find_owners(tmp_path, manifest: Manifest):
+    input_file = make_pdf(tmp_path)
+    pending = manifest.check(input_file, "standard_chartered", "1")
+    manifest.record(pending, "standard_chartered", "1", ["a.csv", "b.csv"])
+
+    assert [e.path for e in manifest.find_owners(["b.csv", "c.csv"])] == [input_file]
+    assert manifest.find_owners(["c.csv"]) == []
+
+
+def test_remove_stale_outputs(tmp_path):
+    kept = tmp_path / "kept.csv"
+    stale = tmp_path / "stale.csv"
+    kept.write_text("")
+    stale.write_text("")
+
+    remove_stale_outputs(
+        [str(kept), str(stale), str(tmp_path / "gone.csv")], [str(kept)]
+    )
+
+    assert kept.exists()
+    assert not stale.exists()
+
+
+def test_sync_command(tmp_path):
+    input_dir = tmp_path / "statements"
+    input_dir.mkdir()
+    (input_dir / "2020-08.pdf").write_bytes(render_pdf([ROWS]))
+    args = [
+        "sync",
+        str(input_dir),
+        "--manifest-file",
+        str(tmp_path / "manifest.sqlite"),
+        "--output-file",
+        str(tmp_path / "{account_id}_{ccy}_{statement_date}.csv"),
+        "--workers",
+        "1",
+    ]
+    runner = CliRunner()
+
+    first = runner.invoke(app, args)
+    second = runner.invoke(app, args)
+
+    assert first.exit_code == 0
+    assert "Processed 1 file(s), skipped 0 unchanged" in first.output
+    assert (tmp_path / "123−4−567890−1_USD_2020-08-17.csv").exists()
+    assert second.exit_code == 0
+    assert "Processed 0 file(s), skipped 1 unchanged" in second.output
+
+
+def test_sync_rerun_every_owner_of_shared_output(tmp_path):
+    input_dir = tmp_path / "statements"
+    input_dir.mkdir()
+    (input_dir / "a.pdf").write_bytes(render_pdf([ROWS]))
+    (input_dir / "b.pdf").write_bytes(render_pdf([ROWS[:6] + ROWS[7:]]))
+    args = [
+        "sync",
+        str(input_dir),
+        "--manifest-file",
+        str(tmp_path / "manifest.sqlite"),
+        "--output-file",
+        str(tmp_path / "{account_id}_{ccy}_{statement_date}.csv"),
+        "--workers",
+        "1",
+    ]
+    output_file = tmp_path / "123−4−567890−1_USD_2020-08-17.csv"
+    runner = CliRunner()
+
+    first = runner.invoke(app, args)
+    (input_dir / "b.pdf").write_bytes(
+        render_pdf([[ROWS[0].replace("Aug", "Sep"), *ROWS[1:]]])
+    )
+    second = runner.invoke(app, args)
+
+    assert first.exit_code == 0, first.output
+    assert second.exit_code == 0, second.output
+    assert "Processed 2 file(s), skipped 0 unchanged" in second.output
+    assert len(output_file.read_text().splitlines()) == 2
+    assert (tmp_path / "123−4−567890−1_USD_2020-09-17.csv").exists()
+
+
+def test_sync_continue_after_missing_owner(tmp_path):
+    input_dir = tmp_path / "statements"
+    input_dir.mkdir()
+    (input_dir / "a.pdf").write_bytes(render_pdf([ROWS]))
+    (input_dir / "b.pdf").write_bytes(render_pdf([ROWS]))
+    args = [
+        "sync",
+        str(input_dir),
+        "--manifest-file",
+        str(tmp_path / "manifest.sqlite"),
+        "--output-file",
+        str(tmp_path / "{account_id}_{ccy}_{statement_date}.csv"),
+        "--workers",
+        "1",
+    ]
+    runner = CliRunner()
+
+    runner.invoke(app, args)
+    (input_dir / "a.pdf").unlink()
+    (input_dir / "b.pdf").write_bytes(render_pdf([ROWS, ROWS[4:]]))
+    result = runner.invoke(app, args)
+
+    assert result.exit_code == 1
+    assert "a.pdf: FileNotFoundError" in result.output
+    assert "Processed 1 file(s), skipped 0 unchanged, 1 failed" in result.output
+    assert (tmp_path / "123−4−567890−1_USD_2020-08-17.csv").exists()
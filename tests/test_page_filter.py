@@ -0,0 +1,127 @@
+import pytest
+from benchmarks.pdf_builder import render_pdf
+from pdf2csv.console.application import app
+from pdf2csv.page_filter import (
+    PageFilter,
+    has_simple_fonts,
+    parse_page_numbers,
+    read_page_text,
+    unescape_literal,
+)
+from pdf2csv.parsers.registry import registry
+from pdf2csv.pdf_extractor import extract_pdf_rows, parse_pdf
+from pdf2csv.sources import open_pdf
+from pdfminer.psparser import LIT
+from tests.test_pdf_extractor import ROWS
+from typer.testing import CliRunner
+
+BOILERPLATE = ["Terms and conditions apply", "Please read them carefully"]
+
+
+@pytest.mark.parametrize(
+    ["pages", "expected"],
+    [("1", {1}), ("1,3", {1, 3}), ("2-4", {2, 3, 4}), ("1, 5-6", {1, 5, 6})],
+)
+def test_parse_page_numbers(pages: str, expected: set[int]):
+    assert parse_page_numbers(pages) == expected
+
+
+def test_read_page_text():
+    with open_pdf(render_pdf([["Statement Date : 17 Aug 2020"]])) as pdf_file:
+        assert read_page_text(pdf_file.pages[0]) == "StatementDate:17Aug2020"
+
+
+@pytest.mark.parametrize(
+    ["literal", "expected"],
+    [
+        (rb"Balance \(HKD\)", b"Balance (HKD)"),
+        (rb"C:\\statements", rb"C:\statements"),
+        (rb"1\0562\56", b"1.2."),
+        (b"BAL\\\nANCE", b"BALANCE"),
+        (rb"a\tb\nc\x", b"a\tb\ncx"),
+    ],
+)
+def test_unescape_literal(literal: bytes, expected: bytes):
+    assert unescape_literal(literal) == expected
+
+
+def test_read_page_text_unescape_strings():
+    with open_pdf(render_pdf([["Balance (HKD) 1.00"]])) as pdf_file:
+        assert read_page_text(pdf_file.pages[0]) == "Balance(HKD)1.00"
+
+
+@pytest.mark.parametrize(
+    "content", [b"BT (\\000\\003\\004) Tj ET", b"BT (\x01\x02) Tj ET"]
+)
+def test_read_page_text_control_characters(mocker, content: bytes):
+    with open_pdf(render_pdf([BOILERPLATE])) as pdf_file:
+        page = pdf_file.pages[0]
+        mocker.patch("pdf2csv.page_filter.read_page_content", return_value=content)
+
+        assert read_page_text(page) is None
+
+
+@pytest.mark.parametrize(
+    ["font", "expected"],
+    [
+        ({"Subtype": LIT("TrueType")}, True),
+        ({"Subtype": LIT("TrueType"), "ToUnicode": None}, False),
+        ({"Subtype": LIT("Type0")}, False),
+        ({"Subtype": LIT("Type3")}, False),
+    ],
+)
+def test_has_simple_fonts(mocker, font: dict, expected: bool):
+    page = mocker.Mock()
+    page.page_obj.resources = {"Font": {"F1": font}}
+
+    assert has_simple_fonts(page) is expected
+
+
+def test_read_page_text_unknown_encoding(mocker):
+    with open_pdf(render_pdf([BOILERPLATE])) as pdf_file:
+        page = pdf_file.pages[0]
+        mocker.patch(
+            "pdf2csv.page_filter.read_page_content",
+            return_value=b"BT <0036004500570044> Tj ET",
+        )
+
+        assert read_page_text(page) is None
+        assert registry.get_page_filter("standard_chartered")(page)
+
+
+def test_page_filter_skip_boilerplate_pages():
+    page_filter = registry.get_page_filter("standard_chartered")
+
+    with open_pdf(render_pdf([ROWS, BOILERPLATE])) as pdf_file:
+        assert [page_filter(page) for page in pdf_file.pages] == [True, False]
+
+
+def test_page_filter_select_page_numbers():
+    page_filter = PageFilter(page_numbers=frozenset({2}))
+
+    with open_pdf(render_pdf([ROWS, BOILERPLATE])) as pdf_file:
+        assert [page_filter(page) for page in pdf_file.pages] == [False, True]
+
+
+def test_extract_pdf_rows_skip_pages():
+    pdf = render_pdf([BOILERPLATE, ROWS, BOILERPLATE])
+    page_filter = registry.get_page_filter("standard_chartered")
+
+    rows = list(extract_pdf_rows(pdf, page_filter=page_filter))
+
+    assert rows == ROWS
+    assert parse_pdf(rows, "standard_chartered") == parse_pdf(
+        extract_pdf_rows(pdf), "standard_chartered"
+    )
+
+
+def test_reject_skip_pages_with_auto_detection(tmp_path):
+    input_file = tmp_path / "statement.pdf"
+    input_file.write_bytes(render_pdf([ROWS]))
+
+    result = CliRunner().invoke(
+        app, ["extract", str(input_file), "--file-format", "auto", "--skip-pages"]
+    )
+
+    assert result.exit_code == 2
+    assert "--skip-pages requires an explicit --file-format" in result.output
@@ -0,0 +1,223 @@
+import pickle
+
+import pytest
+from benchmarks.pdf_builder import render_pdf
+from benchmarks.synthetic import SyntheticStatement, generate_pages, generate_rows
+from pdf2csv.model import Row
+from pdf2csv.pdf_extractor import (
+    extract_pdf_rows,
+    format_table,
+    get_page_chunks,
+    iter_statements,
+    iter_transactions,
+    parse_pdf,
+)
+
+ROWS = [
+    "Statement Date : 17 Aug 2020",
+    "My secret account  : 123−4−567890−1",
+    "John Doe",
+    "Date  Description  Deposit  Withdrawal  Balance",
+    "USD",
+    "17 Jul BALANCE FROM PREVIOUS STATEMENT 1,000,000.99",
+    "26 Jul SCB ATM QR WDL 0108 0913   200,000.00 800,000.99",
+    "17 Aug CLOSING BALANCE 800,000.99",
+]
+
+SECOND_ACCOUNT_ROWS = [
+    "My savings account  : 987−6−543210−1",
+    "John Doe",
+    "Date  Description  Deposit  Withdrawal  Balance",
+    "HKD",
+    "17 Jul BALANCE FROM PREVIOUS STATEMENT 100.00",
+    "20 Jul INTEREST 1.00   101.00",
+    "21 Jul INTEREST 1.00   102.00",
+    "17 Aug CLOSING BALANCE 102.00",
+]
+
+
+def rows_then_fail(rows: list[str]):
+    yield from rows
+    raise AssertionError("Rows consumed past the closing balance")
+
+
+def test_parse_pdf():
+    statements = parse_pdf(iter(ROWS), "standard_chartered")
+
+    assert len(statements) == 1
+    assert statements[0].ccy == "USD"
+    assert statements[0].account_id == "123−4−567890−1"
+    assert len(statements[0].transactions) == 1
+
+
+def test_transactions_are_compact():
+    transaction = parse_pdf(iter(ROWS), "standard_chartered")[0].transactions[0]
+
+    assert not hasattr(transaction, "__dict__")
+    assert pickle.loads(pickle.dumps(transaction)) == transaction
+
+
+def test_format_table():
+    statements = parse_pdf(iter(ROWS), "standard_chartered")
+
+    table = format_table(statements[0].transactions)
+
+    assert "SCB ATM QR WDL 0108 0913" in table
+    assert "200000.00" in table
+    assert "account_id" not in table
+
+
+def test_parse_pdf_does_not_share_statements_between_calls():
+    first = parse_pdf(iter(ROWS), "standard_chartered")
+    second = parse_pdf(iter(ROWS), "standard_chartered")
+
+    assert len(first) == 1
+    assert len(second) == 1
+    assert first is not second
+
+
+def test_iter_statements_yield_on_closing_balance():
+    statements = iter_statements(rows_then_fail(ROWS), "standard_chartered")
+
+    statement = next(statements)
+
+    assert statement.account_id == "123−4−567890−1"
+    assert len(statement.transactions) == 1
+
+
+def test_iter_statements_yield_each_account():
+    statements = list(
+        iter_statements(iter(ROWS + SECOND_ACCOUNT_ROWS), "standard_chartered")
+    )
+
+    assert [statement.ccy for statement in statements] == ["USD", "HKD"]
+    assert [len(statement.transactions) for statement in statements] == [1, 2]
+
+
+def test_iter_transactions_yield_when_committed():
+    rows = ROWS + SECOND_ACCOUNT_ROWS[:-1]
+    transactions = iter_transactions(rows_then_fail(rows), "standard_chartered")
+
+    first = next(transactions)
+    second = next(transactions)
+
+    assert first.account_id == "123−4−567890−1"
+    assert second.ccy == "HKD"
+    assert second.description == "INTEREST"
+
+
+def test_iter_transactions_match_parse_pdf():
+    rows = ROWS + SECOND_ACCOUNT_ROWS
+    transactions = list(iter_transactions(iter(rows), "standard_chartered"))
+    statements = parse_pdf(iter(rows), "standard_chartered")
+
+    assert transactions == [
+        transaction
+        for statement in statements
+        for transaction in statement.transactions
+    ]
+
+
+@pytest.mark.parametrize(
+    "page_count,workers,expected_chunks",
+    [
+        (3, 4, [[1], [2], [3]]),
+        (8, 1, [[1, 2], [3, 4], [5, 6], [7, 8]]),
+        (10, 2, [[1, 2], [3, 4], [5, 6], [7, 8], [9, 10]]),
+        (0, 2, []),
+    ],
+)
+def test_get_page_chunks(page_count: int, workers: int, expected_chunks):
+    assert get_page_chunks(page_count, workers) == expected_chunks
+
+
+def test_get_page_chunks_keep_page_order():
+    chunks = get_page_chunks(211, 8)
+    assert [page for chunk in chunks for page in chunk] == list(range(1, 212))
+
+
+HEADER = "Date  Description" + " " * 24 + "Deposit" + " " * 8 + "Withdrawal" + " " * 8
+HEADER += "Balance"
+
+
+def layout_row(description: str, deposit: str, withdrawal: str, balance: str) -> str:
+    row = description.ljust(HEADER.index("Deposit"))
+    row = row + deposit.rjust(HEADER.index("Deposit") + len("Deposit") - len(row))
+    row = row + withdrawal.rjust(HEADER.index("Withdrawal") + 10 - len(row))
+    return row + balance.rjust(len(HEADER) - len(row))
+
+
+def test_word_rows_match_text_rows():
+    pdf = render_pdf([ROWS])
+
+    word_rows = list(extract_pdf_rows(pdf, words=True))
+
+    assert all(isinstance(row, Row) for row in word_rows)
+    assert word_rows == [row.split(" ") for row in extract_pdf_rows(pdf)]
+    assert all(len(row.x0) == len(row) for row in word_rows)
+
+
+def test_word_rows_identify_amount_columns_by_position():
+    pdf = render_pdf(
+        [
+            ROWS[:3]
+            + [HEADER, "USD"]
+            + [
+                layout_row("17 Jul BALANCE FROM PREVIOUS STATEMENT", "", "", "100.00"),
+                layout_row("20 Jul SALARY 0108", "1,000.00", "", "1,100.00"),
+                layout_row("21 Jul ATM WITHDRAWAL 0913", "", "50.00", "1,050.00"),
+                layout_row("22 Jul CLOSING BALANCE", "", "", "1,050.00"),
+            ]
+        ]
+    )
+
+    statements = parse_pdf(extract_pdf_rows(pdf, words=True), "standard_chartered")
+
+    transactions = statements[0].transactions
+    assert [t.description for t in transactions] == [
+        "SALARY 0108",
+        "ATM WITHDRAWAL 0913",
+    ]
+    assert [(t.deposit, t.withdrawal) for t in transactions] == [(1000, 0), (0, 50)]
+    assert [t.balance for t in transactions] == [1100, 1050]
+
+
+def test_word_rows_parse_unaligned_synthetic_statement():
+    config = SyntheticStatement(pages=2)
+    pdf = render_pdf(generate_pages(config))
+
+    statements = parse_pdf(extract_pdf_rows(pdf, words=True), "standard_chartered")
+
+    expected = parse_pdf(generate_rows(config), "standard_chartered")
+    assert [len(s.transactions) for s in statements] == [
+        len(s.transactions) for s in expected
+    ]
+    assert [t.balance for s in statements for t in s.transactions] == [
+        t.balance for s in expected for t in s.transactions
+    ]
+
+
+def test_word_rows_keep_amount_columns_across_currencies():
+    pdf = render_pdf(
+        [
+            ROWS[:3]
+            + [HEADER, "USD"]
+            + [
+                layout_row("17 Jul BALANCE FROM PREVIOUS STATEMENT", "", "", "100.00"),
+                layout_row("20 Jul SALARY 0108", "1,000.00", "", "1,100.00"),
+                layout_row("22 Jul CLOSING BALANCE", "", "", "1,100.00"),
+                "HKD",
+                layout_row("17 Jul BALANCE FROM PREVIOUS STATEMENT", "", "", "500.00"),
+                layout_row("21 Jul ATM WITHDRAWAL 0913", "", "50.00", "450.00"),
+                layout_row("22 Jul CLOSING BALANCE", "", "", "450.00"),
+            ]
+        ]
+    )
+
+    statements = parse_pdf(extract_pdf_rows(pdf, words=True), "standard_chartered")
+
+    assert [s.ccy for s in statements] == ["USD", "HKD"]
+    transaction = statements[1].transactions[0]
+    assert transaction.description == "ATM WITHDRAWAL 0913"
+    assert (transaction.deposit, transaction.withdrawal) == (0, 50)
+    assert transaction.balance == 450
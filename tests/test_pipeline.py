@@ -0,0 +1,106 @@
+import time
+
+import pytest
+from benchmarks.pdf_builder import render_pdf
+from pdf2csv.console.application import app
+from pdf2csv.pdf_extractor import parse_pdf
+from pdf2csv.pipeline import Pipeline, run_pipeline
+from pdf2csv.profiling import Profiler
+from tests.test_pdf_extractor import ROWS, SECOND_ACCOUNT_ROWS
+from typer.testing import CliRunner
+
+PAGES = [ROWS, SECOND_ACCOUNT_ROWS]
+
+
+def test_run_pipeline_match_parse_pdf():
+    statements = []
+
+    run_pipeline(PAGES, "standard_chartered", statements.append)
+
+    assert statements == parse_pdf(ROWS + SECOND_ACCOUNT_ROWS, "standard_chartered")
+
+
+def test_run_pipeline_apply_backpressure():
+    produced = []
+
+    def pages():
+        for _ in range(10):
+            produced.append(None)
+            yield PAGES[0]
+
+    def slow_write(statement):
+        time.sleep(0.01)
+
+    pipeline = run_pipeline(pages(), "standard_chartered", slow_write, queue_size=1)
+
+    page_queue, statement_queue = pipeline.queues
+    assert len(produced) == 10
+    assert page_queue.items == 10
+    assert page_queue.max_depth <= 1
+    assert statement_queue.items == 10
+    assert statement_queue.max_depth <= 1
+    assert page_queue.put_wait > 0
+
+
+def test_run_pipeline_raise_extraction_error():
+    def pages():
+        yield ROWS
+        raise RuntimeError("broken page")
+
+    with pytest.raises(RuntimeError, match="broken page"):
+        run_pipeline(pages(), "standard_chartered", lambda statement: None)
+
+
+def test_run_pipeline_stop_producers_on_writer_error():
+    closed = []
+
+    def pages():
+        try:
+            while True:
+                yield ROWS
+        finally:
+            closed.append(True)
+
+    def failing_write(statement):
+        raise OSError("disk full")
+
+    with pytest.raises(OSError, match="disk full"):
+        run_pipeline(pages(), "standard_chartered", failing_write, queue_size=2)
+
+    assert closed == [True]
+
+
+def test_pipeline_report_queue_stats():
+    profiler = Profiler()
+
+    run_pipeline(PAGES, "standard_chartered", lambda s: None, profiler=profiler)
+
+    queues = profiler.to_dict()["queues"]
+    assert queues["pages"]["items"] == 2
+    assert queues["statements"]["items"] == 2
+    assert 'pdf2csv_queue_max_depth{queue="pages"}' in profiler.to_prometheus()
+    assert "Queues:" in profiler.format_summary()
+
+
+def test_pipeline_without_stages():
+    pipeline = Pipeline()
+
+    pipeline.join()
+
+    assert pipeline.to_dict() == {}
+
+
+def test_extract_command_with_pipeline(tmp_path):
+    input_file = tmp_path / "statement.pdf"
+    input_file.write_bytes(render_pdf(PAGES))
+    runner = CliRunner()
+    outputs = []
+    for flags in [[], ["--pipeline", "--queue-size", "1"]]:
+        output_file = tmp_path / f"{len(outputs)}.csv"
+        args = ["extract", str(input_file), "--output-file", str(output_file)]
+        result = runner.invoke(app, args + flags)
+        assert result.exit_code == 0, result.output
+        outputs.append(output_file.read_text())
+
+    assert outputs[0] == outputs[1]
+    assert "800000.99" in outputs[1]
@@ -0,0 +1,84 @@
+import json
+
+from benchmarks.pdf_builder import render_pdf
+from pdf2csv.console.application import app
+from pdf2csv.pdf_extractor import extract_pdf_rows, parse_pdf
+from pdf2csv.profiling import Profiler, profile_stage
+from tests.test_pdf_extractor import ROWS, SECOND_ACCOUNT_ROWS
+from typer.testing import CliRunner
+
+
+def test_profile_parse_pdf():
+    profiler = Profiler()
+    pdf = render_pdf([ROWS, SECOND_ACCOUNT_ROWS])
+
+    statements = parse_pdf(
+        extract_pdf_rows(pdf, profiler=profiler), "standard_chartered", profiler
+    )
+
+    assert statements == parse_pdf(extract_pdf_rows(pdf), "standard_chartered")
+    assert len(profiler.page_times) == 2
+    assert set(profiler.stage_times) == {"extract", "parse"}
+    assert sum(profiler.state_rows.values()) == len(ROWS) + len(SECOND_ACCOUNT_ROWS)
+    assert (
+        profiler.transitions["StateProcessTable", "StateSearchCcyOrAccountNumber"] == 2
+    )
+
+
+def test_hooks_receive_events():
+    profiler = Profiler()
+    events = []
+    profiler.add_hook(lambda event, fields: events.append((event, fields)))
+
+    parse_pdf(
+        extract_pdf_rows(render_pdf([ROWS]), profiler=profiler),
+        "standard_chartered",
+        profiler,
+    )
+    with profile_stage(profiler, "write"):
+        pass
+
+    assert [fields["page"] for event, fields in events if event == "page"] == [1]
+    assert (
+        "transition",
+        {"from_state": "StateStart", "to_state": "StateLookAccountNumber"},
+    ) in events
+    assert events[-1][0] == "stage"
+    assert events[-1][1]["stage"] == "write"
+
+
+def test_profile_stage_without_profiler():
+    with profile_stage(None, "write"):
+        pass
+
+
+def test_export_formats():
+    profiler = Profiler()
+    parse_pdf(ROWS, "standard_chartered", profiler)
+
+    assert profiler.to_dict()["state_rows"]["StateStart"] == 1
+    assert 'pdf2csv_state_rows_total{state="StateStart"} 1' in profiler.to_prometheus()
+    assert "StateStart -> " in profiler.format_summary()
+
+
+def test_extract_command_profile_write_stage(tmp_path):
+    input_file = tmp_path / "statement.pdf"
+    input_file.write_bytes(render_pdf([ROWS, SECOND_ACCOUNT_ROWS]))
+    profile_file = tmp_path / "profile.json"
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "extract",
+            str(input_file),
+            "--output-file",
+            str(tmp_path / "out.csv"),
+            "--profile",
+            "--profile-output",
+            str(profile_file),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    stages = json.loads(profile_file.read_text())["stages"]
+    assert set(stages) == {"extract", "parse", "write"}
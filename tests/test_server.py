@@ -0,0 +1,159 @@
+import csv
+import http.client
+import io
+import json
+import socket
+import threading
+
+import pytest
+from benchmarks.pdf_builder import render_pdf
+from pdf2csv.server import ParseService, ServerMetrics, create_server
+from tests.test_pdf_extractor import ROWS
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str):
+        super().__init__("localhost")
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+
+@pytest.fixture(scope="module")
+def service():
+    service = ParseService(workers=1, max_pending=4)
+    yield service
+    service.close()
+
+
+def serve(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+@pytest.fixture
+def connection(service):
+    server = create_server(service, port=0)
+    serve(server)
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+    yield connection
+    connection.close()
+    server.shutdown()
+    server.server_close()
+
+
+def request(connection, method: str, path: str, body: bytes = None):
+    connection.request(method, path, body)
+    response = connection.getresponse()
+    return response.status, response.read()
+
+
+def test_parse_json(connection):
+    status, body = request(connection, "POST", "/parse", render_pdf([ROWS]))
+
+    assert status == 200
+    statements = json.loads(body)
+    assert statements[0]["account_id"] == "123−4−567890−1"
+    assert statements[0]["statement_date"] == "2020-08-17"
+    assert statements[0]["transactions"][0]["balance"] == "800000.99"
+
+
+def test_parse_csv(connection):
+    status, body = request(connection, "POST", "/parse?format=csv", render_pdf([ROWS]))
+
+    rows = list(csv.reader(io.StringIO(body.decode())))
+    assert status == 200
+    assert rows[0][0] == "transaction_date"
+    assert rows[1][-1] == "800000.99"
+
+
+def test_parse_arrow(connection):
+    pa = pytest.importorskip("pyarrow")
+
+    status, body = request(
+        connection, "POST", "/parse?format=arrow", render_pdf([ROWS])
+    )
+
+    assert status == 200
+    assert pa.ipc.open_stream(body).read_all().num_rows == 1
+
+
+@pytest.mark.parametrize(
+    ["path", "expected_status"],
+    [
+        ("/parse?format=xml", 400),
+        ("/parse?file_format=unknown", 400),
+        ("/unknown", 404),
+    ],
+)
+def test_invalid_requests(connection, path: str, expected_status: int):
+    status, body = request(connection, "POST", path, b"%PDF-1.4")
+
+    assert status == expected_status
+    assert "error" in json.loads(body)
+
+
+def test_invalid_pdf(connection):
+    status, body = request(connection, "POST", "/parse", b"not a pdf")
+
+    assert status == 422
+
+
+def test_reject_oversized_body(service, connection, monkeypatch):
+    monkeypatch.setattr(service, "max_body_size", 16)
+
+    status, body = request(connection, "POST", "/parse", b"%PDF-1.4" * 4)
+
+    assert status == 413
+    assert json.loads(body) == {"error": "Body exceeds 16 bytes"}
+
+
+def test_reject_when_full_without_reading_body(service, connection, mocker):
+    mocker.patch.object(service.metrics, "try_acquire", return_value=False)
+    connection.putrequest("POST", "/parse")
+    connection.putheader("Content-Length", "1000000")
+    connection.endheaders()
+    connection.sock.settimeout(5)
+
+    response = connection.getresponse()
+
+    assert response.status == 503
+
+
+def test_health_and_metrics(connection):
+    request(connection, "POST", "/parse", render_pdf([ROWS]))
+
+    assert request(connection, "GET", "/health") == (200, b"ok\n")
+    status, body = request(connection, "GET", "/metrics")
+    assert status == 200
+    assert 'pdf2csv_requests_total{status="200"}' in body.decode()
+    assert "pdf2csv_queue_depth 0" in body.decode()
+
+
+def test_unix_socket(service, tmp_path):
+    socket_path = str(tmp_path / "pdf2csv.sock")
+    server = create_server(service, unix_socket=socket_path)
+    serve(server)
+
+    connection = UnixHTTPConnection(socket_path)
+    status, _ = request(connection, "POST", "/parse", render_pdf([ROWS]))
+    connection.close()
+    server.shutdown()
+    server.server_close()
+
+    assert status == 200
+    assert not (tmp_path / "pdf2csv.sock").exists()
+
+
+def test_metrics_reject_when_full():
+    metrics = ServerMetrics(workers=1)
+
+    assert metrics.try_acquire(2)
+    assert metrics.try_acquire(2)
+    assert not metrics.try_acquire(2)
+    assert metrics.queue_depth == 1
+    metrics.release()
+    assert metrics.queue_depth == 0
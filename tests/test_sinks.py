@@ -0,0 +1,223 @@
+import csv
+import gzip
+import io
+import os
+import subprocess
+import sys
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from benchmarks.pdf_builder import render_pdf
+from pdf2csv.console.application import app
+from pdf2csv.model import Transaction
+from pdf2csv.pdf_extractor import parse_pdf
+from pdf2csv.sinks import (
+    DEFAULT_OUTPUT_FILE,
+    ONE_PER_ACCOUNT_OUTPUT_FILE,
+    TRANSACTION_FIELDS,
+    CsvPartitionSink,
+    TransactionFormatter,
+    get_compression,
+    get_output_file,
+    open_sink,
+)
+from tests.test_pdf_extractor import ROWS, SECOND_ACCOUNT_ROWS
+from typer.testing import CliRunner
+
+
+WRITE_COMMAND = """
+import sys
+from pdf2csv.pdf_extractor import parse_pdf
+from pdf2csv.sinks import CsvPartitionSink
+from tests.test_pdf_extractor import ROWS
+
+with CsvPartitionSink(sys.argv[1]) as sink:
+    sink.write_statements(parse_pdf(ROWS, "standard_chartered"))
+"""
+
+
+def read_csv(path) -> list[list[str]]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def get_statements():
+    return parse_pdf(ROWS + SECOND_ACCOUNT_ROWS, "standard_chartered")
+
+
+def test_get_output_file():
+    assert get_output_file(None, False) == DEFAULT_OUTPUT_FILE
+    assert get_output_file(None, True) == ONE_PER_ACCOUNT_OUTPUT_FILE
+    assert get_output_file("./{account_id}_{month}.csv", True)
+    with pytest.raises(ValueError):
+        get_output_file("./all.csv", True)
+
+
+def test_get_columnar_output_file():
+    assert get_output_file(None, False, "parquet") == "./transactions.parquet"
+    assert get_output_file("./all.arrow", False, "arrow") == "./all.arrow"
+    with pytest.raises(ValueError, match="single parquet file"):
+        get_output_file("./{account_id}.parquet", False, "parquet")
+    with pytest.raises(ValueError, match="one file per account"):
+        get_output_file("./{account_id}.parquet", True, "parquet")
+
+
+def test_write_one_file_per_statement(tmp_path):
+    output_file = str(tmp_path / "{account_id}_{ccy}_{statement_date}.csv")
+
+    with CsvPartitionSink(output_file) as sink:
+        sink.write_statements(get_statements())
+
+    assert len(sink.paths) == 2
+    rows = read_csv(tmp_path / "987−6−543210−1_HKD_2020-08-17.csv")
+    assert rows[0] == TRANSACTION_FIELDS
+    assert rows[1][:2] == ["2020-07-20", "2020-08-17"]
+    assert len(rows) == 3
+
+
+def test_write_single_file(tmp_path):
+    output_file = str(tmp_path / "all.csv")
+
+    with CsvPartitionSink(output_file) as sink:
+        sink.write_statements(get_statements())
+        sink.write_statements(get_statements())
+
+    rows = read_csv(output_file)
+    assert rows.count(TRANSACTION_FIELDS) == 1
+    assert len(rows) == 7
+
+
+def test_write_utf8_with_ascii_locale(tmp_path):
+    output_file = tmp_path / "all.csv"
+
+    subprocess.run(
+        [sys.executable, "-c", WRITE_COMMAND, str(output_file)],
+        check=True,
+        env={
+            **os.environ,
+            "LC_ALL": "C",
+            "PYTHONPATH": os.pathsep.join(sys.path),
+            "PYTHONUTF8": "0",
+        },
+    )
+
+    assert read_csv(output_file)[1][2] == "123−4−567890−1"
+
+
+def test_reopen_evicted_partition_appends(tmp_path):
+    output_file = str(tmp_path / "{account_id}_{month}.csv")
+    first, second = get_statements()
+
+    with CsvPartitionSink(output_file, max_open_files=1) as sink:
+        sink.write_statement(first)
+        sink.write_statement(second)
+        sink.write_statement(first)
+
+    rows = read_csv(tmp_path / "123−4−567890−1_2020-08.csv")
+    assert rows.count(TRANSACTION_FIELDS) == 1
+    assert len(rows) == 3
+
+
+def test_format_transaction_with_fixed_scale():
+    transaction = Transaction(
+        date(2020, 7, 26),
+        date(2020, 8, 17),
+        "123−4−567890−1",
+        "John Doe",
+        "USD",
+        "ATM",
+        Decimal("0"),
+        Decimal("200.5"),
+        Decimal("800000.99"),
+    )
+
+    assert TransactionFormatter()(transaction) == (
+        "2020-07-26",
+        "2020-08-17",
+        "123−4−567890−1",
+        "John Doe",
+        "USD",
+        "ATM",
+        "0.00",
+        "200.50",
+        "800000.99",
+    )
+
+
+@pytest.mark.parametrize(
+    ["output_file", "compression", "expected"],
+    [
+        ("./all.csv", None, None),
+        ("./all.csv.gz", None, "gzip"),
+        ("./{account_id}.csv.zst", None, "zstd"),
+        ("./all.csv.gz", "none", None),
+        ("-", "gzip", "gzip"),
+    ],
+)
+def test_get_compression(output_file, compression, expected):
+    assert get_compression(output_file, compression) == expected
+
+
+def test_reject_unknown_compression():
+    with pytest.raises(ValueError, match="Unknown compression: lz4"):
+        get_compression("./all.csv", "lz4")
+
+
+def test_write_gzip_partitions(tmp_path):
+    output_file = str(tmp_path / "{account_id}_{month}.csv.gz")
+    first, second = get_statements()
+
+    with CsvPartitionSink(output_file, max_open_files=1) as sink:
+        sink.write_statement(first)
+        sink.write_statement(second)
+        sink.write_statement(first)
+
+    with gzip.open(tmp_path / "123−4−567890−1_2020-08.csv.gz", "rt") as f:
+        rows = list(csv.reader(f))
+    assert rows.count(TRANSACTION_FIELDS) == 1
+    assert len(rows) == 3
+
+
+def test_write_zstd(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    output_file = tmp_path / "all.csv.zst"
+
+    with CsvPartitionSink(str(output_file), buffer_size=16) as sink:
+        sink.write_statements(get_statements())
+
+    with zstandard.open(output_file, "rt", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == TRANSACTION_FIELDS
+    assert len(rows) == 4
+
+
+def test_reject_columnar_output_to_stdout():
+    with pytest.raises(ValueError, match="Cannot write parquet output to stdout"):
+        open_sink("-", "parquet")
+
+
+def test_extract_to_stdout(tmp_path):
+    input_file = tmp_path / "statement.pdf"
+    input_file.write_bytes(render_pdf([ROWS, SECOND_ACCOUNT_ROWS]))
+
+    result = CliRunner().invoke(app, ["extract", str(input_file), "--output-file", "-"])
+
+    assert result.exit_code == 0, result.output
+    rows = list(csv.reader(io.StringIO(result.stdout)))
+    assert rows[0] == TRANSACTION_FIELDS
+    assert len(rows) == 4
+    assert rows[1][-1] == "800000.99"
+
+
+def test_extract_gzip_to_stdout(tmp_path):
+    input_file = tmp_path / "statement.pdf"
+    input_file.write_bytes(render_pdf([ROWS]))
+    args = ["extract", str(input_file), "--output-file", "-", "--compression", "gzip"]
+
+    result = CliRunner().invoke(app, args)
+
+    assert result.exit_code == 0, result.output
+    rows = list(csv.reader(io.StringIO(gzip.decompress(result.stdout_bytes).decode())))
+    assert rows[0] == TRANSACTION_FIELDS
+    assert len(rows) == 2
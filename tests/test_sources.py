@@ -0,0 +1,152 @@
+import io
+import mmap
+import tracemalloc
+
+import pytest
+from benchmarks.pdf_builder import render_pdf
+from pdf2csv.pdf_extractor import extract_pdf_rows
+from pdf2csv.sources import iter_pages, open_pdf, release_page, to_shared_source
+
+PAGES = [
+    ["Statement Date : 17 Aug 2020", "My secret account  : 123−4−567890−1"],
+    ["17 Aug CLOSING BALANCE 800,000.99"],
+]
+ROWS = [row for page in PAGES for row in page]
+LARGE_PAGE = [
+    f"26 Jul SCB ATM QR WDL 0108 0913   200,000.00 800,000.{index:02d}"
+    for index in range(20)
+]
+
+
+@pytest.fixture
+def pdf_bytes() -> bytes:
+    return render_pdf(PAGES)
+
+
+@pytest.fixture
+def pdf_path(tmp_path, pdf_bytes) -> str:
+    path = tmp_path / "statement.pdf"
+    path.write_bytes(pdf_bytes)
+    return str(path)
+
+
+def test_extract_from_path(pdf_path):
+    assert list(extract_pdf_rows(pdf_path)) == ROWS
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview, io.BytesIO])
+def test_extract_from_memory(pdf_bytes, wrap):
+    assert list(extract_pdf_rows(wrap(pdf_bytes))) == ROWS
+
+
+def test_extract_from_mmap(pdf_path):
+    with open(pdf_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            assert list(extract_pdf_rows(mapped)) == ROWS
+
+
+def test_extract_in_parallel_from_memory(pdf_bytes):
+    assert list(extract_pdf_rows(io.BytesIO(pdf_bytes), workers=2)) == ROWS
+
+
+@pytest.fixture
+def opened_files(mocker) -> list:
+    opened = []
+    builtin_open = open
+
+    def tracking_open(*args, **kwargs):
+        opened.append(builtin_open(*args, **kwargs))
+        return opened[-1]
+
+    mocker.patch("builtins.open", side_effect=tracking_open)
+    return opened
+
+
+def test_open_pdf_close_file_on_error(tmp_path, opened_files):
+    path = tmp_path / "broken.pdf"
+    path.write_bytes(b"not a pdf")
+
+    with pytest.raises(Exception):
+        with open_pdf(str(path)):
+            pass
+
+    assert len(opened_files) == 1
+    assert opened_files[0].closed
+
+
+def test_abandoned_iteration_close_file(pdf_path, opened_files):
+    rows = extract_pdf_rows(pdf_path)
+    next(rows)
+    assert not opened_files[0].closed
+
+    rows.close()
+
+    assert opened_files[0].closed
+
+
+@pytest.mark.parametrize("wrap", [bytearray, memoryview, io.BytesIO])
+def test_to_shared_source_return_bytes(pdf_bytes, wrap):
+    assert to_shared_source(wrap(pdf_bytes)) == pdf_bytes
+
+
+def test_iter_pages_release_previous_page(pdf_path):
+    with open_pdf(pdf_path) as pdf_file:
+        pages = iter_pages(pdf_file)
+        first = next(pages)
+        assert first.chars
+        assert hasattr(first, "_layout")
+
+        second = next(pages)
+
+        assert not hasattr(first, "_layout")
+        assert not hasattr(first, "_objects")
+        assert second.page_number == 2
+        assert second.initial_doctop == first.height
+
+
+def test_release_page_evict_content_streams(pdf_path):
+    with open_pdf(pdf_path) as pdf_file:
+        page = pdf_file.pages[0]
+        assert page.chars
+        objids = [content.objid for content in page.page_obj.contents]
+        assert all(objid in pdf_file.doc._cached_objs for objid in objids)
+
+        release_page(pdf_file, page)
+
+        assert not any(objid in pdf_file.doc._cached_objs for objid in objids)
+
+
+def test_release_page_without_document_cache(pdf_path):
+    with open_pdf(pdf_path) as pdf_file:
+        page = pdf_file.pages[0]
+        assert page.chars
+        del pdf_file.doc._cached_objs
+
+        release_page(pdf_file, page)
+
+        assert not hasattr(page, "_layout")
+
+
+def test_iter_pages_only_selected_pages(pdf_path):
+    with open_pdf(pdf_path, pages=[2]) as pdf_file:
+        assert [page.page_number for page in iter_pages(pdf_file)] == [2]
+
+
+def measure_peak_memory(tmp_path, page_count: int) -> int:
+    path = tmp_path / f"statement-{page_count}.pdf"
+    path.write_bytes(render_pdf([LARGE_PAGE] * page_count))
+
+    tracemalloc.start()
+    try:
+        for _ in extract_pdf_rows(str(path)):
+            pass
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_peak_memory_does_not_grow_with_page_count(tmp_path):
+    small = measure_peak_memory(tmp_path, 4)
+    large = measure_peak_memory(tmp_path, 16)
+
+    assert large < small * 1.5
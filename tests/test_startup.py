@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+HEAVY_MODULES = [
+    "concurrent.futures.process",
+    "dataclass_csv",
+    "pdfminer",
+    "pdfplumber",
+    "PIL",
+    "prettytable",
+    "pyarrow",
+]
+STARTUP_BUDGET = 1.0
+RUN_COMMAND = """
+import sys
+from pdf2csv.console.application import app
+try:
+    app(sys.argv[1:])
+except SystemExit:
+    pass
+print(",".join(name for name in {heavy_modules} if name in sys.modules))
+""".format(
+    heavy_modules=HEAVY_MODULES
+)
+
+
+def run_cli(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", RUN_COMMAND, *args],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+
+
+@pytest.mark.parametrize("args", [["version"], ["--help"], ["extract", "--help"]])
+def test_cli_does_not_import_heavy_modules(args: list[str]):
+    result = run_cli(*args)
+
+    assert result.stdout.splitlines()[-1] == ""
+
+
+def test_cli_startup_budget():
+    elapsed = []
+    for _ in range(3):
+        start = time.perf_counter()
+        run_cli("version")
+        elapsed.append(time.perf_counter() - start)
+
+    assert min(elapsed) < STARTUP_BUDGET